@@ -6,10 +6,6 @@
 """
 
 import sys
-import os
-
-# 添加项目根目录到Python路径
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.app import create_app, db
 from src.utils.database import init_database
@@ -7,15 +7,85 @@
 
 import sys
 import os
+import fnmatch
+import subprocess
 import unittest
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List
 
 
+# 复用同一个加载器，避免每次发现测试都重新创建
+_LOADER = unittest.TestLoader()
+
+
+def _iter_tests(suite: unittest.TestSuite):
+    """逐个展开嵌套测试套件中的测试用例"""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+def _tests_mtime_ns(start_dir: str, test_pattern: str) -> int:
+    """
+    计算测试目录及其中匹配的测试文件的最新修改时间
+    
+    目录的修改时间只在增删、重命名文件时变化，原地编辑测试文件不会改变它，
+    因此同时取各测试文件自身的修改时间。
+    
+    Args:
+        start_dir: 测试目录
+        test_pattern: 测试文件匹配模式
+        
+    Returns:
+        int: 最新的修改时间（纳秒）
+    """
+    latest = 0
+    for dirpath, _, filenames in os.walk(start_dir):
+        latest = max(latest, os.stat(dirpath).st_mtime_ns)
+        for name in fnmatch.filter(filenames, test_pattern):
+            latest = max(latest, os.stat(os.path.join(dirpath, name)).st_mtime_ns)
+    return latest
+
+
+@lru_cache(maxsize=4)
+def _discover_cached(start_dir: str, test_pattern: str, top_level_dir: str,
+                     tests_mtime_ns: int) -> tuple:
+    """
+    按 (匹配模式, 测试文件最新修改时间) 缓存测试发现结果
+    
+    TestSuite 运行后会释放其中的用例，因此缓存展开后的用例元组，
+    由调用方每次包装成新的套件。缓存未命中时先移除已导入的测试模块，
+    保证重新发现时加载的是修改后的文件。
+    
+    Args:
+        start_dir: 测试目录
+        test_pattern: 测试文件匹配模式
+        top_level_dir: 项目根目录
+        tests_mtime_ns: 测试文件最新修改时间（纳秒），仅作为缓存键
+        
+    Returns:
+        tuple: 发现的测试用例
+    """
+    tests_prefix = os.path.join(start_dir, "")
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and os.path.abspath(module_file).startswith(tests_prefix):
+            del sys.modules[name]
+    
+    suite = _LOADER.discover(start_dir, pattern=test_pattern, top_level_dir=top_level_dir)
+    return tuple(_iter_tests(suite))
+
+
 def discover_tests(test_pattern: str = "test_*.py") -> unittest.TestSuite:
     """
     发现并加载测试用例
     
+    同一模式在测试文件未变化（未增删、未编辑）时直接复用上一次的发现结果。
+    
     Args:
         test_pattern: 测试文件匹配模式
         
@@ -26,18 +96,20 @@ def discover_tests(test_pattern: str = "test_*.py") -> unittest.TestSuite:
     project_root = os.path.dirname(os.path.abspath(__file__))
     
     # 添加项目根目录到Python路径
-    sys.path.insert(0, project_root)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
     
     # 发现测试
-    loader = unittest.TestLoader()
     start_dir = os.path.join(project_root, "tests")
     
     if not os.path.exists(start_dir):
         print(f"测试目录不存在: {start_dir}")
         return unittest.TestSuite()
     
-    suite = loader.discover(start_dir, pattern=test_pattern, top_level_dir=project_root)
-    return suite
+    tests = _discover_cached(
+        start_dir, test_pattern, project_root, _tests_mtime_ns(start_dir, test_pattern)
+    )
+    return unittest.TestSuite(tests)
 
 
 def run_tests(test_pattern: str = "test_*.py", verbosity: int = 2) -> bool:
@@ -65,6 +137,76 @@ def run_tests(test_pattern: str = "test_*.py", verbosity: int = 2) -> bool:
     return result.wasSuccessful()
 
 
+def run_tests_parallel(test_pattern: str = "test_*.py", verbosity: int = 2, jobs: int = 0) -> bool:
+    """
+    并行运行测试
+    
+    已安装 pytest-xdist 时交由 pytest 分发到多个进程；否则按测试模块
+    启动独立的 unittest 子进程并发执行。
+    
+    Args:
+        test_pattern: 测试文件匹配模式
+        verbosity: 测试输出详细程度
+        jobs: 并行进程数，0 表示按CPU核数自动选择
+        
+    Returns:
+        bool: 测试是否全部通过
+    """
+    project_root = os.path.dirname(os.path.abspath(__file__))
+    start_dir = os.path.join(project_root, "tests")
+    
+    if not os.path.exists(start_dir):
+        print(f"测试目录不存在: {start_dir}")
+        return False
+    
+    test_files = sorted(
+        name for name in os.listdir(start_dir)
+        if fnmatch.fnmatch(name, test_pattern)
+    )
+    if not test_files:
+        print(f"未找到匹配的测试用例: {test_pattern}")
+        return False
+    
+    try:
+        import pytest
+        import xdist  # noqa: F401
+    except ImportError:
+        pytest = None
+    
+    if pytest is not None:
+        args = ["-n", str(jobs) if jobs else "auto"]
+        if verbosity == 0:
+            args += ["-q", "-p", "no:cacheprovider"]
+        elif verbosity >= 2:
+            args.append("-v")
+        args += [os.path.join(start_dir, name) for name in test_files]
+        return pytest.main(args) == 0
+    
+    # 回退方案：每个测试模块一个unittest子进程
+    unittest_args = ["-v"] if verbosity >= 2 else (["-q"] if verbosity == 0 else [])
+    
+    def run_module(file_name: str) -> subprocess.CompletedProcess:
+        module = f"tests.{os.path.splitext(file_name)[0]}"
+        return subprocess.run(
+            [sys.executable, "-m", "unittest", module, *unittest_args],
+            cwd=project_root,
+            capture_output=True,
+            text=True
+        )
+    
+    max_workers = jobs or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(run_module, test_files))
+    
+    success = True
+    for file_name, result in zip(test_files, results):
+        print(f"--- {file_name} ---")
+        print(result.stderr or result.stdout)
+        success = success and result.returncode == 0
+    
+    return success
+
+
 def run_specific_test(test_module: str, verbosity: int = 2) -> bool:
     """
     运行特定测试模块
@@ -123,6 +265,13 @@ def main():
         action="store_true",
         help="显示详细的测试输出"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="并行进程数，0 表示按CPU核数自动选择 (默认: 1，串行运行)"
+    )
     parser.add_argument(
         "--quiet", 
         "-q", 
@@ -150,7 +299,10 @@ def main():
         else:
             # 运行所有测试
             print(f"运行测试模式: {args.pattern}")
-            success = run_tests(args.pattern, verbosity)
+            if args.jobs != 1:
+                success = run_tests_parallel(args.pattern, verbosity, args.jobs)
+            else:
+                success = run_tests(args.pattern, verbosity)
         
         if success:
             print("\n✅ 所有测试通过！")
@@ -0,0 +1 @@
+"""项目维护脚本包"""
@@ -4,25 +4,23 @@
 
 该脚本提供数据库创建、表设置、示例数据插入和数据库清理功能。
 支持命令行参数控制不同操作模式。
+
+在项目根目录通过 python -m scripts.init_db 运行，
+或安装项目后使用 dc-init-db 命令。
 """
 
 import argparse
 import logging
 import sys
-from pathlib import Path
-from typing import Optional
-
-# 将项目根目录添加到Python路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+from itertools import islice
+from typing import Any, Dict, Iterable, Optional
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import case, func, insert, literal_column, select, text, union_all
 from sqlalchemy.exc import SQLAlchemyError
 from src.app import create_app, db
 from src.models.task import Task
 from src.models.address_info import AddressInfo
 from src.config import get_config
-from src.utils.database import init_database, test_connection
 
 # 配置日志
 logging.basicConfig(
@@ -31,6 +29,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 示例数据批量插入的默认批次大小
+BATCH_SIZE = 1000
+
+# 示例任务共用的请求头；headers 为原生JSON列，保持字典形式由方言的JSON编码器序列化
+SAMPLE_USER_AGENT_HEADERS = {"User-Agent": "AddressCrawler/1.0"}
+
 
 class DatabaseInitializer:
     """数据库初始化器"""
@@ -100,8 +104,8 @@ class DatabaseInitializer:
                 logger.info("开始插入示例数据...")
                 
                 # 检查是否已存在数据
-                existing_tasks = Task.query.count()
-                existing_addresses = AddressInfo.query.count()
+                existing_tasks = db.session.scalar(select(func.count()).select_from(Task))
+                existing_addresses = db.session.scalar(select(func.count()).select_from(AddressInfo))
                 
                 if existing_tasks > 0 or existing_addresses > 0:
                     logger.info(f"数据库中已存在数据 (任务: {existing_tasks}, 地址: {existing_addresses})")
@@ -109,87 +113,88 @@ class DatabaseInitializer:
                     logger.info("数据库中已存在数据，跳过示例数据插入")
                     return
                 
-                # 插入示例任务数据
+                # 插入示例任务数据（使用字典映射批量插入，绕过ORM工作单元）
                 sample_tasks = [
-                    Task(
-                        url="https://example.com/api/addresses",
-                        method="GET",
-                        headers={"User-Agent": "AddressCrawler/1.0"},
-                        total_num=100,
-                        timeout=30,
-                        status="pending"
-                    ),
-                    Task(
-                        url="https://api.example.com/locations",
-                        method="POST",
-                        body='{"city": "Shanghai", "country": "China"}',
-                        headers={
-                            "User-Agent": "AddressCrawler/1.0",
+                    {
+                        "url": "https://example.com/api/addresses",
+                        "method": "GET",
+                        "headers": SAMPLE_USER_AGENT_HEADERS,
+                        "total_num": 100,
+                        "visited_num": 0,
+                        "timeout": 30,
+                        "retry_count": 0,
+                    },
+                    {
+                        "url": "https://api.example.com/locations",
+                        "method": "POST",
+                        "body": '{"city": "Shanghai", "country": "China"}',
+                        "headers": {
+                            **SAMPLE_USER_AGENT_HEADERS,
                             "Content-Type": "application/json"
                         },
-                        total_num=50,
-                        timeout=60,
-                        status="running"
-                    ),
-                    Task(
-                        url="https://test.com/addresses/123",
-                        method="GET",
-                        total_num=25,
-                        timeout=30,
-                        status="completed",
-                        visited_num=25
-                    )
+                        "total_num": 50,
+                        "visited_num": 0,
+                        "timeout": 60,
+                        "retry_count": 0,
+                    },
+                    {
+                        "url": "https://test.com/addresses/123",
+                        "method": "GET",
+                        "headers": {},
+                        "total_num": 25,
+                        "visited_num": 25,
+                        "timeout": 30,
+                        "retry_count": 0,
+                    }
                 ]
                 
-                for task in sample_tasks:
-                    db.session.add(task)
+                self._bulk_insert(Task, sample_tasks)
                 
                 # 插入示例地址数据
                 sample_addresses = [
-                    AddressInfo(
-                        address="123 Main Street",
-                        telephone="+1-555-123-4567",
-                        city="New York",
-                        zip_code="10001",
-                        state="NY",
-                        state_full="New York",
-                        country="USA",
-                        source_url="https://example.com/addresses/123"
-                    ),
-                    AddressInfo(
-                        address="456 Nanjing Road",
-                        telephone="+86-21-1234-5678",
-                        city="Shanghai",
-                        zip_code="200000",
-                        state="SH",
-                        state_full="Shanghai",
-                        country="China",
-                        source_url="https://example.com/addresses/456"
-                    ),
-                    AddressInfo(
-                        address="789 Oxford Street",
-                        telephone="+44-20-1234-5678",
-                        city="London",
-                        zip_code="W1D 1BS",
-                        state="ENG",
-                        state_full="England",
-                        country="UK",
-                        source_url="https://example.com/addresses/789"
-                    ),
-                    AddressInfo(
-                        address="321 Champs-Élysées",
-                        telephone="+33-1-1234-5678",
-                        city="Paris",
-                        zip_code="75008",
-                        state="IDF",
-                        state_full="Île-de-France",
-                        country="France",
-                        source_url="https://example.com/addresses/321"
-                    )
+                    {
+                        "address": "123 Main Street",
+                        "telephone": "+1-555-123-4567",
+                        "city": "New York",
+                        "zip_code": "10001",
+                        "state": "NY",
+                        "state_full": "New York",
+                        "country": "USA",
+                        "source_url": "https://example.com/addresses/123"
+                    },
+                    {
+                        "address": "456 Nanjing Road",
+                        "telephone": "+86-21-1234-5678",
+                        "city": "Shanghai",
+                        "zip_code": "200000",
+                        "state": "SH",
+                        "state_full": "Shanghai",
+                        "country": "China",
+                        "source_url": "https://example.com/addresses/456"
+                    },
+                    {
+                        "address": "789 Oxford Street",
+                        "telephone": "+44-20-1234-5678",
+                        "city": "London",
+                        "zip_code": "W1D 1BS",
+                        "state": "ENG",
+                        "state_full": "England",
+                        "country": "UK",
+                        "source_url": "https://example.com/addresses/789"
+                    },
+                    {
+                        "address": "321 Champs-Élysées",
+                        "telephone": "+33-1-1234-5678",
+                        "city": "Paris",
+                        "zip_code": "75008",
+                        "state": "IDF",
+                        "state_full": "Île-de-France",
+                        "country": "France",
+                        "source_url": "https://example.com/addresses/321"
+                    }
                 ]
                 
-                for address in sample_addresses:
-                    db.session.add(address)
+                self._bulk_insert(AddressInfo, sample_addresses)
                 
                 # 提交事务
                 db.session.commit()
@@ -209,17 +214,51 @@ class DatabaseInitializer:
                     db.session.rollback()
             raise
     
+    def _bulk_insert(self, model, mappings: Iterable[Dict[str, Any]]) -> None:
+        """
+        分批批量插入数据
+        
+        按批次大小切分映射数据，每批插入后执行一次flush，
+        使内存占用与数据总量无关。PostgreSQL 使用 Core 层 insert 的
+        insertmanyvalues 路径，每批数据合并为一条多行 INSERT、
+        只占一次网络往返；其他数据库使用 bulk_insert_mappings
+        绕过ORM工作单元。
+        
+        Args:
+            model: 模型类
+            mappings: 字段映射字典的可迭代对象
+        """
+        batch_size = getattr(self.config, "SEED_BATCH_SIZE", BATCH_SIZE) or BATCH_SIZE
+        use_core_insert = db.engine.dialect.name == "postgresql"
+        # 分页大小与批次大小一致，保证每批只发出一条语句
+        stmt = insert(model).execution_options(
+            render_nulls=True,
+            insertmanyvalues_page_size=batch_size,
+        )
+        
+        iterator = iter(mappings)
+        while chunk := list(islice(iterator, batch_size)):
+            if use_core_insert:
+                db.session.execute(stmt, chunk)
+            else:
+                db.session.bulk_insert_mappings(model, chunk)
+            db.session.flush()
+    
     def test_connection(self) -> bool:
         """测试数据库连接"""
         try:
-            # 使用utils.database模块的测试函数
-            init_database()
-            result = test_connection()
-            if result:
-                logger.info("数据库连接测试成功")
-            else:
-                logger.error("数据库连接测试失败")
-            return result
+            if not self.app:
+                self.setup()
+            
+            # 复用应用已创建的引擎，只发起一次连接往返
+            with self.app.app_context():
+                with db.engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+            logger.info("数据库连接测试成功")
+            return True
+        except SQLAlchemyError as e:
+            logger.error(f"数据库连接测试失败: {e}")
+            return False
         except Exception as e:
             logger.error(f"数据库连接测试出错: {e}")
             return False
@@ -245,31 +284,44 @@ class DatabaseInitializer:
                 logger.info("数据库状态:")
                 logger.info(f"数据库URL: {self.config.DATABASE_URL}")
                 
-                # 获取表信息
-                task_count = Task.query.count()
-                address_count = AddressInfo.query.count()
+                # 一次查询同时获取任务进度统计和地址国家统计
+                task_state = case(
+                    (Task.total_num <= 0, "unset"),
+                    (Task.visited_num >= Task.total_num, "completed"),
+                    else_="pending"
+                )
+                stats_query = union_all(
+                    select(
+                        literal_column("'task_state'").label("kind"),
+                        task_state.label("value"),
+                        func.count().label("total")
+                    ).select_from(Task).group_by(task_state),
+                    select(
+                        literal_column("'address_country'").label("kind"),
+                        AddressInfo.country.label("value"),
+                        func.count().label("total")
+                    ).group_by(AddressInfo.country)
+                )
+                
+                task_stats: Dict[str, int] = {}
+                country_stats: Dict[Optional[str], int] = {}
+                for kind, value, total in db.session.execute(stats_query):
+                    if kind == "task_state":
+                        task_stats[value] = total
+                    else:
+                        country_stats[value] = total
                 
-                logger.info(f"任务表记录数: {task_count}")
-                logger.info(f"地址表记录数: {address_count}")
+                logger.info(f"任务表记录数: {sum(task_stats.values())}")
+                logger.info(f"地址表记录数: {sum(country_stats.values())}")
                 
-                # 获取任务状态统计
-                if task_count > 0:
-                    status_stats = db.session.query(
-                        Task.status, db.func.count(Task.id)
-                    ).group_by(Task.status).all()
-                    
-                    logger.info("任务状态统计:")
-                    for status, count in status_stats:
-                        logger.info(f"  {status}: {count}")
+                if task_stats:
+                    logger.info("任务进度统计:")
+                    for state, count in task_stats.items():
+                        logger.info(f"  {state}: {count}")
                 
-                # 获取地址国家统计
-                if address_count > 0:
-                    country_stats = db.session.query(
-                        AddressInfo.country, db.func.count(AddressInfo.id)
-                    ).group_by(AddressInfo.country).all()
-                    
+                if country_stats:
                     logger.info("地址国家统计:")
-                    for country, count in country_stats:
+                    for country, count in country_stats.items():
                         logger.info(f"  {country or 'Unknown'}: {count}")
                         
         except Exception as e:
@@ -285,22 +337,22 @@ def main():
         epilog="""
 示例:
   # 创建数据库表
-  python scripts/init_db.py --create
+  python -m scripts.init_db --create
   
   # 插入示例数据
-  python scripts/init_db.py --sample-data
+  python -m scripts.init_db --sample-data
   
   # 重置数据库（删除并重新创建）
-  python scripts/init_db.py --reset
+  python -m scripts.init_db --reset
   
   # 显示数据库状态
-  python scripts/init_db.py --status
+  python -m scripts.init_db --status
   
   # 测试数据库连接
-  python scripts/init_db.py --test
+  python -m scripts.init_db --test
   
   # 完整初始化（创建表 + 插入示例数据）
-  python scripts/init_db.py --full-init
+  python -m scripts.init_db --full-init
         """
     )
     
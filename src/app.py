@@ -5,16 +5,28 @@ Flask应用工厂模块
 包括数据库连接、迁移工具和其他扩展的初始化。
 """
 
+import atexit
+
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from src.config import get_config
 
+if TYPE_CHECKING:
+    from flask_migrate import Migrate
+
 # 初始化扩展实例
 db = SQLAlchemy()
-migrate = Migrate()
+# 迁移工具按需创建，未启用 ENABLE_MIGRATIONS 时保持为 None
+migrate: Optional["Migrate"] = None
+
+# 文件日志的后台监听器，重复创建应用时先停止旧的监听器
+_log_listener = None
+
+# 应用日志处理器名称，用于在重复创建应用时识别已挂载的处理器
+_FILE_HANDLER_NAME = "dc.file"
+_CONSOLE_HANDLER_NAME = "dc.console"
 
 
 def create_app(config_name: Optional[str] = None) -> Flask:
@@ -71,8 +83,14 @@ def _init_extensions(app: Flask) -> None:
     # 初始化数据库
     db.init_app(app)
     
-    # 初始化迁移工具
-    migrate.init_app(app, db)
+    # 初始化迁移工具：仅在启用时导入 Flask-Migrate 及 Alembic
+    if app.config.get('ENABLE_MIGRATIONS', True):
+        from flask_migrate import Migrate
+        
+        global migrate
+        if migrate is None:
+            migrate = Migrate()
+        migrate.init_app(app, db)
 
 
 def _register_blueprints(app: Flask) -> None:
@@ -120,42 +138,97 @@ def _configure_logging(app: Flask) -> None:
         app: Flask应用实例
     """
     import logging
-    from logging.handlers import RotatingFileHandler
     import os
     
     # 获取日志配置
     log_config = app.config
     
-    # 设置日志级别
+    # 设置日志级别：只设置在 logger 上，各处理器不再重复过滤
     log_level = getattr(logging, log_config.get('LOG_LEVEL', 'INFO').upper())
     app.logger.setLevel(log_level)
     
-    # 配置日志格式
+    # 测试环境使用Flask默认处理器，避免每个测试用例重复创建文件句柄
+    if log_config.get('TESTING'):
+        return
+    
+    # 日志已由应用处理器输出，不再向根 logger 传播，避免重复打印
+    app.logger.propagate = False
+    
+    # 配置日志格式，所有处理器共用同一个 Formatter
     formatter = logging.Formatter(
         log_config.get('LOG_FORMAT', 
                       '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     )
     
-    # 配置文件日志处理器
+    # 配置文件日志处理器：写盘交给后台线程，请求线程只负责入队
+    global _log_listener
+    _stop_log_listener()
     if log_config.get('LOG_FILE_ENABLED', True):
+        import queue
+        from logging.handlers import QueueHandler, QueueListener
+        try:
+            # 多进程部署（gunicorn）下使用进程安全的轮转处理器，避免轮转竞争
+            from concurrent_log_handler import (
+                ConcurrentRotatingFileHandler as RotatingFileHandler
+            )
+        except ImportError:
+            from logging.handlers import RotatingFileHandler
+        
         log_dir = os.path.dirname(log_config.get('LOG_FILE_PATH', 'logs/app.log'))
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
         
         file_handler = RotatingFileHandler(
             log_config.get('LOG_FILE_PATH', 'logs/app.log'),
             maxBytes=log_config.get('LOG_FILE_MAX_BYTES', 10485760),  # 10MB
             backupCount=log_config.get('LOG_FILE_BACKUP_COUNT', 5)
         )
-        file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        app.logger.addHandler(file_handler)
+        
+        log_queue = queue.Queue(-1)
+        _log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _log_listener.start()
+        
+        _set_app_handler(app.logger, _FILE_HANDLER_NAME, QueueHandler(log_queue))
+    else:
+        _set_app_handler(app.logger, _FILE_HANDLER_NAME, None)
     
     # 配置控制台日志处理器
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    app.logger.addHandler(console_handler)
+    _set_app_handler(app.logger, _CONSOLE_HANDLER_NAME, console_handler)
+
+
+def _set_app_handler(logger, name: str, handler) -> None:
+    """
+    按名称替换 logger 上的应用处理器
+    
+    重复调用 create_app 时 Flask 复用同名 logger，先移除同名的旧处理器，
+    避免同一条日志被输出多次。
+    
+    Args:
+        logger: 目标 logger
+        name: 处理器名称
+        handler: 新的处理器，为 None 时只移除旧处理器
+    """
+    for existing in [h for h in logger.handlers if h.get_name() == name]:
+        logger.removeHandler(existing)
+    if handler is not None:
+        handler.set_name(name)
+        logger.addHandler(handler)
+
+
+def _stop_log_listener() -> None:
+    """停止文件日志监听器，写出队列中剩余的日志并关闭文件句柄"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
 
 
 def get_db() -> SQLAlchemy:
@@ -168,11 +241,16 @@ def get_db() -> SQLAlchemy:
     return db
 
 
-def get_migrate() -> Migrate:
+def get_migrate() -> "Migrate":
     """
     获取迁移工具实例
     
     Returns:
         Migrate: 迁移工具实例
+        
+    Raises:
+        RuntimeError: 当迁移工具未启用或应用尚未创建时
     """
+    if migrate is None:
+        raise RuntimeError("迁移工具未初始化，请设置 ENABLE_MIGRATIONS=True 后再创建应用")
     return migrate
\ No newline at end of file
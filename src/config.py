@@ -6,76 +6,199 @@
 """
 
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Tuple
 from dotenv import load_dotenv
+from sqlalchemy.pool import NullPool, StaticPool
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时使用SQLAlchemy默认的json模块
+    orjson = None
 
 # 加载环境变量
 load_dotenv()
 
 
+def _to_bool(value: str) -> bool:
+    """将环境变量字符串转换为布尔值"""
+    return value.lower() == "true"
+
+
+# 环境变量配置表：(配置名, 默认值, 类型转换函数)
+_ENV_SCHEMA: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+    # Flask 配置
+    ("SECRET_KEY", "dev-secret-key-change-in-production", str),
+    ("DEBUG", "False", _to_bool),
+    # 数据库配置
+    ("DATABASE_URL", "sqlite:///address_crawler.db", str),
+    ("SQLALCHEMY_ECHO", "False", _to_bool),
+    ("DB_POOL_SIZE", "20", int),
+    ("DB_MAX_OVERFLOW", "10", int),
+    ("PGBOUNCER", "0", str),
+    ("SEED_BATCH_SIZE", "1000", int),
+    ("ENABLE_MIGRATIONS", "True", _to_bool),
+    # APScheduler 配置
+    ("SCHEDULER_TIMEZONE", "Asia/Shanghai", str),
+    ("SCHEDULER_COALESCE", "True", _to_bool),
+    ("SCHEDULER_MAX_INSTANCES", "3", int),
+    ("SCHEDULER_MISFIRE_GRACE_TIME", "300", int),
+    ("SCHEDULER_API_ENABLED", "True", _to_bool),
+    ("SCHEDULER_HISTORY_ENABLED", "True", _to_bool),
+    ("SCHEDULER_STATS_ENABLED", "True", _to_bool),
+    # 自动任务执行配置
+    ("AUTO_EXECUTION_ENABLED", "False", _to_bool),
+    ("AUTO_EXECUTION_INTERVAL", "30", int),
+    # 日志配置
+    ("LOG_LEVEL", "INFO", str),
+    ("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s", str),
+    ("LOG_FILE_ENABLED", "True", _to_bool),
+    ("LOG_FILE_PATH", "logs/app.log", str),
+    ("LOG_FILE_MAX_BYTES", "10485760", int),
+    ("LOG_FILE_BACKUP_COUNT", "5", int),
+    # 日志清理配置
+    ("LOG_RETENTION_DAYS", "30", int),
+    ("LOG_MAX_SIZE_MB", "100", int),
+    ("LOG_COMPRESS_OLD", "True", _to_bool),
+    ("LOG_CLEANUP_ENABLED", "True", _to_bool),
+    # 爬虫配置
+    ("CRAWLER_TIMEOUT", "30", int),
+    ("CRAWLER_RETRY_COUNT", "3", int),
+    ("CRAWLER_RETRY_DELAY", "5", int),
+    ("CRAWLER_MAX_CONCURRENCY", "64", int),
+    ("CRAWLER_MAX_BODY", "262144", int),
+    ("CRAWLER_HTTP2", "False", _to_bool),
+    # API 配置
+    ("API_BASE_URL", "https://api.example.com", str),
+    ("API_KEY", "", str),
+)
+
+
+def _load_env(schema: Tuple[Tuple[str, str, Callable[[str], Any]], ...]) -> Dict[str, Any]:
+    """
+    按配置表一次性读取并转换环境变量
+    
+    Args:
+        schema: 环境变量配置表
+        
+    Returns:
+        Dict[str, Any]: 配置名到转换后取值的字典
+        
+    Raises:
+        ValueError: 当环境变量无法转换为目标类型时
+    """
+    env = os.environ
+    settings: Dict[str, Any] = {}
+    for name, default, cast in schema:
+        raw_value = env.get(name, default)
+        try:
+            settings[name] = cast(raw_value)
+        except ValueError:
+            raise ValueError(f"无效的配置项 {name}: {raw_value}")
+    return settings
+
+
+_ENV = _load_env(_ENV_SCHEMA)
+
+
+def _orjson_dumps(value: Any) -> str:
+    """使用 orjson 序列化JSON列的值"""
+    return orjson.dumps(value).decode()
+
+
+# JSON列（如 Task.headers）的序列化选项；MySQL 5.7+ 与 PostgreSQL 的JSON类型同样适用
+_JSON_ENGINE_OPTIONS: Dict[str, Any] = (
+    {"json_serializer": _orjson_dumps, "json_deserializer": orjson.loads}
+    if orjson is not None else {}
+)
+
+
 class Config:
-    """基础配置类"""
+    """
+    基础配置类
+    
+    配置项均为类属性，在模块导入时解析一次；实例由 get_config() 按环境名缓存复用，
+    不应在运行时修改实例属性。
+    """
     
     # Flask 配置
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
-    DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
+    SECRET_KEY: str = _ENV["SECRET_KEY"]
+    DEBUG: bool = _ENV["DEBUG"]
     
     # 数据库配置
-    DATABASE_URL: str = os.getenv(
-        "DATABASE_URL", 
-        "sqlite:///address_crawler.db"
-    )
+    DATABASE_URL: str = _ENV["DATABASE_URL"]
     SQLALCHEMY_DATABASE_URI: str = DATABASE_URL
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
-    SQLALCHEMY_ECHO: bool = os.getenv("SQLALCHEMY_ECHO", "False").lower() == "true"
+    SQLALCHEMY_ECHO: bool = _ENV["SQLALCHEMY_ECHO"]
+    # 连接池配置：按爬虫与调度器线程的并发量调整
+    SQLALCHEMY_ENGINE_OPTIONS: Dict[str, Any] = {
+        "pool_size": _ENV["DB_POOL_SIZE"],
+        "max_overflow": _ENV["DB_MAX_OVERFLOW"],
+        "pool_pre_ping": True,   # 检出前探测失效连接
+        "pool_recycle": 1800,    # 早于MySQL等服务端的空闲超时回收连接
+        "pool_timeout": 30,
+        "pool_use_lifo": True,   # 优先复用最近归还的连接，空闲连接可被自然回收
+        **_JSON_ENGINE_OPTIONS,
+    }
+    SEED_BATCH_SIZE: int = _ENV["SEED_BATCH_SIZE"]  # 批量插入每批行数
+    ENABLE_MIGRATIONS: bool = _ENV["ENABLE_MIGRATIONS"]  # 是否加载 Flask-Migrate
     
     # APScheduler 配置
-    SCHEDULER_TIMEZONE: str = os.getenv("SCHEDULER_TIMEZONE", "Asia/Shanghai")
+    SCHEDULER_TIMEZONE: str = _ENV["SCHEDULER_TIMEZONE"]
     SCHEDULER_JOB_DEFAULTS: Dict[str, Any] = {
-        "coalesce": os.getenv("SCHEDULER_COALESCE", "True").lower() == "true",
-        "max_instances": int(os.getenv("SCHEDULER_MAX_INSTANCES", "3")),
-        "misfire_grace_time": int(os.getenv("SCHEDULER_MISFIRE_GRACE_TIME", "300")),
+        "coalesce": _ENV["SCHEDULER_COALESCE"],
+        "max_instances": _ENV["SCHEDULER_MAX_INSTANCES"],
+        "misfire_grace_time": _ENV["SCHEDULER_MISFIRE_GRACE_TIME"],
     }
-    SCHEDULER_API_ENABLED: bool = os.getenv("SCHEDULER_API_ENABLED", "True").lower() == "true"
+    SCHEDULER_API_ENABLED: bool = _ENV["SCHEDULER_API_ENABLED"]
+    SCHEDULER_HISTORY_ENABLED: bool = _ENV["SCHEDULER_HISTORY_ENABLED"]  # 是否保留执行历史记录
+    SCHEDULER_STATS_ENABLED: bool = _ENV["SCHEDULER_STATS_ENABLED"]  # 是否统计作业执行情况
     
     # 自动任务执行配置
-    AUTO_EXECUTION_ENABLED: bool = os.getenv("AUTO_EXECUTION_ENABLED", "False").lower() == "true"
-    AUTO_EXECUTION_INTERVAL: int = int(os.getenv("AUTO_EXECUTION_INTERVAL", "30"))  # 秒
+    AUTO_EXECUTION_ENABLED: bool = _ENV["AUTO_EXECUTION_ENABLED"]
+    AUTO_EXECUTION_INTERVAL: int = _ENV["AUTO_EXECUTION_INTERVAL"]  # 秒
     
     # 日志配置
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FORMAT: str = os.getenv(
-        "LOG_FORMAT",
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    LOG_FILE_ENABLED: bool = os.getenv("LOG_FILE_ENABLED", "True").lower() == "true"
-    LOG_FILE_PATH: str = os.getenv("LOG_FILE_PATH", "logs/app.log")
-    LOG_FILE_MAX_BYTES: int = int(os.getenv("LOG_FILE_MAX_BYTES", "10485760"))  # 10MB
-    LOG_FILE_BACKUP_COUNT: int = int(os.getenv("LOG_FILE_BACKUP_COUNT", "5"))
+    LOG_LEVEL: str = _ENV["LOG_LEVEL"]
+    LOG_FORMAT: str = _ENV["LOG_FORMAT"]
+    LOG_FILE_ENABLED: bool = _ENV["LOG_FILE_ENABLED"]
+    LOG_FILE_PATH: str = _ENV["LOG_FILE_PATH"]
+    LOG_FILE_MAX_BYTES: int = _ENV["LOG_FILE_MAX_BYTES"]  # 10MB
+    LOG_FILE_BACKUP_COUNT: int = _ENV["LOG_FILE_BACKUP_COUNT"]
     
     # 日志清理配置
-    LOG_RETENTION_DAYS: int = int(os.getenv("LOG_RETENTION_DAYS", "30"))
-    LOG_MAX_SIZE_MB: int = int(os.getenv("LOG_MAX_SIZE_MB", "100"))
-    LOG_COMPRESS_OLD: bool = os.getenv("LOG_COMPRESS_OLD", "True").lower() == "true"
-    LOG_CLEANUP_ENABLED: bool = os.getenv("LOG_CLEANUP_ENABLED", "True").lower() == "true"
+    LOG_RETENTION_DAYS: int = _ENV["LOG_RETENTION_DAYS"]
+    LOG_MAX_SIZE_MB: int = _ENV["LOG_MAX_SIZE_MB"]
+    LOG_COMPRESS_OLD: bool = _ENV["LOG_COMPRESS_OLD"]
+    LOG_CLEANUP_ENABLED: bool = _ENV["LOG_CLEANUP_ENABLED"]
     
     # 爬虫配置
-    CRAWLER_TIMEOUT: int = int(os.getenv("CRAWLER_TIMEOUT", "30"))
-    CRAWLER_RETRY_COUNT: int = int(os.getenv("CRAWLER_RETRY_COUNT", "3"))
-    CRAWLER_RETRY_DELAY: int = int(os.getenv("CRAWLER_RETRY_DELAY", "5"))
+    CRAWLER_TIMEOUT: int = _ENV["CRAWLER_TIMEOUT"]
+    CRAWLER_RETRY_COUNT: int = _ENV["CRAWLER_RETRY_COUNT"]
+    CRAWLER_RETRY_DELAY: int = _ENV["CRAWLER_RETRY_DELAY"]
+    CRAWLER_MAX_CONCURRENCY: int = _ENV["CRAWLER_MAX_CONCURRENCY"]
+    CRAWLER_MAX_BODY: int = _ENV["CRAWLER_MAX_BODY"]  # 256KB
+    CRAWLER_HTTP2: bool = _ENV["CRAWLER_HTTP2"]
     
     # API 配置
-    API_BASE_URL: str = os.getenv("API_BASE_URL", "https://api.example.com")
-    API_KEY: str = os.getenv("API_KEY", "")
+    API_BASE_URL: str = _ENV["API_BASE_URL"]
+    API_KEY: str = _ENV["API_KEY"]
     
     @classmethod
     def validate_config(cls) -> None:
         """
         验证配置项的有效性
         
+        每个配置类只验证一次，需要重新验证时将 _validated 置为 False。
+        
         Raises:
             ValueError: 当必需配置项缺失时
         """
+        # 只检查当前类自身的标记，避免子类继承父类的验证结果
+        if cls.__dict__.get("_validated", False):
+            return
+        
         required_configs = [
             ("DATABASE_URL", cls.DATABASE_URL),
             ("SECRET_KEY", cls.SECRET_KEY),
@@ -89,6 +212,8 @@ class Config:
         valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         if cls.LOG_LEVEL not in valid_log_levels:
             raise ValueError(f"无效的日志级别: {cls.LOG_LEVEL}")
+        
+        cls._validated = True
 
 
 class DevelopmentConfig(Config):
@@ -103,6 +228,16 @@ class ProductionConfig(Config):
     DEBUG: bool = False
     LOG_LEVEL: str = "INFO"
     SQLALCHEMY_ECHO: bool = False
+    
+    # 部署在 PGBouncer/Odyssey 事务池之后时，由外部连接池负责复用连接，
+    # 应用侧不再做二次池化；psycopg3 的服务端预编译语句无法跨事务保留，需关闭
+    if _ENV["PGBOUNCER"] == "1":
+        SQLALCHEMY_ENGINE_OPTIONS: Dict[str, Any] = {
+            "poolclass": NullPool,
+            **_JSON_ENGINE_OPTIONS,
+        }
+        if Config.DATABASE_URL.startswith("postgresql+psycopg:"):
+            SQLALCHEMY_ENGINE_OPTIONS["connect_args"] = {"prepare_threshold": None}
 
 
 class TestingConfig(Config):
@@ -112,6 +247,12 @@ class TestingConfig(Config):
     LOG_LEVEL: str = "DEBUG"
     DATABASE_URL: str = "sqlite:///:memory:"
     SQLALCHEMY_DATABASE_URI: str = DATABASE_URL
+    # 内存SQLite需要在所有线程间共享同一连接
+    SQLALCHEMY_ENGINE_OPTIONS: Dict[str, Any] = {
+        "poolclass": StaticPool,
+        "connect_args": {"check_same_thread": False},
+        **_JSON_ENGINE_OPTIONS,
+    }
 
 
 # 配置映射
@@ -127,6 +268,9 @@ def get_config(config_name: str = None) -> Config:
     """
     获取配置实例
     
+    配置实例按名称缓存，重复调用不会重新构造配置对象。
+    运行时修改配置类属性后需调用 refresh_config() 使其生效。
+    
     Args:
         config_name: 配置名称 (development, production, testing)
         
@@ -139,6 +283,12 @@ def get_config(config_name: str = None) -> Config:
     if config_name is None:
         config_name = os.getenv("FLASK_ENV", "default")
     
+    return _get_config_instance(config_name)
+
+
+@lru_cache(maxsize=8)
+def _get_config_instance(config_name: str) -> Config:
+    """按名称创建并缓存配置实例"""
     config_class = config_mapping.get(config_name)
     if config_class is None:
         raise ValueError(f"无效的配置名称: {config_name}")
@@ -146,47 +296,65 @@ def get_config(config_name: str = None) -> Config:
     return config_class()
 
 
-def get_database_config() -> Dict[str, Any]:
+
+def get_database_config() -> Mapping[str, Any]:
     """
     获取数据库配置
     
     Returns:
-        Dict[str, Any]: 数据库配置字典
+        Mapping[str, Any]: 数据库配置的只读视图
     """
-    config = get_config()
-    return {
+    return _database_config_view(get_config())
+
+
+@lru_cache(maxsize=8)
+def _database_config_view(config: Config) -> Mapping[str, Any]:
+    """构建并缓存数据库配置只读视图"""
+    return MappingProxyType({
         "url": config.DATABASE_URL,
         "echo": config.SQLALCHEMY_ECHO,
         "track_modifications": config.SQLALCHEMY_TRACK_MODIFICATIONS,
-    }
+    })
 
 
-def get_scheduler_config() -> Dict[str, Any]:
+def get_scheduler_config() -> Mapping[str, Any]:
     """
     获取调度器配置
     
     Returns:
-        Dict[str, Any]: 调度器配置字典
+        Mapping[str, Any]: 调度器配置的只读视图
     """
-    config = get_config()
-    return {
+    return _scheduler_config_view(get_config())
+
+
+@lru_cache(maxsize=8)
+def _scheduler_config_view(config: Config) -> Mapping[str, Any]:
+    """构建并缓存调度器配置只读视图"""
+    return MappingProxyType({
         "timezone": config.SCHEDULER_TIMEZONE,
         "job_defaults": config.SCHEDULER_JOB_DEFAULTS,
         "api_enabled": config.SCHEDULER_API_ENABLED,
+        "history_enabled": config.SCHEDULER_HISTORY_ENABLED,
+        "stats_enabled": config.SCHEDULER_STATS_ENABLED,
         "auto_execution_enabled": config.AUTO_EXECUTION_ENABLED,
         "auto_execution_interval": config.AUTO_EXECUTION_INTERVAL,
-    }
+    })
 
 
-def get_logging_config() -> Dict[str, Any]:
+def get_logging_config() -> Mapping[str, Any]:
     """
     获取日志配置
     
     Returns:
-        Dict[str, Any]: 日志配置字典
+        Mapping[str, Any]: 日志配置的只读视图
     """
-    config = get_config()
-    return {
+    return _logging_config_view(get_config())
+
+
+@lru_cache(maxsize=8)
+def _logging_config_view(config: Config) -> Mapping[str, Any]:
+    """构建并缓存日志配置只读视图"""
+    return MappingProxyType({
         "level": config.LOG_LEVEL,
         "format": config.LOG_FORMAT,
         "file_enabled": config.LOG_FILE_ENABLED,
@@ -197,22 +365,42 @@ def get_logging_config() -> Dict[str, Any]:
         "max_size_mb": config.LOG_MAX_SIZE_MB,
         "compress_old": config.LOG_COMPRESS_OLD,
         "cleanup_enabled": config.LOG_CLEANUP_ENABLED,
-    }
+    })
 
 
-def get_log_cleanup_config() -> Dict[str, Any]:
+def get_log_cleanup_config() -> Mapping[str, Any]:
     """
     获取日志清理配置
     
     Returns:
-        Dict[str, Any]: 日志清理配置字典
+        Mapping[str, Any]: 日志清理配置的只读视图
     """
-    config = get_config()
-    return {
+    return _log_cleanup_config_view(get_config())
+
+
+@lru_cache(maxsize=8)
+def _log_cleanup_config_view(config: Config) -> Mapping[str, Any]:
+    """构建并缓存日志清理配置只读视图"""
+    return MappingProxyType({
         "retention_days": config.LOG_RETENTION_DAYS,
         "max_size_mb": config.LOG_MAX_SIZE_MB,
         "compress_old": config.LOG_COMPRESS_OLD,
         "cleanup_enabled": config.LOG_CLEANUP_ENABLED,
         "backup_count": config.LOG_FILE_BACKUP_COUNT,
         "log_directory": os.path.dirname(config.LOG_FILE_PATH),
-    }
\ No newline at end of file
+    })
+
+
+def refresh_config() -> None:
+    """
+    清除配置实例及各配置视图的缓存
+    
+    在运行时修改配置类属性后调用，使后续读取重新构建配置实例与视图。
+    注意：环境变量只在模块导入时解析一次（_ENV），配置类属性也在导入时绑定，
+    本函数不会重新读取环境变量；修改环境变量后需重启进程才能生效。
+    """
+    _get_config_instance.cache_clear()
+    _database_config_view.cache_clear()
+    _scheduler_config_view.cache_clear()
+    _logging_config_view.cache_clear()
+    _log_cleanup_config_view.cache_clear()
@@ -15,21 +15,34 @@ import os
 import sys
 import signal
 import atexit
-from typing import Optional
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
-# 设置PyMySQL作为MySQLdb模块的别名
-import pymysql
-pymysql.install_as_MySQLdb()
+# 优先使用C实现的 mysqlclient 驱动；未安装时回退为 PyMySQL 并注册为 MySQLdb 别名，
+# 保证 mysql:// 形式的连接URL仍然可用
+try:
+    import MySQLdb  # noqa: F401
+except ImportError:
+    import pymysql
+    pymysql.install_as_MySQLdb()
 
-from src.app import create_app
+from src.app import create_app, db
 from src.scheduler.task_scheduler import get_scheduler, start_scheduler, stop_scheduler
 from src.utils.logger import get_logger
 
-# 全局变量
-app = None
-scheduler = None
-logger = None
-_shutdown_requested = False
+
+# 应用运行状态
+@dataclass
+class AppState:
+    """应用运行状态容器，集中保存应用、调度器、日志器和关闭标志"""
+    app: Any = None
+    scheduler: Any = None
+    logger: Any = None
+    shutdown_requested: threading.Event = field(default_factory=threading.Event)
+
+
+STATE = AppState()
 
 
 def signal_handler(signum: int, frame) -> None:
@@ -40,18 +53,18 @@ def signal_handler(signum: int, frame) -> None:
         signum: 信号编号
         frame: 当前堆栈帧
     """
-    global _shutdown_requested, logger
+    logger = STATE.logger
     
-    if _shutdown_requested:
+    if STATE.shutdown_requested.is_set():
         logger.warning("强制关闭应用")
         sys.exit(1)
     
-    _shutdown_requested = True
+    STATE.shutdown_requested.set()
     logger.info(f"收到信号 {signum}，开始优雅关闭应用...")
     
     try:
         # 停止调度器
-        if scheduler and scheduler.is_running:
+        if STATE.scheduler and STATE.scheduler.is_running:
             logger.info("正在停止任务调度器...")
             stop_scheduler(wait=True)
             logger.info("任务调度器已停止")
@@ -68,11 +81,15 @@ def setup_signal_handlers() -> None:
     """
     设置信号处理器
     
-    注册对 SIGINT (Ctrl+C) 和 SIGTERM 的处理，确保应用能够优雅关闭。
+    注册对 SIGINT (Ctrl+C)、SIGTERM 以及容器编排常用的 SIGQUIT、SIGHUP 的处理，
+    确保应用在收到第一个停止信号时即能够优雅关闭。Windows 不支持后两种信号。
     """
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
-    logger.info("信号处理器已设置")
+    for signal_name in ("SIGQUIT", "SIGHUP"):
+        if hasattr(signal, signal_name):
+            signal.signal(getattr(signal, signal_name), signal_handler)
+    STATE.logger.info("信号处理器已设置")
 
 
 def initialize_scheduler(app) -> bool:
@@ -85,11 +102,11 @@ def initialize_scheduler(app) -> bool:
     Returns:
         bool: 初始化是否成功
     """
-    global scheduler
+    logger = STATE.logger
     
     try:
         # 获取调度器实例
-        scheduler = get_scheduler()
+        STATE.scheduler = get_scheduler()
         
         # 启动调度器
         if start_scheduler():
@@ -110,10 +127,10 @@ def shutdown_scheduler() -> None:
     
     在应用关闭时优雅地停止调度器。
     """
-    global scheduler
+    logger = STATE.logger
     
     try:
-        if scheduler and scheduler.is_running:
+        if STATE.scheduler and STATE.scheduler.is_running:
             logger.info("正在关闭任务调度器...")
             stop_scheduler(wait=True)
             logger.info("任务调度器已关闭")
@@ -131,17 +148,17 @@ def create_and_configure_app(config_name: Optional[str] = None) -> bool:
     Returns:
         bool: 配置是否成功
     """
-    global app, logger
+    logger = None
     
     try:
         # 创建Flask应用
-        app = create_app(config_name)
-        logger = get_logger(__name__)
+        STATE.app = create_app(config_name)
+        STATE.logger = logger = get_logger(__name__)
         
         logger.info("Flask应用创建成功")
         
         # 初始化调度器
-        if not initialize_scheduler(app):
+        if not initialize_scheduler(STATE.app):
             logger.error("调度器初始化失败")
             return False
         
@@ -168,7 +185,7 @@ def run_development_server(host: str = "127.0.0.1", port: int = 5000, debug: boo
         port: 端口号
         debug: 是否启用调试模式
     """
-    global app, logger
+    app, logger = STATE.app, STATE.logger
     
     try:
         logger.info(f"启动开发服务器 - 主机: {host}, 端口: {port}, 调试模式: {debug}")
@@ -183,6 +200,54 @@ def run_development_server(host: str = "127.0.0.1", port: int = 5000, debug: boo
         raise
 
 
+def get_env_int(name: str, default: int, minimum: int = 0) -> int:
+    """
+    读取整数类型的环境变量
+    
+    未设置时使用默认值；取值不是整数或小于下限时记录警告并使用默认值，
+    不会因为配置错误导致启动失败。
+    
+    Args:
+        name: 环境变量名
+        default: 默认值
+        minimum: 允许的最小值
+        
+    Returns:
+        int: 环境变量的值
+    """
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    
+    try:
+        value = int(raw)
+    except ValueError:
+        value = None
+    
+    if value is None or value < minimum:
+        logger = STATE.logger or get_logger(__name__)
+        logger.warning(f"环境变量 {name}={raw!r} 无效（需为不小于 {minimum} 的整数），使用默认值 {default}")
+        return default
+    return value
+
+
+def get_worker_count() -> int:
+    """
+    获取Gunicorn worker进程数
+    
+    读取环境变量 GUNICORN_WORKERS，未设置或为 auto 时按 2*CPU+1 计算，最多16个；
+    取值无效时同样按 auto 计算。
+    
+    Returns:
+        int: worker进程数
+    """
+    auto_workers = min(16, 2 * (os.cpu_count() or 1) + 1)
+    workers = os.getenv("GUNICORN_WORKERS", "auto")
+    if workers.strip().lower() == "auto":
+        return auto_workers
+    return get_env_int("GUNICORN_WORKERS", auto_workers, minimum=1)
+
+
 def run_production_server(host: str = "0.0.0.0", port: int = 5000) -> None:
     """
     运行生产服务器
@@ -193,7 +258,7 @@ def run_production_server(host: str = "0.0.0.0", port: int = 5000) -> None:
         host: 主机地址
         port: 端口号
     """
-    global logger
+    app, logger = STATE.app, STATE.logger
     
     try:
         logger.info(f"启动生产服务器 - 主机: {host}, 端口: {port}")
@@ -216,18 +281,28 @@ def run_production_server(host: str = "0.0.0.0", port: int = 5000) -> None:
                 def load(self):
                     return self.application
             
+            def post_fork(server, worker):
+                # preload_app 下引擎在主进程创建，子进程丢弃继承的连接池，避免共享连接
+                with app.app_context():
+                    db.engine.dispose(close=False)
+            
+            # 爬虫请求以网络等待为主，使用线程worker在单进程内并发处理
+            disable_access_log = os.getenv("DISABLE_ACCESS_LOG", "False").lower() == "true"
             options = {
                 'bind': f'{host}:{port}',
-                'workers': 4,
-                'worker_class': 'sync',
-                'timeout': 30,
+                'workers': get_worker_count(),
+                'worker_class': 'gthread',
+                'threads': get_env_int("GUNICORN_THREADS", 8, minimum=1),
+                'timeout': get_env_int("GUNICORN_TIMEOUT", 30),
                 'keepalive': 2,
-                'max_requests': 1000,
-                'max_requests_jitter': 50,
+                # 定期回收worker，把碎片化的堆内存归还给操作系统
+                'max_requests': get_env_int("GUNICORN_MAX_REQUESTS", 1000),
+                'max_requests_jitter': get_env_int("GUNICORN_MAX_REQUESTS_JITTER", 50),
                 'preload_app': True,
-                'accesslog': '-',
+                'accesslog': None if disable_access_log else '-',
                 'errorlog': '-',
-                'loglevel': 'info'
+                'loglevel': 'info',
+                'post_fork': post_fork
             }
             
             StandaloneApplication(app, options).run()
@@ -236,7 +311,15 @@ def run_production_server(host: str = "0.0.0.0", port: int = 5000) -> None:
             # 如果没有gunicorn，尝试使用waitress
             try:
                 from waitress import serve
-                serve(app, host=host, port=port)
+                serve(
+                    app,
+                    host=host,
+                    port=port,
+                    threads=get_env_int("WAITRESS_THREADS", 8, minimum=1),
+                    connection_limit=1000,
+                    channel_timeout=30,
+                    asyncore_use_poll=True  # 使用poll替代select，支持大量并发连接
+                )
             except ImportError:
                 logger.warning("未安装gunicorn或waitress，使用Flask开发服务器作为替代")
                 run_development_server(host, port, debug=False)
@@ -254,8 +337,6 @@ def main():
     
     负责解析命令行参数，创建应用并启动服务器。
     """
-    global app, logger
-    
     # 获取配置名称
     config_name = os.getenv("FLASK_ENV", "development")
     
@@ -264,12 +345,14 @@ def main():
         print("应用初始化失败，退出程序")
         sys.exit(1)
     
+    logger = STATE.logger
+    
     # 设置信号处理器
     setup_signal_handlers()
     
     # 获取服务器配置
     host = os.getenv("FLASK_HOST", "127.0.0.1")
-    port = int(os.getenv("FLASK_PORT", "5000"))
+    port = get_env_int("FLASK_PORT", 5000, minimum=1)
     
     try:
         # 根据环境选择服务器类型
@@ -5,7 +5,8 @@
 包括模型注册表和模型级工具函数，为迁移工具和模型管理提供便利。
 """
 
-from typing import Dict, Type, Any
+from types import MappingProxyType
+from typing import Dict, Mapping, Type, Any
 from sqlalchemy.ext.declarative import DeclarativeMeta
 
 # 导入所有模型类
@@ -18,6 +19,9 @@ MODEL_REGISTRY: Dict[str, Type[DeclarativeMeta]] = {
     'AddressInfo': AddressInfo,
 }
 
+# 注册表的只读视图，随 register_model 的注册实时更新
+_REGISTRY_VIEW: Mapping[str, Type[DeclarativeMeta]] = MappingProxyType(MODEL_REGISTRY)
+
 # 定义 __all__ 控制模块的公开接口
 __all__ = [
     'Task',
@@ -25,6 +29,7 @@ __all__ = [
     'MODEL_REGISTRY',
     'get_model_class',
     'get_all_models',
+    'copy_all_models',
     'get_model_names',
 ]
 
@@ -49,18 +54,29 @@ def get_model_class(model_name: str) -> Type[DeclarativeMeta]:
     return MODEL_REGISTRY[model_name]
 
 
-def get_all_models() -> Dict[str, Type[DeclarativeMeta]]:
+def get_all_models() -> Mapping[str, Type[DeclarativeMeta]]:
     """
     获取所有注册的模型
     
     Returns:
-        Dict[str, Type[DeclarativeMeta]]: 包含所有模型类的字典
+        Mapping[str, Type[DeclarativeMeta]]: 模型注册表的只读视图，
+            需要修改时请使用 copy_all_models()
         
     Example:
         >>> all_models = get_all_models()
         >>> for name, model_class in all_models.items():
         ...     print(f"Model: {name}")
     """
+    return _REGISTRY_VIEW
+
+
+def copy_all_models() -> Dict[str, Type[DeclarativeMeta]]:
+    """
+    获取所有注册模型的可修改副本
+    
+    Returns:
+        Dict[str, Type[DeclarativeMeta]]: 包含所有模型类的新字典
+    """
     return MODEL_REGISTRY.copy()
 
 
@@ -5,14 +5,14 @@
 包括地址、电话、城市、邮编、州、国家等核心字段，以及数据来源和时间戳信息。
 """
 
-from datetime import datetime
-from typing import Optional, Dict, Any
-from sqlalchemy import Column, Integer, String, DateTime, Text
-from sqlalchemy.sql import func
+from typing import Optional
+from sqlalchemy import Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
 from src.app import db
+from src.models.base import SerializableMixin, TimestampMixin
 
 
-class AddressInfo(db.Model):
+class AddressInfo(TimestampMixin, SerializableMixin, db.Model):
     """
     地址信息模型类
     
@@ -21,38 +21,31 @@ class AddressInfo(db.Model):
     """
     
     __tablename__ = 'address_info'
+    __table_args__ = (
+        # 重复数据检查按 address + city (+ state) 查询，同时覆盖单独按地址的查询
+        Index('ix_address_info_address_city_state', 'address', 'city', 'state'),
+        # 按国家/州/城市的地理筛选
+        Index('ix_address_info_country_state_city', 'country', 'state', 'city'),
+    )
+    
+    # to_dict / __json__ 输出的字段，时间戳字段由 SerializableMixin 处理
+    _SERIALIZABLE_FIELDS = ('id', 'address', 'telephone', 'city', 'zip_code', 'state',
+                            'state_full', 'country', 'source_url')
     
     # 主键
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
     # 地址核心字段
-    address = Column(String(512), nullable=False, index=True, comment='详细地址')
-    telephone = Column(String(50), nullable=True, comment='电话号码')
-    city = Column(String(100), nullable=True, index=True, comment='城市')
-    zip_code = Column(String(20), nullable=True, comment='邮政编码')
-    state = Column(String(50), nullable=True, index=True, comment='州/省份缩写')
-    state_full = Column(String(100), nullable=True, comment='州/省份全称')
-    country = Column(String(100), nullable=True, index=True, comment='国家')
+    address: Mapped[str] = mapped_column(String(512), nullable=False, comment='详细地址')
+    telephone: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, comment='电话号码')
+    city: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True, comment='城市')
+    zip_code: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment='邮政编码')
+    state: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True, comment='州/省份缩写')
+    state_full: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment='州/省份全称')
+    country: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True, comment='国家')
     
     # 数据来源字段
-    source_url = Column(String(2048), nullable=True, comment='数据来源URL')
-    
-    # 时间戳字段
-    created_at = Column(
-        DateTime, 
-        nullable=False, 
-        default=datetime.utcnow,
-        server_default=func.now(),
-        comment='创建时间'
-    )
-    updated_at = Column(
-        DateTime, 
-        nullable=False, 
-        default=datetime.utcnow,
-        server_default=func.now(),
-        onupdate=datetime.utcnow,
-        comment='更新时间'
-    )
+    source_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True, comment='数据来源URL')
     
     def __init__(
         self,
@@ -98,27 +91,6 @@ class AddressInfo(db.Model):
         """返回对象的字符串表示"""
         return f"<AddressInfo(id={self.id}, address='{self.address}', city='{self.city}', country='{self.country}')>"
     
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        将地址信息对象转换为字典
-        
-        Returns:
-            Dict[str, Any]: 地址数据的字典表示
-        """
-        return {
-            'id': self.id,
-            'address': self.address,
-            'telephone': self.telephone,
-            'city': self.city,
-            'zip_code': self.zip_code,
-            'state': self.state,
-            'state_full': self.state_full,
-            'country': self.country,
-            'source_url': self.source_url,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
-    
     @property
     def full_address(self) -> str:
         """
@@ -127,21 +99,9 @@ class AddressInfo(db.Model):
         Returns:
             str: 完整地址字符串
         """
-        parts = []
-        if self.address:
-            parts.append(self.address)
-        if self.city:
-            parts.append(self.city)
-        if self.state_full:
-            parts.append(self.state_full)
-        elif self.state:
-            parts.append(self.state)
-        if self.country:
-            parts.append(self.country)
-        if self.zip_code:
-            parts.append(self.zip_code)
-        
-        return ', '.join(parts) if parts else self.address
+        state = self.state_full or self.state
+        parts = (self.address, self.city, state, self.country, self.zip_code)
+        return ', '.join(filter(None, parts)) or self.address
     
     @property
     def has_contact_info(self) -> bool:
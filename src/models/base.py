@@ -0,0 +1,78 @@
+"""
+模型公共基础模块
+
+该模块提供各数据库模型共用的混入类，包括创建/更新时间戳字段，
+以及基于字段元组的字典序列化方法。
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Tuple
+from sqlalchemy import DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+
+class TimestampMixin:
+    """
+    时间戳字段混入类
+    
+    为模型提供 created_at 与 updated_at 字段。
+    """
+    
+    # 保留Python端默认值以获得微秒精度（SQLite 的 CURRENT_TIMESTAMP 只到秒），
+    # server_default 仅用于绕过ORM直接写入的场景
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=func.now(),
+        comment='创建时间'
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=datetime.utcnow,
+        comment='更新时间'
+    )
+
+
+class SerializableMixin:
+    """
+    字典序列化混入类
+    
+    模型只需声明 _SERIALIZABLE_FIELDS，to_dict / __json__ 按该元组输出字段，
+    _TIMESTAMP_FIELDS 中的时间戳字段单独处理。
+    """
+    
+    _SERIALIZABLE_FIELDS: Tuple[str, ...] = ()
+    _TIMESTAMP_FIELDS: Tuple[str, ...] = ('created_at', 'updated_at')
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        将模型对象转换为字典
+        
+        Returns:
+            Dict[str, Any]: 模型数据的字典表示，时间戳为ISO格式字符串
+        """
+        data = {field: getattr(self, field) for field in self._SERIALIZABLE_FIELDS}
+        for field in self._TIMESTAMP_FIELDS:
+            value = getattr(self, field)
+            data[field] = value.isoformat() if value else None
+        return data
+    
+    def __json__(self) -> Dict[str, Any]:
+        """
+        返回供 orjson 等序列化器使用的字典
+        
+        时间戳保留为 datetime 对象，由序列化器直接格式化，
+        例如 orjson.dumps(items, default=lambda o: o.__json__())。
+        
+        Returns:
+            Dict[str, Any]: 字段名到原始字段值的字典
+        """
+        return {
+            field: getattr(self, field)
+            for field in self._SERIALIZABLE_FIELDS + self._TIMESTAMP_FIELDS
+        }
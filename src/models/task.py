@@ -5,14 +5,15 @@
 包括URL、请求方法、请求体、头部信息、任务状态等核心字段。
 """
 
-from datetime import datetime
-from typing import Optional, Dict, Any
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
-from sqlalchemy.sql import func
+from typing import Optional, Dict, Any, Iterable
+from sqlalchemy import Index, Integer, String, Text, JSON, case, inspect, update
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm.attributes import set_committed_value
 from src.app import db
+from src.models.base import SerializableMixin, TimestampMixin
 
 
-class Task(db.Model):
+class Task(TimestampMixin, SerializableMixin, db.Model):
     """
     任务模型类
     
@@ -21,41 +22,34 @@ class Task(db.Model):
     """
     
     __tablename__ = 'tasks'
+    __table_args__ = (
+        # 待处理任务扫描：按 total_num 过滤后按创建时间取最早的任务
+        Index('ix_tasks_total_created', 'total_num', 'created_at'),
+        # 完成状态判断（visited_num 与 total_num 比较）可只扫描索引
+        Index('ix_tasks_total_visited', 'total_num', 'visited_num'),
+    )
+    
+    # to_dict / __json__ 输出的字段，时间戳字段由 SerializableMixin 处理
+    _SERIALIZABLE_FIELDS = ('id', 'url', 'method', 'body', 'headers', 'total_num',
+                            'visited_num', 'timeout', 'retry_count')
     
     # 主键
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
     # 任务核心字段
-    url = Column(String(2048), nullable=False, index=True, comment='目标URL')
-    method = Column(String(10), nullable=False, default='GET', comment='HTTP请求方法')
-    body = Column(Text, nullable=True, comment='请求体内容')
-    headers = Column(JSON, nullable=True, default=dict, comment='HTTP请求头')
+    url: Mapped[str] = mapped_column(String(2048), nullable=False, index=True, comment='目标URL')
+    method: Mapped[str] = mapped_column(String(10), nullable=False, default='GET', comment='HTTP请求方法')
+    body: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment='请求体内容')
+    headers: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True, default=dict, comment='HTTP请求头')
     
     # 任务统计字段
-    total_num = Column(Integer, nullable=False, default=0, comment='预期爬取数量')
-    visited_num = Column(Integer, nullable=False, default=0, comment='已访问数量')
+    total_num: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment='预期爬取数量')
+    visited_num: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment='已访问数量')
     
     
     # 任务配置字段
-    timeout = Column(Integer, nullable=False, default=30, comment='请求超时时间(秒)')
-    retry_count = Column(Integer, nullable=False, default=0, comment='重试次数')
-    
-    # 时间戳字段
-    created_at = Column(
-        DateTime, 
-        nullable=False, 
-        default=datetime.utcnow,
-        server_default=func.now(),
-        comment='创建时间'
-    )
-    updated_at = Column(
-        DateTime, 
-        nullable=False, 
-        default=datetime.utcnow,
-        server_default=func.now(),
-        onupdate=datetime.utcnow,
-        comment='更新时间'
-    )
+    timeout: Mapped[int] = mapped_column(Integer, nullable=False, default=30, comment='请求超时时间(秒)')
+    retry_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment='重试次数')
     
     def __init__(
         self,
@@ -97,40 +91,84 @@ class Task(db.Model):
         """返回对象的字符串表示"""
         return f"<Task(id={self.id}, url='{self.url}', completion_rate={self.completion_rate:.2f})>"
     
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        将任务对象转换为字典
-        
-        Returns:
-            Dict[str, Any]: 任务数据的字典表示
-        """
-        return {
-            'id': self.id,
-            'url': self.url,
-            'method': self.method,
-            'body': self.body,
-            'headers': self.headers,
-            'total_num': self.total_num,
-            'visited_num': self.visited_num,
-            'timeout': self.timeout,
-            'retry_count': self.retry_count,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
-    
     def increment_visited(self, count: int = 1) -> None:
         """
         增加已访问数量
         
+        已持久化的任务直接在数据库中执行 visited_num = visited_num + count，
+        并发执行的爬虫不会相互覆盖计数；内存中的值同步为本地累加结果。
+        尚未保存的任务只修改内存中的值。
+        
         Args:
             count: 增加的数量，默认为1
         """
-        self.visited_num += count
+        if not inspect(self).persistent:
+            self.visited_num = (self.visited_num or 0) + count
+            return
+        
+        db.session.execute(
+            update(Task)
+            .where(Task.id == self.id)
+            .values(visited_num=Task.visited_num + count)
+            .execution_options(synchronize_session=False)
+        )
+        set_committed_value(self, 'visited_num', (self.visited_num or 0) + count)
+    
+    @classmethod
+    def bulk_increment_visited(cls, counts: Dict[int, int]) -> int:
+        """
+        批量增加多个任务的已访问数量
+        
+        使用一条 UPDATE ... SET visited_num = visited_num + CASE id ... END 语句，
+        N 个任务只需一次数据库往返。
+        
+        Args:
+            counts: 任务ID到增加数量的映射
+            
+        Returns:
+            int: 受影响的行数
+        """
+        if not counts:
+            return 0
+        
+        result = db.session.execute(
+            update(cls)
+            .where(cls.id.in_(counts))
+            .values(visited_num=cls.visited_num + case(counts, value=cls.id, else_=0))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
     
     def increment_retry(self) -> None:
         """增加重试次数"""
         self.retry_count += 1
     
+    @classmethod
+    def bulk_increment_retry(cls, task_ids: Iterable[int]) -> int:
+        """
+        将多个任务的重试次数各加1
+        
+        使用一条 UPDATE ... SET retry_count = retry_count + 1 WHERE id IN (...) 语句，
+        N 个失败任务只需一次数据库往返。
+        
+        Args:
+            task_ids: 任务ID集合
+            
+        Returns:
+            int: 受影响的行数
+        """
+        task_ids = list(task_ids)
+        if not task_ids:
+            return 0
+        
+        result = db.session.execute(
+            update(cls)
+            .where(cls.id.in_(task_ids))
+            .values(retry_count=cls.retry_count + 1)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
     
     @property
     def completion_rate(self) -> float:
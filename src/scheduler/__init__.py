@@ -13,6 +13,10 @@
 """
 
 import logging
+import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
 from typing import Dict, Any, Optional, Union
 from datetime import datetime
 import pytz
@@ -42,6 +46,14 @@ TRIGGER_TYPE_DATE = "date"
 TRIGGER_TYPE_INTERVAL = "interval"
 TRIGGER_TYPE_CRON = "cron"
 
+# 各类型触发器可接受的参数
+_TRIGGER_KEYS = {
+    TRIGGER_TYPE_DATE: ("run_date",),
+    TRIGGER_TYPE_INTERVAL: ("seconds", "minutes", "hours", "days", "start_date", "end_date"),
+    TRIGGER_TYPE_CRON: ("year", "month", "day", "week", "day_of_week",
+                        "hour", "minute", "second", "start_date", "end_date"),
+}
+
 # 默认时间格式
 DEFAULT_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 DEFAULT_DATE_FORMAT = "%Y-%m-%d"
@@ -54,6 +66,26 @@ EVENT_JOB_MISSED = "job_missed"
 # 最大历史记录大小
 MAX_HISTORY_SIZE = 1000
 
+# 作业ID只允许字母、数字、下划线和连字符
+_JOB_ID_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+
+
+@lru_cache(maxsize=None)
+def _get_timezone(name: str) -> pytz.BaseTzInfo:
+    """按名称获取并缓存时区对象
+    
+    Args:
+        name: 时区名称
+        
+    Returns:
+        pytz.BaseTzInfo: 时区对象
+    """
+    return pytz.timezone(name)
+
+
+# 默认时区在导入时解析一次
+_DEFAULT_TZ = _get_timezone(SCHEDULER_CONFIG_DEFAULTS["timezone"])
+
 
 def get_default_timezone() -> pytz.BaseTzInfo:
     """获取默认时区
@@ -61,7 +93,7 @@ def get_default_timezone() -> pytz.BaseTzInfo:
     Returns:
         pytz.BaseTzInfo: 默认时区对象
     """
-    return pytz.timezone(SCHEDULER_CONFIG_DEFAULTS["timezone"])
+    return _get_timezone(SCHEDULER_CONFIG_DEFAULTS["timezone"])
 
 
 def format_datetime(dt: datetime, fmt: str = DEFAULT_DATETIME_FORMAT) -> str:
@@ -79,6 +111,11 @@ def format_datetime(dt: datetime, fmt: str = DEFAULT_DATETIME_FORMAT) -> str:
     return dt.strftime(fmt)
 
 
+def _is_ascii_digits(value: str) -> bool:
+    """判断字符串是否全部由ASCII数字组成"""
+    return value.isascii() and value.isdigit()
+
+
 def parse_datetime(dt_str: str, fmt: str = DEFAULT_DATETIME_FORMAT) -> Optional[datetime]:
     """解析日期时间字符串
     
@@ -90,6 +127,17 @@ def parse_datetime(dt_str: str, fmt: str = DEFAULT_DATETIME_FORMAT) -> Optional[
         Optional[datetime]: 解析后的日期时间对象，失败时返回None
     """
     try:
+        # 默认格式与ISO格式一致，优先使用C实现的 fromisoformat；
+        # 限定长度、分隔符和ASCII数字，避免接受 ISO 周日期等 strptime 不接受的输入
+        if (fmt == DEFAULT_DATETIME_FORMAT and len(dt_str) == 19
+                and dt_str[4] == dt_str[7] == "-" and dt_str[10] == " "
+                and dt_str[13] == dt_str[16] == ":"
+                and _is_ascii_digits(dt_str[:4] + dt_str[5:7] + dt_str[8:10]
+                                     + dt_str[11:13] + dt_str[14:16] + dt_str[17:])):
+            try:
+                return datetime.fromisoformat(dt_str)
+            except ValueError:
+                pass
         return datetime.strptime(dt_str, fmt)
     except (ValueError, TypeError):
         return None
@@ -106,49 +154,22 @@ def create_trigger(trigger_type: str, **kwargs) -> Optional[Dict[str, Any]]:
         Optional[Dict[str, Any]]: 触发器配置字典，失败时返回None
     """
     try:
-        trigger_config = {"type": trigger_type}
-        
-        if trigger_type == TRIGGER_TYPE_DATE:
-            # 日期触发器 - 指定具体执行时间
-            if "run_date" in kwargs:
-                trigger_config["run_date"] = kwargs["run_date"]
-            elif "date_str" in kwargs:
-                trigger_config["run_date"] = parse_datetime(kwargs["date_str"])
-            
-        elif trigger_type == TRIGGER_TYPE_INTERVAL:
-            # 间隔触发器 - 指定间隔时间
-            if "seconds" in kwargs:
-                trigger_config["seconds"] = kwargs["seconds"]
-            if "minutes" in kwargs:
-                trigger_config["minutes"] = kwargs["minutes"]
-            if "hours" in kwargs:
-                trigger_config["hours"] = kwargs["hours"]
-            if "days" in kwargs:
-                trigger_config["days"] = kwargs["days"]
-            if "start_date" in kwargs:
-                trigger_config["start_date"] = kwargs["start_date"]
-            if "end_date" in kwargs:
-                trigger_config["end_date"] = kwargs["end_date"]
-                
-        elif trigger_type == TRIGGER_TYPE_CRON:
-            # Cron触发器 - 指定Cron表达式
-            cron_fields = ["year", "month", "day", "week", "day_of_week", 
-                          "hour", "minute", "second"]
-            for field in cron_fields:
-                if field in kwargs:
-                    trigger_config[field] = kwargs[field]
-            if "start_date" in kwargs:
-                trigger_config["start_date"] = kwargs["start_date"]
-            if "end_date" in kwargs:
-                trigger_config["end_date"] = kwargs["end_date"]
-        else:
+        keys = _TRIGGER_KEYS.get(trigger_type)
+        if keys is None:
             logging.warning(f"不支持的触发器类型: {trigger_type}")
             return None
-            
+        
+        trigger_config = {"type": trigger_type}
+        trigger_config.update((key, kwargs[key]) for key in keys if key in kwargs)
+        
+        # 日期触发器未指定 run_date 时，解析日期字符串
+        if (trigger_type == TRIGGER_TYPE_DATE and "run_date" not in trigger_config
+                and "date_str" in kwargs):
+            trigger_config["run_date"] = parse_datetime(kwargs["date_str"])
+        
         # 设置默认时区
-        if "timezone" not in trigger_config:
-            trigger_config["timezone"] = get_default_timezone()
-            
+        trigger_config["timezone"] = _DEFAULT_TZ
+        
         return trigger_config
         
     except Exception as e:
@@ -168,9 +189,7 @@ def validate_job_id(job_id: str) -> bool:
     if not job_id or not isinstance(job_id, str):
         return False
     
-    # 作业ID应该只包含字母、数字、下划线和连字符
-    import re
-    return bool(re.match(r'^[a-zA-Z0-9_-]+$', job_id))
+    return _JOB_ID_RE.match(job_id) is not None
 
 
 def generate_job_id(prefix: str = "job", suffix: str = "") -> str:
@@ -183,8 +202,7 @@ def generate_job_id(prefix: str = "job", suffix: str = "") -> str:
     Returns:
         str: 生成的作业ID
     """
-    import uuid
-    unique_id = str(uuid.uuid4()).replace("-", "")[:8]
+    unique_id = uuid.uuid4().hex[:8]
     job_id = f"{prefix}_{unique_id}"
     if suffix:
         job_id = f"{job_id}_{suffix}"
@@ -235,38 +253,30 @@ def safe_stop_scheduler(wait: bool = True, timeout: int = 30) -> bool:
         bool: 是否成功停止
     """
     try:
-        import threading
-        import time
-        
         scheduler = get_scheduler()
         if not scheduler.is_running:
             return True
-            
-        # 使用线程来避免阻塞
-        stop_result = {"success": False}
         
-        def stop_worker():
+        # 在单个工作线程中停止调度器，超时后不等待该线程结束，避免阻塞调用方
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sched-stop")
+        try:
+            future = executor.submit(scheduler.stop, wait=wait)
             try:
-                stop_result["success"] = scheduler.stop(wait=wait)
+                return future.result(timeout=timeout)
+            except FutureTimeoutError:
+                logging.warning(f"停止调度器超时（{timeout}秒），强制终止")
+                # 强制停止
+                try:
+                    scheduler.stop(wait=False)
+                    return True
+                except Exception as e:
+                    logging.error(f"强制停止调度器失败: {e}")
+                    return False
             except Exception as e:
                 logging.error(f"停止调度器时发生错误: {e}")
-                stop_result["success"] = False
-        
-        stop_thread = threading.Thread(target=stop_worker)
-        stop_thread.start()
-        stop_thread.join(timeout=timeout)
-        
-        if stop_thread.is_alive():
-            logging.warning(f"停止调度器超时（{timeout}秒），强制终止")
-            # 强制停止
-            try:
-                scheduler.stop(wait=False)
-                return True
-            except Exception as e:
-                logging.error(f"强制停止调度器失败: {e}")
                 return False
-                
-        return stop_result.get("success", False)
+        finally:
+            executor.shutdown(wait=False)
         
     except Exception as e:
         logging.error(f"安全停止调度器失败: {e}")
@@ -12,9 +12,16 @@
 """
 
 import logging
+import threading
 import time
-from typing import Optional, Dict, Any, Callable, Union
-from datetime import datetime
+from array import array
+from contextlib import AbstractContextManager, nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import wraps
+from collections import deque
+from itertools import chain, islice
+from typing import Optional, Dict, Any, Callable, Iterator, Tuple, Union
+from datetime import datetime, timedelta
 import pytz
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.job import Job
@@ -23,14 +30,38 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
+from flask import has_app_context
+from sqlalchemy import Row, bindparam, case, func, select
 
+from src.app import create_app, db
 from src.config import get_scheduler_config
-from src.utils.logger import get_logger
+from src.utils.logger import get_logger, queue_logger
 from src.utils.database import get_session
+from src.utils.counters import ShardedCounter
 from src.models.task import Task
 from src.services.crawler_service import CrawlerService
 
 
+def _listener_guard(listener: Callable) -> Callable:
+    """调度事件监听器的统一异常边界
+    
+    监听器本身不再包含 try/except，异常在此处统一记录，避免影响调度线程。
+    
+    Args:
+        listener: 监听器方法
+        
+    Returns:
+        Callable: 包装后的监听器方法
+    """
+    @wraps(listener)
+    def wrapper(self, event) -> None:
+        try:
+            listener(self, event)
+        except Exception:
+            self.logger.exception(f"处理调度事件失败 ({listener.__name__}): {getattr(event, 'job_id', None)}")
+    return wrapper
+
+
 class TaskStatistics:
     """任务统计类
     
@@ -47,61 +78,85 @@ class TaskStatistics:
         execution_history: 最近执行历史记录
     """
     
-    def __init__(self) -> None:
-        """初始化任务统计实例"""
-        self.success_count: int = 0
-        self.failure_count: int = 0
-        self.skipped_count: int = 0
-        self.total_executions: int = 0
+    def __init__(self, enable_history: bool = True) -> None:
+        """初始化任务统计实例
+        
+        Args:
+            enable_history: 是否记录执行历史，关闭后只维护计数和时间
+        """
+        self._enable_history: bool = enable_history
+        # 计数由调度器监听线程并发写入，使用分片计数器避免争用
+        self._success_counter = ShardedCounter()
+        self._failure_counter = ShardedCounter()
+        self._skipped_counter = ShardedCounter()
+        self._total_counter = ShardedCounter()
+        # 计数及比率快照：写入时只置脏标记，读取时按需重算
+        self._rates_dirty: bool = True
+        self._cached_rates: Dict[str, Any] = {}
+        # 最近时间戳为覆盖写语义，统一由一把锁保护
+        self._time_lock = threading.Lock()
         self.last_execution_time: Optional[datetime] = None
         self.last_success_time: Optional[datetime] = None
         self.last_failure_time: Optional[datetime] = None
-        self.execution_history: list[Dict[str, Any]] = []
         self._max_history_size: int = 1000  # 最多保留1000条历史记录
+        # 环形缓冲区：超出容量时自动淘汰最早的记录
+        self.execution_history: deque[Dict[str, Any]] = deque(maxlen=self._max_history_size)
     
-    def record_success(self, job_id: str, job_name: Optional[str] = None) -> None:
+    def record_success(self, job_id: str, job_name: Optional[str] = None,
+                       now: Optional[datetime] = None) -> None:
         """记录成功的任务执行
         
         Args:
             job_id: 作业ID
             job_name: 作业名称
+            now: 事件发生时间，调用方已取得当前时间时传入以复用
         """
-        current_time = datetime.now()
-        self.success_count += 1
-        self.total_executions += 1
-        self.last_execution_time = current_time
-        self.last_success_time = current_time
+        current_time = now or datetime.now()
+        self._success_counter.add()
+        self._total_counter.add()
+        self._rates_dirty = True
+        with self._time_lock:
+            self.last_execution_time = current_time
+            self.last_success_time = current_time
         
         self._add_to_history(job_id, job_name, 'success', current_time)
     
-    def record_failure(self, job_id: str, job_name: Optional[str] = None, error: Optional[str] = None) -> None:
+    def record_failure(self, job_id: str, job_name: Optional[str] = None, error: Optional[str] = None,
+                       now: Optional[datetime] = None) -> None:
         """记录失败的任务执行
         
         Args:
             job_id: 作业ID
             job_name: 作业名称
             error: 错误信息
+            now: 事件发生时间，调用方已取得当前时间时传入以复用
         """
-        current_time = datetime.now()
-        self.failure_count += 1
-        self.total_executions += 1
-        self.last_execution_time = current_time
-        self.last_failure_time = current_time
+        current_time = now or datetime.now()
+        self._failure_counter.add()
+        self._total_counter.add()
+        self._rates_dirty = True
+        with self._time_lock:
+            self.last_execution_time = current_time
+            self.last_failure_time = current_time
         
         self._add_to_history(job_id, job_name, 'failure', current_time, error)
     
-    def record_skipped(self, job_id: str, job_name: Optional[str] = None, reason: Optional[str] = None) -> None:
+    def record_skipped(self, job_id: str, job_name: Optional[str] = None, reason: Optional[str] = None,
+                       now: Optional[datetime] = None) -> None:
         """记录被跳过的任务执行
         
         Args:
             job_id: 作业ID
             job_name: 作业名称
             reason: 跳过原因
+            now: 事件发生时间，调用方已取得当前时间时传入以复用
         """
-        current_time = datetime.now()
-        self.skipped_count += 1
-        self.total_executions += 1
-        self.last_execution_time = current_time
+        current_time = now or datetime.now()
+        self._skipped_counter.add()
+        self._total_counter.add()
+        self._rates_dirty = True
+        with self._time_lock:
+            self.last_execution_time = current_time
         
         self._add_to_history(job_id, job_name, 'skipped', current_time, reason)
     
@@ -113,37 +168,82 @@ class TaskStatistics:
             job_id: 作业ID
             job_name: 作业名称
             status: 执行状态
-            timestamp: 时间戳
+            timestamp: 时间戳，保留 datetime 对象，读取摘要时再格式化
             details: 详细信息
         """
+        if not self._enable_history:
+            return
+        
         history_entry = {
             'job_id': job_id,
             'job_name': job_name,
             'status': status,
-            'timestamp': timestamp.isoformat(),
+            'timestamp': timestamp,
             'details': details
         }
         
         self.execution_history.append(history_entry)
+    
+    @property
+    def success_count(self) -> int:
+        """成功执行的任务数量"""
+        return self._success_counter.value()
+    
+    @property
+    def failure_count(self) -> int:
+        """执行失败的任务数量"""
+        return self._failure_counter.value()
+    
+    @property
+    def skipped_count(self) -> int:
+        """被跳过的任务数量"""
+        return self._skipped_counter.value()
+    
+    @property
+    def total_executions(self) -> int:
+        """总执行次数"""
+        return self._total_counter.value()
+    
+    def _get_rates(self) -> Dict[str, Any]:
+        """获取计数与比率快照
+        
+        仅在有新记录写入后重新计算，否则复用上次结果。
         
-        # 限制历史记录大小
-        if len(self.execution_history) > self._max_history_size:
-            self.execution_history.pop(0)
+        Returns:
+            Dict[str, Any]: 各计数及对应比率
+        """
+        if self._rates_dirty:
+            # 先清除标记，重算期间的新写入会再次置脏
+            self._rates_dirty = False
+            success_count = self.success_count
+            failure_count = self.failure_count
+            skipped_count = self.skipped_count
+            total_executions = self.total_executions
+            
+            def rate(count: int) -> float:
+                return count / total_executions if total_executions else 0.0
+            
+            self._cached_rates = {
+                'success_count': success_count,
+                'failure_count': failure_count,
+                'skipped_count': skipped_count,
+                'total_executions': total_executions,
+                'success_rate': rate(success_count),
+                'failure_rate': rate(failure_count),
+                'skipped_rate': rate(skipped_count)
+            }
+        return self._cached_rates
     
     def get_statistics(self) -> Dict[str, Any]:
         """获取统计信息
         
+        各计数只读取一次，比率基于同一份快照计算。
+        
         Returns:
             Dict[str, Any]: 包含所有统计信息的字典
         """
         return {
-            'success_count': self.success_count,
-            'failure_count': self.failure_count,
-            'skipped_count': self.skipped_count,
-            'total_executions': self.total_executions,
-            'success_rate': self._calculate_success_rate(),
-            'failure_rate': self._calculate_failure_rate(),
-            'skipped_rate': self._calculate_skipped_rate(),
+            **self._get_rates(),
             'last_execution_time': self.last_execution_time.isoformat() if self.last_execution_time else None,
             'last_success_time': self.last_success_time.isoformat() if self.last_success_time else None,
             'last_failure_time': self.last_failure_time.isoformat() if self.last_failure_time else None
@@ -152,102 +252,130 @@ class TaskStatistics:
     def get_execution_summary(self) -> Dict[str, Any]:
         """获取执行摘要
         
+        未启用执行历史时 recent_executions 为空列表，history_enabled 为 False。
+        
         Returns:
             Dict[str, Any]: 执行摘要信息
         """
-        recent_history = self.execution_history[-10:] if self.execution_history else []
+        recent_history = self.get_recent_executions(10)
+        stats = self.get_statistics()
         
         return {
-            'total_executions': self.total_executions,
-            'success_rate': self._calculate_success_rate(),
-            'failure_rate': self._calculate_failure_rate(),
+            'total_executions': stats['total_executions'],
+            'success_rate': stats['success_rate'],
+            'failure_rate': stats['failure_rate'],
             'recent_executions': recent_history,
-            'statistics': self.get_statistics()
+            'history_enabled': self._enable_history,
+            'statistics': stats
         }
     
-    def reset(self) -> None:
-        """重置所有统计数据"""
-        self.success_count = 0
-        self.failure_count = 0
-        self.skipped_count = 0
-        self.total_executions = 0
-        self.last_execution_time = None
-        self.last_success_time = None
-        self.last_failure_time = None
-        self.execution_history.clear()
-    
-    def _calculate_success_rate(self) -> float:
-        """计算成功率
+    def get_recent_executions(self, count: int) -> list[Dict[str, Any]]:
+        """获取最近若干条执行记录
         
-        Returns:
-            float: 成功率(0-1之间的小数)
-        """
-        if self.total_executions == 0:
-            return 0.0
-        return self.success_count / self.total_executions
-    
-    def _calculate_failure_rate(self) -> float:
-        """计算失败率
+        只遍历历史记录末尾的 count 条，时间戳在此时格式化。
         
+        Args:
+            count: 返回的记录条数上限
+            
         Returns:
-            float: 失败率(0-1之间的小数)
+            list[Dict[str, Any]]: 按时间先后排列的执行记录
         """
-        if self.total_executions == 0:
-            return 0.0
-        return self.failure_count / self.total_executions
+        history = self.execution_history
+        return [
+            {**entry, 'timestamp': entry['timestamp'].isoformat()}
+            for entry in islice(history, max(0, len(history) - count), None)
+        ]
     
-    def _calculate_skipped_rate(self) -> float:
-        """计算跳过率
-        
-        Returns:
-            float: 跳过率(0-1之间的小数)
-        """
-        if self.total_executions == 0:
-            return 0.0
-        return self.skipped_count / self.total_executions
+    def reset(self) -> None:
+        """重置所有统计数据"""
+        self._success_counter.reset()
+        self._failure_counter.reset()
+        self._skipped_counter.reset()
+        self._total_counter.reset()
+        self._rates_dirty = True
+        with self._time_lock:
+            self.last_execution_time = None
+            self.last_success_time = None
+            self.last_failure_time = None
+        self.execution_history.clear()
 
 
 class PerformanceMetrics:
     """性能指标记录器
     
     用于记录和跟踪调度器的性能指标，包括执行时间、内存使用等。
+    作业指标按列存储在并行的定长数组中（结构数组），作业ID映射到行号；
+    系统级只维护累计耗时、次数与最值，平均值在读取时计算。
     
     Attributes:
         start_time: 记录开始时间
-        job_metrics: 作业级别的性能指标
-        system_metrics: 系统级别的性能指标
+        job_metrics: 作业级别的性能指标（读取时生成）
+        system_metrics: 系统级别的性能指标（读取时生成）
     """
     
     def __init__(self) -> None:
         """初始化性能指标记录器"""
         self.start_time: datetime = datetime.now()
-        self.job_metrics: Dict[str, Dict[str, Any]] = {}
-        self.system_metrics: Dict[str, Any] = {
-            'total_execution_time': 0.0,
-            'average_execution_time': 0.0,
-            'max_execution_time': 0.0,
-            'min_execution_time': float('inf'),
-            'execution_count': 0
-        }
+        self._start_mono_ns: int = time.monotonic_ns()
+        # 新作业分配行号时加锁，已知作业的读写不经过该锁
+        self._rows_lock = threading.Lock()
+        self._reset_columns()
+    
+    def _reset_columns(self) -> None:
+        """清空所有作业指标列及系统累计值"""
+        self._rows: Dict[str, int] = {}
+        # 各列均为整数纳秒（perf_counter_ns），仅在读取时换算为毫秒
+        self._start_ns = array('q')   # 当前执行的开始时刻，-1 表示未在执行
+        self._count = array('q')      # 执行次数
+        self._total_ns = array('q')   # 累计耗时
+        self._max_ns = array('q')     # 最大耗时
+        self._min_ns = array('q')     # 最小耗时，-1 表示尚未完成过
+        self._last_ns = array('q')    # 最近一次耗时，-1 表示尚未完成过
+        # 系统级累计值随每次作业结束更新，平均值在读取时计算
+        self._sys_count = 0
+        self._sys_total_ns = 0
+        self._sys_max_ns = 0
+        self._sys_min_ns = -1
+    
+    def _add_row(self, job_id: str) -> int:
+        """为新作业追加一行初始值
+        
+        行号的分配与各列的追加在锁内完成，并发出现的新作业不会分到同一行；
+        各列追加完毕后才登记行号，无锁读取行号的线程不会访问到不存在的行。
+        
+        Args:
+            job_id: 作业ID
+            
+        Returns:
+            int: 作业的行号（其他线程已为该作业分配行时返回该行）
+        """
+        with self._rows_lock:
+            row = self._rows.get(job_id)
+            if row is not None:
+                return row
+            
+            row = len(self._count)
+            self._start_ns.append(-1)
+            self._count.append(0)
+            self._total_ns.append(0)
+            self._max_ns.append(0)
+            self._min_ns.append(-1)
+            self._last_ns.append(-1)
+            self._rows[job_id] = row
+            return row
     
     def record_job_start(self, job_id: str) -> None:
         """记录作业开始执行
         
+        已知作业只做一次字典查找，首次出现时才追加新行。
+        
         Args:
             job_id: 作业ID
         """
-        if job_id not in self.job_metrics:
-            self.job_metrics[job_id] = {
-                'start_time': None,
-                'execution_count': 0,
-                'total_time': 0.0,
-                'average_time': 0.0,
-                'max_time': 0.0,
-                'min_time': float('inf'),
-                'last_execution_time': None
-            }
-        
-        self.job_metrics[job_id]['start_time'] = time.time()
+        row = self._rows.get(job_id)
+        if row is None:
+            row = self._add_row(job_id)
+        self._start_ns[row] = time.perf_counter_ns()
     
     def record_job_end(self, job_id: str, success: bool = True, error: Optional[str] = None) -> None:
         """记录作业结束执行
@@ -257,40 +385,73 @@ class PerformanceMetrics:
             success: 是否执行成功
             error: 错误信息（如果失败）
         """
-        if job_id not in self.job_metrics:
+        row = self._rows.get(job_id)
+        if row is None:
             return
         
-        start_time = self.job_metrics[job_id]['start_time']
-        if start_time is None:
+        start_ns = self._start_ns[row]
+        if start_ns < 0:
             return
         
-        # 计算执行时间（毫秒）
-        execution_time = (time.time() - start_time) * 1000
-        
-        # 更新作业指标
-        metrics = self.job_metrics[job_id]
-        metrics['execution_count'] += 1
-        metrics['total_time'] += execution_time
-        metrics['average_time'] = metrics['total_time'] / metrics['execution_count']
-        metrics['max_time'] = max(metrics['max_time'], execution_time)
-        metrics['min_time'] = min(metrics['min_time'], execution_time)
-        metrics['last_execution_time'] = execution_time
-        
-        # 更新系统指标
-        self.system_metrics['total_execution_time'] += execution_time
-        self.system_metrics['execution_count'] += 1
-        self.system_metrics['average_execution_time'] = (
-            self.system_metrics['total_execution_time'] / self.system_metrics['execution_count']
-        )
-        self.system_metrics['max_execution_time'] = max(
-            self.system_metrics['max_execution_time'], execution_time
-        )
-        self.system_metrics['min_execution_time'] = min(
-            self.system_metrics['min_execution_time'], execution_time
-        )
+        dt_ns = time.perf_counter_ns() - start_ns
+        
+        self._count[row] += 1
+        self._total_ns[row] += dt_ns
+        if dt_ns > self._max_ns[row]:
+            self._max_ns[row] = dt_ns
+        if self._min_ns[row] < 0 or dt_ns < self._min_ns[row]:
+            self._min_ns[row] = dt_ns
+        self._last_ns[row] = dt_ns
+        
+        self._sys_count += 1
+        self._sys_total_ns += dt_ns
+        if dt_ns > self._sys_max_ns:
+            self._sys_max_ns = dt_ns
+        if self._sys_min_ns < 0 or dt_ns < self._sys_min_ns:
+            self._sys_min_ns = dt_ns
+        
+        # 重置开始时刻
+        self._start_ns[row] = -1
+    
+    def _job_metrics_at(self, row: int) -> Dict[str, Any]:
+        """将指定行转换为作业指标字典（耗时单位为毫秒）
         
-        # 重置开始时间
-        metrics['start_time'] = None
+        Args:
+            row: 行号
+            
+        Returns:
+            Dict[str, Any]: 作业性能指标
+        """
+        count = self._count[row]
+        start_ns = self._start_ns[row]
+        last_ns = self._last_ns[row]
+        return {
+            'start_ns': None if start_ns < 0 else start_ns,
+            'execution_count': count,
+            'total_time': self._total_ns[row] / 1e6,
+            'average_time': self._total_ns[row] / count / 1e6 if count else 0.0,
+            'max_time': self._max_ns[row] / 1e6,
+            'min_time': self._min_ns[row] / 1e6 if count else 0.0,
+            'last_execution_time': None if last_ns < 0 else last_ns / 1e6
+        }
+    
+    @property
+    def job_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """所有作业的性能指标"""
+        return {job_id: self._job_metrics_at(row) for job_id, row in self._rows.items()}
+    
+    @property
+    def system_metrics(self) -> Dict[str, Any]:
+        """系统性能指标（耗时单位为毫秒）"""
+        execution_count = self._sys_count
+        total_ns = self._sys_total_ns
+        return {
+            'total_execution_time': total_ns / 1e6,
+            'average_execution_time': total_ns / execution_count / 1e6 if execution_count else 0.0,
+            'max_execution_time': self._sys_max_ns / 1e6,
+            'min_execution_time': max(self._sys_min_ns, 0) / 1e6,
+            'execution_count': execution_count
+        }
     
     def get_job_metrics(self, job_id: str) -> Dict[str, Any]:
         """获取指定作业的性能指标
@@ -301,26 +462,32 @@ class PerformanceMetrics:
         Returns:
             Dict[str, Any]: 作业性能指标
         """
-        return self.job_metrics.get(job_id, {})
+        row = self._rows.get(job_id)
+        return {} if row is None else self._job_metrics_at(row)
     
     def get_system_metrics(self) -> Dict[str, Any]:
         """获取系统性能指标
         
+        返回的字典一次性构建出全部键，避免追加键时扩容。
+        
         Returns:
             Dict[str, Any]: 系统性能指标
         """
-        metrics = self.system_metrics.copy()
-        
-        # 计算运行时长
-        uptime = (datetime.now() - self.start_time).total_seconds()
-        metrics['uptime_seconds'] = uptime
-        metrics['uptime_formatted'] = str(datetime.now() - self.start_time)
+        execution_count = self._sys_count
+        total_ns = self._sys_total_ns
         
-        # 如果min_time仍然是inf，设置为0
-        if metrics['min_execution_time'] == float('inf'):
-            metrics['min_execution_time'] = 0.0
+        # 基于单调时钟计算运行时长
+        uptime_ns = time.monotonic_ns() - self._start_mono_ns
         
-        return metrics
+        return {
+            'total_execution_time': total_ns / 1e6,
+            'average_execution_time': total_ns / execution_count / 1e6 if execution_count else 0.0,
+            'max_execution_time': self._sys_max_ns / 1e6,
+            'min_execution_time': max(self._sys_min_ns, 0) / 1e6,
+            'execution_count': execution_count,
+            'uptime_seconds': uptime_ns / 1e9,
+            'uptime_formatted': str(timedelta(microseconds=uptime_ns // 1000))
+        }
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """获取性能摘要
@@ -329,12 +496,12 @@ class PerformanceMetrics:
             Dict[str, Any]: 性能摘要信息
         """
         system_metrics = self.get_system_metrics()
-        job_count = len(self.job_metrics)
+        job_count = len(self._rows)
         
         return {
             'system_metrics': system_metrics,
             'job_count': job_count,
-            'active_jobs': list(self.job_metrics.keys()),
+            'active_jobs': list(self._rows.keys()),
             'performance_indicators': {
                 'efficiency': system_metrics['execution_count'] / max(system_metrics['uptime_seconds'], 1) * 3600,  # 每小时执行次数
                 'average_response_time': system_metrics['average_execution_time'],
@@ -345,14 +512,9 @@ class PerformanceMetrics:
     def reset_metrics(self) -> None:
         """重置所有性能指标"""
         self.start_time = datetime.now()
-        self.job_metrics.clear()
-        self.system_metrics = {
-            'total_execution_time': 0.0,
-            'average_execution_time': 0.0,
-            'max_execution_time': 0.0,
-            'min_execution_time': float('inf'),
-            'execution_count': 0
-        }
+        self._start_mono_ns = time.monotonic_ns()
+        with self._rows_lock:
+            self._reset_columns()
 
 
 class TaskScheduler:
@@ -369,6 +531,51 @@ class TaskScheduler:
         job_execution_times: 作业执行时间记录
     """
     
+    # 事件缓冲区容量与每批处理的事件数
+    EVENT_RING_SIZE = 8192
+    EVENT_BATCH_SIZE = 256
+    
+    # 执行待处理任务时失败任务重试次数每批提交的数量
+    BATCH_COMMIT_SIZE = 50
+    
+    # 并发爬取的最大线程数，以及每轮提交给线程池的任务数
+    CRAWL_MAX_WORKERS = 16
+    CRAWL_CHUNK_SIZE = 64
+    
+    # 任务完成时统计报告的最短输出间隔（秒）
+    COMPLETION_REPORT_INTERVAL = 300
+    
+    # 统计与性能指标查询结果的缓存时间（秒）
+    METRICS_CACHE_TTL = 2.0
+    
+    # 没有待执行任务时复用任务总数与已完成数的时间（秒）
+    COMPLETION_CACHE_TTL = 30.0
+    
+    # 判断是否存在待执行任务的查询，只需找到一行
+    _PENDING_EXISTS_QUERY = (
+        select(Task.id)
+        .where(Task.visited_num < Task.total_num, Task.total_num > 0)
+        .limit(1)
+    )
+    
+    # 按主键分页读取待处理任务的 Core 查询，只包含执行时需要的列；
+    # 语句只构建一次，每页通过绑定参数传入起始ID和页大小
+    _PENDING_PAGE_QUERY = (
+        select(Task.id, Task.url, Task.method, Task.body, Task.headers,
+               Task.timeout, Task.retry_count, Task.visited_num, Task.total_num)
+        .where(Task.visited_num < Task.total_num, Task.total_num > 0,
+               Task.id > bindparam('last_id'))
+        .order_by(Task.id)
+        .limit(bindparam('page_size'))
+    )
+    
+    # 触发器类型到触发器类的映射
+    _TRIGGER_CLS: Dict[str, type] = {
+        "date": DateTrigger,
+        "interval": IntervalTrigger,
+        "cron": CronTrigger,
+    }
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None, app=None) -> None:
         """初始化任务调度器
         
@@ -377,17 +584,44 @@ class TaskScheduler:
             app: Flask应用实例，用于提供应用上下文
         """
         self.logger = get_logger(__name__)
+        # 调度器日志经队列交给后台线程输出，执行循环只承担入队开销
+        queue_logger(self.logger)
         self._config = config or get_scheduler_config()
         self._scheduler: Optional[BackgroundScheduler] = None
         self._is_running = False
-        self._statistics = TaskStatistics()
+        # 关闭统计时不注册事件监听器，调度事件不产生任何额外开销
+        self._stats_enabled: bool = self._config.get("stats_enabled", True)
+        self._statistics = TaskStatistics(
+            enable_history=self._config.get("history_enabled", True)
+        )
         self._start_time: Optional[datetime] = None
+        self._start_time_mono: Optional[float] = None  # 启动时刻（单调时钟），用于计算运行时长
         self._performance_metrics = PerformanceMetrics()
         self._job_execution_times: Dict[str, float] = {}
         self._auto_execution_job_id: Optional[str] = None  # 自动执行任务的作业ID
         self._app = app  # Flask应用实例
-        self._last_all_completed_report_time: Optional[datetime] = None  # 记录上次所有任务完成时打印统计报告的时间
+        self._fallback_app = None  # 未提供应用实例且不在应用上下文中时创建的备用实例
+        self._last_completion_report_mono: Optional[float] = None  # 上次因任务完成打印统计报告的时刻（单调时钟）
+        self._metrics_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}  # 指标名 -> (计算时刻, 结果)
+        # 完成情况报告使用的任务计数缓存：(查询时刻, (总数, 已完成数))
+        self._completion_cache: Optional[Tuple[float, Tuple[int, int]]] = None
         self._crawler_service: Optional[CrawlerService] = None  # 复用的爬虫服务实例
+        self._crawler_lock = threading.Lock()
+        # 作业ID到作业名称的缓存，事件处理时无需再查询作业存储；
+        # 单次字典读写在GIL下是原子的，无需额外加锁
+        self._job_names: Dict[str, Optional[str]] = {}
+        # 调度事件环形缓冲区，由后台线程批量处理
+        self._event_ring: deque = deque(maxlen=self.EVENT_RING_SIZE)
+        self._event_signal = threading.Event()
+        self._drain_stop = threading.Event()
+        self._drain_thread: Optional[threading.Thread] = None
+        # 缓冲区写满时被丢弃的事件数，由各监听线程累加；已输出警告的数量仅由后台线程读写
+        self._dropped_events = ShardedCounter()
+        self._dropped_reported = 0
+        # 距上次输出报告以来的事件数，仅由后台线程读写
+        self._success_tick = 0
+        self._failure_tick = 0
+        self._skipped_tick = 0
         
         self.logger.info("开始初始化任务调度器")
         self._initialize_scheduler()
@@ -405,6 +639,8 @@ class TaskScheduler:
             # 处理时区
             timezone_str = self._config.get("timezone", "Asia/Shanghai")
             timezone = pytz.timezone(timezone_str)
+            # 缓存时区对象，添加作业时直接复用
+            self._tz = timezone
             self.logger.info(f"使用配置时区: {timezone_str}")
             
             # 处理作业默认设置
@@ -425,17 +661,20 @@ class TaskScheduler:
             self.logger.info("BackgroundScheduler实例创建成功")
             
             # 添加事件监听器
-            self.logger.info("正在添加事件监听器...")
-            self._scheduler.add_listener(
-                self._job_executed_listener, EVENT_JOB_EXECUTED
-            )
-            self._scheduler.add_listener(
-                self._job_error_listener, EVENT_JOB_ERROR
-            )
-            self._scheduler.add_listener(
-                self._job_missed_listener, EVENT_JOB_MISSED
-            )
-            self.logger.info("事件监听器添加完成")
+            if self._stats_enabled:
+                self.logger.info("正在添加事件监听器...")
+                self._scheduler.add_listener(
+                    self._job_executed_listener, EVENT_JOB_EXECUTED
+                )
+                self._scheduler.add_listener(
+                    self._job_error_listener, EVENT_JOB_ERROR
+                )
+                self._scheduler.add_listener(
+                    self._job_missed_listener, EVENT_JOB_MISSED
+                )
+                self.logger.info("事件监听器添加完成")
+            else:
+                self.logger.info("统计已关闭，不注册事件监听器")
             
             self.logger.info("任务调度器初始化成功")
             
@@ -461,7 +700,10 @@ class TaskScheduler:
         try:
             self.logger.info("正在启动任务调度器...")
             self._start_time = datetime.now()
+            self._start_time_mono = time.monotonic()
             
+            if self._stats_enabled:
+                self._start_event_drain()
             self._scheduler.start()
             self._is_running = True
             
@@ -479,8 +721,10 @@ class TaskScheduler:
             
         except Exception as e:
             self.logger.error(f"启动调度器失败: {e}")
+            self._stop_event_drain()
             self._is_running = False
             self._start_time = None
+            self._start_time_mono = None
             return False
     
     def start_auto_execution(self, interval_seconds: int = 30) -> bool:
@@ -581,21 +825,23 @@ class TaskScheduler:
             self.logger.info("正在停止任务调度器...")
             
             # 记录停止前的统计信息
-            stats = self.get_statistics()
             jobs_count = len(self.get_jobs())
-            
             self.logger.info(f"调度器停止前状态 - 作业数量: {jobs_count}")
-            self.logger.info(f"任务执行统计 - 总计: {stats['total_executions']}, "
-                           f"成功: {stats['success_count']}, 失败: {stats['failure_count']}, "
-                           f"跳过: {stats['skipped_count']}")
             
             # 记录运行时长
-            if self._start_time:
-                runtime = datetime.now() - self._start_time
+            if self._start_time_mono is not None:
+                runtime = timedelta(seconds=time.monotonic() - self._start_time_mono)
                 self.logger.info(f"调度器运行时长: {runtime}")
             
             self._scheduler.shutdown(wait=wait)
             self._is_running = False
+            self._stop_event_drain()
+            
+            # 缓冲区中剩余的事件处理完后直接计算统计，不使用查询缓存
+            stats = self._statistics.get_statistics()
+            self.logger.info(f"任务执行统计 - 总计: {stats['total_executions']}, "
+                           f"成功: {stats['success_count']}, 失败: {stats['failure_count']}, "
+                           f"跳过: {stats['skipped_count']}")
             
             # 记录停止成功信息
             stop_time = datetime.now()
@@ -605,9 +851,10 @@ class TaskScheduler:
             self.stop_auto_execution()
             
             # 关闭爬虫服务
-            if self._crawler_service:
-                self._crawler_service.close()
-                self._crawler_service = None
+            with self._crawler_lock:
+                crawler_service, self._crawler_service = self._crawler_service, None
+            if crawler_service:
+                crawler_service.close()
                 self.logger.info("爬虫服务已关闭")
             
             return True
@@ -675,8 +922,7 @@ class TaskScheduler:
             if trigger is not None:
                 if isinstance(trigger, str):
                     # 确保传递时区给触发器
-                    if 'timezone' not in trigger_args:
-                        trigger_args['timezone'] = pytz.timezone(self._config.get("timezone", "Asia/Shanghai"))
+                    trigger_args.setdefault('timezone', self._tz)
                     trigger = self._create_trigger(trigger, **trigger_args)
                 job_kwargs["trigger"] = trigger
             
@@ -685,13 +931,15 @@ class TaskScheduler:
             # 记录作业开始时间（用于性能监控）
             self._performance_metrics.record_job_start(job.id)
             
-            self.logger.info(f"作业添加成功: {job.id} - {job.name or '未命名'}")
+            self._job_names[job.id] = job.name
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"作业添加成功: {job.id} - {job.name or '未命名'}")
             return job
             
         except Exception as e:
-            self.logger.error(f"添加作业失败: {e}")
-            import traceback
-            traceback.print_exc()  # 添加详细的错误追踪
+            # 错误信息与追踪合并为一条日志记录
+            self.logger.exception(f"添加作业失败: {e}")
             return None
     
     def remove_job(self, job_id: str) -> bool:
@@ -705,6 +953,7 @@ class TaskScheduler:
         """
         try:
             self._scheduler.remove_job(job_id)
+            self._job_names.pop(job_id, None)
             self.logger.info(f"作业移除成功: {job_id}")
             return True
             
@@ -791,6 +1040,8 @@ class TaskScheduler:
         """
         try:
             self._scheduler.modify_job(job_id, **changes)
+            if 'name' in changes:
+                self._job_names[job_id] = changes['name']
             self.logger.info(f"作业修改成功: {job_id}")
             return True
             
@@ -811,119 +1062,181 @@ class TaskScheduler:
         Raises:
             ValueError: 当触发器类型无效时
         """
-        if trigger_type == "date":
-            return DateTrigger(**kwargs)
-        elif trigger_type == "interval":
-            return IntervalTrigger(**kwargs)
-        elif trigger_type == "cron":
-            return CronTrigger(**kwargs)
-        else:
+        trigger_cls = self._TRIGGER_CLS.get(trigger_type)
+        if trigger_cls is None:
             raise ValueError(f"无效的触发器类型: {trigger_type}")
+        return trigger_cls(**kwargs)
     
+    @_listener_guard
     def _job_executed_listener(self, event) -> None:
         """作业执行成功监听器
         
+        只记录作业耗时并把事件放入环形缓冲区，统计与日志由后台线程批量处理。
+        
         Args:
             event: 作业执行事件
         """
-        try:
-            job = self._scheduler.get_job(event.job_id)
-            job_name = job.name if job else None
-            
-            # 记录作业结束时间
-            self._performance_metrics.record_job_end(event.job_id, success=True)
-            
-            # 更新统计信息
-            self._statistics.record_success(event.job_id, job_name)
-            
-            # 获取执行时间信息
-            job_metrics = self._performance_metrics.get_job_metrics(event.job_id)
-            execution_time_ms = job_metrics.get('last_execution_time', 0)
-            
-            # 记录详细的执行成功信息
-            scheduled_time = getattr(event, 'scheduled_run_time', None)
-            if scheduled_time:
-                self.logger.info(f"作业执行成功: {event.job_id} - {job_name or '未命名'} - "
-                               f"计划执行时间: {scheduled_time} - "
-                               f"执行耗时: {execution_time_ms:.2f}ms")
-            else:
-                self.logger.info(f"作业执行成功: {event.job_id} - {job_name or '未命名'} - "
-                               f"执行耗时: {execution_time_ms:.2f}ms")
-            
-            # 每200次成功执行记录一次统计报告
-            if self._statistics.success_count % 200 == 0:
-                self.log_statistics_report()
-                self.log_performance_report()
-                
-        except Exception as e:
-            self.logger.error(f"处理作业执行成功事件失败: {e}")
+        now = datetime.now()
+        # 耗时需在事件发生时计算，不能推迟到批量处理
+        self._performance_metrics.record_job_end(event.job_id, success=True)
+        self._enqueue_event(EVENT_JOB_EXECUTED, event, now)
     
+    @_listener_guard
     def _job_error_listener(self, event) -> None:
         """作业执行错误监听器
         
         Args:
             event: 作业执行事件
         """
-        try:
-            job = self._scheduler.get_job(event.job_id)
-            job_name = job.name if job else None
-            
-            # 记录作业结束时间（失败）
-            error_msg = f"{event.exception}"
-            self._performance_metrics.record_job_end(event.job_id, success=False, error=error_msg)
-            
-            # 更新统计信息
-            self._statistics.record_failure(event.job_id, job_name, error_msg)
-            
-            # 获取执行时间信息
-            job_metrics = self._performance_metrics.get_job_metrics(event.job_id)
-            execution_time_ms = job_metrics.get('last_execution_time', 0)
-            
-            # 记录详细的错误信息
-            scheduled_time = getattr(event, 'scheduled_run_time', None)
-            error_details = f"异常: {event.exception}"
-            
-            if scheduled_time:
-                error_details += f", 计划执行时间: {scheduled_time}"
-            
-            self.logger.error(
-                f"作业执行失败: {event.job_id} - {job_name or '未命名'} - "
-                f"{error_details} - 执行耗时: {execution_time_ms:.2f}ms - "
-                f"追踪: {event.traceback}"
-            )
-            
-            # 每10次失败执行记录一次统计报告
-            if self._statistics.failure_count % 10 == 0:
-                self.log_statistics_report()
-                self.log_performance_report()
-                
-        except Exception as e:
-            self.logger.error(f"处理作业执行错误事件失败: {e}")
+        now = datetime.now()
+        self._performance_metrics.record_job_end(
+            event.job_id, success=False, error=f"{event.exception}"
+        )
+        self._enqueue_event(EVENT_JOB_ERROR, event, now)
     
+    @_listener_guard
     def _job_missed_listener(self, event) -> None:
         """作业错过执行监听器
         
         Args:
             event: 作业错过执行事件
         """
-        try:
-            job = self._scheduler.get_job(event.job_id)
-            job_name = job.name if job else None
-            
-            # 更新统计信息
-            reason = f"作业错过执行时间: {event.scheduled_run_time}"
-            self._statistics.record_skipped(event.job_id, job_name, reason)
-            
-            # 记录详细的错过执行信息
-            self.logger.warning(f"作业错过执行: {event.job_id} - {job_name or '未命名'} - "
-                              f"计划执行时间: {event.scheduled_run_time}")
+        self._enqueue_event(EVENT_JOB_MISSED, event, datetime.now())
+    
+    def _enqueue_event(self, kind: int, event, now: datetime) -> None:
+        """将调度事件放入环形缓冲区
+        
+        缓冲区写满时最早的事件会被丢弃，监听线程不会因此阻塞；
+        丢弃的事件数会被记录，并在下一批事件处理时输出警告。
+        
+        Args:
+            kind: 事件类型
+            event: APScheduler事件
+            now: 事件发生时间
+        """
+        ring = self._event_ring
+        # 判断与写入之间后台线程可能取走事件，计数只会偏多不会漏计
+        if len(ring) == ring.maxlen:
+            self._dropped_events.add()
+        ring.append((kind, event, now))
+        self._event_signal.set()
+    
+    def _start_event_drain(self) -> None:
+        """启动批量处理调度事件的后台线程"""
+        self._drain_stop.clear()
+        self._drain_thread = threading.Thread(
+            target=self._drain_events, name="scheduler-events", daemon=True
+        )
+        self._drain_thread.start()
+    
+    def _stop_event_drain(self, timeout: float = 5.0) -> None:
+        """停止后台线程，并处理缓冲区中剩余的事件
+        
+        Args:
+            timeout: 等待后台线程结束的最长时间（秒）
+        """
+        if self._drain_thread is None:
+            return
+        self._drain_stop.set()
+        self._event_signal.set()
+        self._drain_thread.join(timeout=timeout)
+        self._drain_thread = None
+    
+    def _drain_events(self) -> None:
+        """后台线程主循环：等待事件到达后批量处理，收到停止信号时清空缓冲区后退出"""
+        while True:
+            self._event_signal.wait()
+            self._event_signal.clear()
+            while self._event_ring:
+                self._process_event_batch()
+            if self._drain_stop.is_set():
+                break
+    
+    def _process_event_batch(self) -> None:
+        """从缓冲区取出一批事件，更新统计信息并合并输出日志"""
+        statistics = self._statistics
+        
+        info_lines: list[str] = []
+        error_lines: list[str] = []
+        warning_lines: list[str] = []
+        # 级别未启用时不构建对应的日志文本
+        info_enabled = self.logger.isEnabledFor(logging.INFO)
+        warning_enabled = self.logger.isEnabledFor(logging.WARNING)
+        
+        for _ in range(self.EVENT_BATCH_SIZE):
+            try:
+                kind, event, now = self._event_ring.popleft()
+            except IndexError:
+                break
             
-            # 每10次跳过执行记录一次统计报告
-            if self._statistics.skipped_count % 10 == 0:
-                self.log_statistics_report()
+            try:
+                name = self._job_names.get(event.job_id)
+                job_name = name or '未命名'
+                scheduled_time = getattr(event, 'scheduled_run_time', None)
                 
-        except Exception as e:
-            self.logger.error(f"处理作业错过执行事件失败: {e}")
+                if kind == EVENT_JOB_EXECUTED:
+                    statistics.record_success(event.job_id, name, now=now)
+                    self._success_tick += 1
+                    if info_enabled:
+                        execution_time_ms = self._performance_metrics.get_job_metrics(
+                            event.job_id).get('last_execution_time') or 0
+                        scheduled_part = f"计划执行时间: {scheduled_time} - " if scheduled_time else ""
+                        info_lines.append(f"作业执行成功: {event.job_id} - {job_name} - "
+                                          f"{scheduled_part}执行耗时: {execution_time_ms:.2f}ms")
+                
+                elif kind == EVENT_JOB_ERROR:
+                    error_msg = f"{event.exception}"
+                    statistics.record_failure(event.job_id, name, error_msg, now=now)
+                    self._failure_tick += 1
+                    execution_time_ms = self._performance_metrics.get_job_metrics(
+                        event.job_id).get('last_execution_time') or 0
+                    error_details = f"异常: {event.exception}"
+                    if scheduled_time:
+                        error_details += f", 计划执行时间: {scheduled_time}"
+                    error_lines.append(
+                        f"作业执行失败: {event.job_id} - {job_name} - "
+                        f"{error_details} - 执行耗时: {execution_time_ms:.2f}ms - "
+                        f"追踪: {event.traceback}"
+                    )
+                
+                else:
+                    reason = f"作业错过执行时间: {scheduled_time}"
+                    statistics.record_skipped(event.job_id, name, reason, now=now)
+                    self._skipped_tick += 1
+                    if warning_enabled:
+                        warning_lines.append(f"作业错过执行: {event.job_id} - {job_name} - "
+                                             f"计划执行时间: {scheduled_time}")
+            except Exception as e:
+                self.logger.error(f"处理调度事件失败: {e}")
+        
+        if info_lines:
+            self.logger.info("\n".join(info_lines))
+        if error_lines:
+            self.logger.error("\n".join(error_lines))
+        if warning_lines:
+            self.logger.warning("\n".join(warning_lines))
+        
+        dropped = self._dropped_events.value()
+        if dropped > self._dropped_reported:
+            self.logger.warning(f"事件缓冲区已满，丢弃了 {dropped - self._dropped_reported} 个最早的调度事件，"
+                                f"执行统计可能偏低")
+            self._dropped_reported = dropped
+        
+        # 成功每200次、失败每10次输出统计与性能报告，跳过每10次输出统计报告
+        # 使用独立的计数槽判断阈值，不读取汇总后的统计计数
+        crossed_success = self._success_tick >= 200
+        crossed_failure = self._failure_tick >= 10
+        crossed_skipped = self._skipped_tick >= 10
+        if crossed_success:
+            self._success_tick = 0
+        if crossed_failure:
+            self._failure_tick = 0
+        if crossed_skipped:
+            self._skipped_tick = 0
+        if crossed_success or crossed_failure or crossed_skipped:
+            self.log_statistics_report()
+        if crossed_success or crossed_failure:
+            self.log_performance_report()
     
     @property
     def is_running(self) -> bool:
@@ -946,26 +1259,51 @@ class TaskScheduler:
     def get_statistics(self) -> Dict[str, Any]:
         """获取任务执行统计信息
         
+        统计关闭（stats_enabled 为 False）时各计数与比率均为0。
+        结果缓存 METRICS_CACHE_TTL 秒。
+        
         Returns:
             Dict[str, Any]: 包含统计信息的字典
         """
-        return self._statistics.get_statistics()
+        return self._cached('statistics', self._statistics.get_statistics)
     
     def get_execution_summary(self) -> Dict[str, Any]:
         """获取任务执行摘要
         
+        结果缓存 METRICS_CACHE_TTL 秒。
+        
         Returns:
             Dict[str, Any]: 包含执行摘要的字典
         """
-        return self._statistics.get_execution_summary()
+        return self._cached('execution_summary', self._statistics.get_execution_summary)
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """获取性能指标
         
+        结果缓存 METRICS_CACHE_TTL 秒。
+        
         Returns:
             Dict[str, Any]: 性能指标信息
         """
-        return self._performance_metrics.get_performance_summary()
+        return self._cached('performance_metrics', self._performance_metrics.get_performance_summary)
+    
+    def _cached(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """在 METRICS_CACHE_TTL 秒内复用同一指标的计算结果
+        
+        Args:
+            key: 缓存键
+            compute: 缓存失效时调用的计算函数
+            
+        Returns:
+            Dict[str, Any]: 计算结果的浅拷贝，调用方修改返回值不会影响缓存
+        """
+        now = time.monotonic()
+        cached = self._metrics_cache.get(key)
+        if cached is not None and now - cached[0] < self.METRICS_CACHE_TTL:
+            return dict(cached[1])
+        value = compute()
+        self._metrics_cache[key] = (now, value)
+        return dict(value)
     
     def get_job_performance_metrics(self, job_id: str) -> Dict[str, Any]:
         """获取指定作业的性能指标
@@ -982,47 +1320,53 @@ class TaskScheduler:
         """记录任务执行统计报告
         
         输出详细的任务执行统计信息，包括成功率、最近执行情况等。
+        整份报告合并为一条日志记录输出，INFO 级别未启用时直接跳过。
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         try:
-            stats = self.get_statistics()
-            summary = self.get_execution_summary()
+            # 报告直接计算统计，不使用查询缓存
+            stats = self._statistics.get_statistics()
             jobs = self.get_jobs()
             
-            self.logger.info("=" * 60)
-            self.logger.info("任务调度器统计报告")
-            self.logger.info("=" * 60)
-            
-            # 基本统计信息
-            self.logger.info(f"作业总数: {len(jobs)}")
-            self.logger.info(f"总执行次数: {stats['total_executions']}")
-            self.logger.info(f"成功次数: {stats['success_count']} ({stats['success_rate']:.2%})")
-            self.logger.info(f"失败次数: {stats['failure_count']} ({stats['failure_rate']:.2%})")
-            self.logger.info(f"跳过次数: {stats['skipped_count']} ({stats['skipped_rate']:.2%})")
+            lines = [
+                "=" * 60,
+                "任务调度器统计报告",
+                "=" * 60,
+                # 基本统计信息
+                f"作业总数: {len(jobs)}",
+                f"总执行次数: {stats['total_executions']}",
+                f"成功次数: {stats['success_count']} ({stats['success_rate']:.2%})",
+                f"失败次数: {stats['failure_count']} ({stats['failure_rate']:.2%})",
+                f"跳过次数: {stats['skipped_count']} ({stats['skipped_rate']:.2%})"
+            ]
             
             # 时间信息
             if stats['last_execution_time']:
-                self.logger.info(f"最后执行时间: {stats['last_execution_time']}")
+                lines.append(f"最后执行时间: {stats['last_execution_time']}")
             if stats['last_success_time']:
-                self.logger.info(f"最后成功时间: {stats['last_success_time']}")
+                lines.append(f"最后成功时间: {stats['last_success_time']}")
             if stats['last_failure_time']:
-                self.logger.info(f"最后失败时间: {stats['last_failure_time']}")
+                lines.append(f"最后失败时间: {stats['last_failure_time']}")
             
             # 运行时长
-            if self._start_time:
-                runtime = datetime.now() - self._start_time
-                self.logger.info(f"运行时长: {runtime}")
+            if self._start_time_mono is not None:
+                runtime = timedelta(seconds=time.monotonic() - self._start_time_mono)
+                lines.append(f"运行时长: {runtime}")
             
             # 最近执行情况
-            recent_executions = summary.get('recent_executions', [])
+            recent_executions = self._statistics.get_recent_executions(5)  # 只显示最近5次
             if recent_executions:
-                self.logger.info(f"最近 {len(recent_executions)} 次执行:")
-                for i, execution in enumerate(recent_executions[-5:], 1):  # 只显示最近5次
+                lines.append(f"最近 {len(recent_executions)} 次执行:")
+                for i, execution in enumerate(recent_executions, 1):
                     job_name = execution.get('job_name', '未命名')
                     status = execution.get('status', 'unknown')
                     timestamp = execution.get('timestamp', '未知时间')
-                    self.logger.info(f"  {i}. {job_name} - {status} - {timestamp}")
+                    lines.append(f"  {i}. {job_name} - {status} - {timestamp}")
             
-            self.logger.info("=" * 60)
+            lines.append("=" * 60)
+            self.logger.info("\n".join(lines))
             
         except Exception as e:
             self.logger.error(f"记录统计报告失败: {e}")
@@ -1036,6 +1380,7 @@ class TaskScheduler:
         try:
             self._statistics.reset()
             self._performance_metrics.reset_metrics()
+            self._metrics_cache.clear()
             self.logger.info("任务执行统计和性能指标已重置")
             return True
         except Exception as e:
@@ -1046,44 +1391,49 @@ class TaskScheduler:
         """记录性能指标报告
         
         输出详细的性能指标信息，包括执行时间、吞吐量等。
+        整份报告合并为一条日志记录输出，INFO 级别未启用时直接跳过。
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         try:
-            performance_summary = self.get_performance_metrics()
+            performance_summary = self._performance_metrics.get_performance_summary()
             system_metrics = performance_summary['system_metrics']
-            
-            self.logger.info("=" * 60)
-            self.logger.info("任务调度器性能指标报告")
-            self.logger.info("=" * 60)
-            
-            # 基本性能指标
-            self.logger.info(f"系统运行时间: {system_metrics['uptime_formatted']}")
-            self.logger.info(f"总执行次数: {system_metrics['execution_count']}")
-            self.logger.info(f"总执行时间: {system_metrics['total_execution_time']:.2f}ms")
-            self.logger.info(f"平均执行时间: {system_metrics['average_execution_time']:.2f}ms")
-            self.logger.info(f"最大执行时间: {system_metrics['max_execution_time']:.2f}ms")
-            self.logger.info(f"最小执行时间: {system_metrics['min_execution_time']:.2f}ms")
-            
-            # 性能指标
             indicators = performance_summary['performance_indicators']
-            self.logger.info(f"执行效率: {indicators['efficiency']:.2f} 次/小时")
-            self.logger.info(f"平均响应时间: {indicators['average_response_time']:.2f}ms")
-            self.logger.info(f"吞吐量: {indicators['throughput']} 次")
+            
+            lines = [
+                "=" * 60,
+                "任务调度器性能指标报告",
+                "=" * 60,
+                # 基本性能指标
+                f"系统运行时间: {system_metrics['uptime_formatted']}",
+                f"总执行次数: {system_metrics['execution_count']}",
+                f"总执行时间: {system_metrics['total_execution_time']:.2f}ms",
+                f"平均执行时间: {system_metrics['average_execution_time']:.2f}ms",
+                f"最大执行时间: {system_metrics['max_execution_time']:.2f}ms",
+                f"最小执行时间: {system_metrics['min_execution_time']:.2f}ms",
+                # 性能指标
+                f"执行效率: {indicators['efficiency']:.2f} 次/小时",
+                f"平均响应时间: {indicators['average_response_time']:.2f}ms",
+                f"吞吐量: {indicators['throughput']} 次"
+            ]
             
             # 作业级别指标（前5个）
             active_jobs = performance_summary['active_jobs'][:5]
             if active_jobs:
-                self.logger.info("活跃作业性能指标（前5个）:")
+                lines.append("活跃作业性能指标（前5个）:")
                 for i, job_id in enumerate(active_jobs, 1):
                     job_metrics = self.get_job_performance_metrics(job_id)
                     if job_metrics:
-                        self.logger.info(
+                        lines.append(
                             f"  {i}. 作业ID: {job_id} - "
                             f"执行次数: {job_metrics.get('execution_count', 0)} - "
                             f"平均时间: {job_metrics.get('average_time', 0):.2f}ms - "
-                            f"最后执行: {job_metrics.get('last_execution_time', 0):.2f}ms"
+                            f"最后执行: {job_metrics.get('last_execution_time') or 0:.2f}ms"
                         )
             
-            self.logger.info("=" * 60)
+            lines.append("=" * 60)
+            self.logger.info("\n".join(lines))
             
         except Exception as e:
             self.logger.error(f"记录性能指标报告失败: {e}")
@@ -1097,6 +1447,203 @@ class TaskScheduler:
         """上下文管理器出口"""
         self.stop()
     
+    def _completion_report_due(self, now_mono: float) -> bool:
+        """判断是否应输出任务完成统计报告，是则记录本次报告时刻
+        
+        Args:
+            now_mono: 当前时刻（time.monotonic()）
+            
+        Returns:
+            bool: 距上次报告超过 COMPLETION_REPORT_INTERVAL 秒或尚未报告过时返回True
+        """
+        last_report = self._last_completion_report_mono
+        if last_report is not None and now_mono - last_report <= self.COMPLETION_REPORT_INTERVAL:
+            return False
+        self._last_completion_report_mono = now_mono
+        return True
+    
+    def _get_task_totals(self) -> Tuple[int, int, int]:
+        """统计任务总数、已完成数和待执行数
+        
+        三个计数由一条聚合查询返回。
+        
+        Returns:
+            Tuple[int, int, int]: (总数, 已完成数, 待执行数)
+        """
+        total, completed, pending_total = db.session.execute(
+            select(
+                func.count(Task.id),
+                func.count(case((Task.visited_num >= Task.total_num, 1))),
+                func.count(case((Task.visited_num < Task.total_num, 1)))
+            ).where(Task.total_num > 0)
+        ).one()
+        return total, completed, pending_total
+    
+    def _has_pending_tasks(self) -> bool:
+        """判断是否存在待执行任务
+        
+        每次扫描都会查询，新建的任务在下一次扫描时即可被发现。
+        
+        Returns:
+            bool: 存在待执行任务时返回True
+        """
+        return db.session.execute(self._PENDING_EXISTS_QUERY).first() is not None
+    
+    def _get_completion_counts(self) -> Tuple[int, int]:
+        """获取完成情况报告使用的任务总数和已完成数
+        
+        结果缓存 COMPLETION_CACHE_TTL 秒，提交任务进度时失效；
+        只用于没有待执行任务时的报告，不参与是否有待执行任务的判断。
+        
+        Returns:
+            Tuple[int, int]: (总数, 已完成数)
+        """
+        now = time.monotonic()
+        cached = self._completion_cache
+        if cached is not None and now - cached[0] < self.COMPLETION_CACHE_TTL:
+            return cached[1]
+        
+        total, completed, _ = self._get_task_totals()
+        self._completion_cache = (now, (total, completed))
+        return total, completed
+    
+    def _iter_pending_tasks(self, page_size: int = 200) -> Iterator[Row]:
+        """按主键分页读取待处理任务，只加载执行所需的列
+        
+        每页是一次独立的查询，不会在执行期间占用游标，
+        爬虫服务保存结果时提交会话也不受影响。
+        
+        Args:
+            page_size: 每页读取的任务数
+            
+        Yields:
+            Row: 包含任务执行所需字段的行
+        """
+        last_id = 0
+        while True:
+            rows = db.session.execute(
+                self._PENDING_PAGE_QUERY, {'last_id': last_id, 'page_size': page_size}
+            ).all()
+            if not rows:
+                return
+            yield from rows
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1].id
+    
+    def _submit_crawl(self, executor: ThreadPoolExecutor, crawler_service: CrawlerService,
+                      task: Row) -> Future:
+        """将任务的网络请求提交到线程池
+        
+        Args:
+            executor: 爬取线程池
+            crawler_service: 爬虫服务实例
+            task: 包含任务执行所需字段的行
+            
+        Returns:
+            Future: 返回 crawl_address 结果的 Future
+        """
+        # 循环内的日志使用延迟格式化，级别被过滤时不产生格式化开销
+        self.logger.info("开始执行任务: %s - %s", task.id, task.url)
+        
+        # 使用Task模型的完整HTTP配置
+        return executor.submit(
+            crawler_service.crawl_address,
+            task.url,
+            method=task.method,
+            body=task.body,
+            headers=task.headers,
+            timeout=task.timeout
+        )
+    
+    def _run_pending_task(self, crawler_service: CrawlerService, task: Row,
+                          crawl_future: Future) -> Tuple[bool, bool]:
+        """保存单个任务的爬取结果、提交任务进度并记录统计信息
+        
+        在主线程中调用。执行成功时紧接着地址信息的保存提交访问计数，
+        已保存的结果不会因后续批次失败或进程退出而丢失对应的进度；
+        失败任务的重试计数由调用方批量提交。
+        
+        Args:
+            crawler_service: 爬虫服务实例
+            task: 包含任务执行所需字段的行
+            crawl_future: 该任务已完成的爬取 Future
+            
+        Returns:
+            Tuple[bool, bool]: (是否执行成功, 本次执行后任务是否已完成)
+            
+        Raises:
+            Exception: 爬取或保存过程中出现的异常
+        """
+        task_id = task.id
+        task_url = task.url
+        
+        # 爬取线程中的异常在这里重新抛出
+        result = crawler_service.save_crawl_result(crawl_future.result(), task.body)
+        
+        if result['status'] != 'success':
+            error_msg = result.get('error', '未知错误')
+            if self._stats_enabled:
+                self._statistics.record_failure(f"task_{task_id}", task_url, error_msg)
+            self.logger.warning("任务执行失败: %s, 原因: %s", task_id, error_msg)
+            return False, False
+        
+        # 地址信息已由爬虫服务提交，立即提交该任务的访问计数
+        Task.bulk_increment_visited({task_id: 1})
+        db.session.commit()
+        self._completion_cache = None
+        
+        visited_num = task.visited_num + 1
+        total_num = task.total_num
+        if self._stats_enabled:
+            self._statistics.record_success(f"task_{task_id}", task_url)
+        self.logger.info("任务执行成功: %s (进度: %s/%s)", task_id, visited_num, total_num)
+        
+        # 检查任务是否真正完成
+        completed = visited_num >= total_num
+        if completed:
+            self.logger.info("任务 %s 已完成！总进度: %s/%s", task_id, visited_num, total_num)
+        return True, completed
+    
+    def _commit_task_updates(self, failed_task_ids: list[int]) -> bool:
+        """将累计的失败任务重试次数写入数据库并提交
+        
+        只有提交成功后才清空累计值，提交失败时保留，由下一次提交重试。
+        
+        Args:
+            failed_task_ids: 执行失败、需要增加重试次数的任务ID
+            
+        Returns:
+            bool: 提交成功时返回True
+        """
+        try:
+            Task.bulk_increment_retry(failed_task_ids)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            self.logger.error(f"批量提交任务重试次数失败，{len(failed_task_ids)} 个任务将在下次提交时重试: {e}")
+            return False
+        
+        failed_task_ids.clear()
+        return True
+    
+    def _get_crawler(self) -> CrawlerService:
+        """获取复用的爬虫服务实例
+        
+        首次调用时创建实例，之后一直复用直到调度器停止。
+        
+        Returns:
+            CrawlerService: 爬虫服务实例
+        """
+        crawler_service = self._crawler_service
+        if crawler_service is None:
+            with self._crawler_lock:
+                if self._crawler_service is None:
+                    self._crawler_service = CrawlerService()
+                    self.logger.info("创建新的爬虫服务实例")
+                crawler_service = self._crawler_service
+        return crawler_service
+    
     def execute_pending_tasks(self) -> int:
         """执行待处理的任务
         
@@ -1106,165 +1653,132 @@ class TaskScheduler:
         Returns:
             int: 执行的任务数量
         """
-        executed_count = 0
-        success_count = 0
-        failure_count = 0
-        
         self.logger.info("开始执行待处理任务扫描...")
         
         try:
             # 确保在应用上下文中执行数据库操作
-            if self._app:
-                # 如果提供了应用实例，使用它
-                with self._app.app_context():
-                    return self._execute_pending_tasks_internal(executed_count, success_count, failure_count, datetime.now())
-            else:
-                # 尝试获取当前应用上下文，如果没有则创建新的
-                try:
-                    from flask import current_app
-                    if current_app:
-                        return self._execute_pending_tasks_internal(executed_count, success_count, failure_count, datetime.now())
-                    else:
-                        # 创建临时应用上下文
-                        from src.app import create_app
-                        app = create_app()
-                        with app.app_context():
-                            return self._execute_pending_tasks_internal(executed_count, success_count, failure_count, datetime.now())
-                except RuntimeError:
-                    # 没有应用上下文，创建新的
-                    from src.app import create_app
-                    app = create_app()
-                    with app.app_context():
-                        return self._execute_pending_tasks_internal(executed_count, success_count, failure_count, start_time)
+            with self._ensure_app_context():
+                return self._execute_pending_tasks_internal()
         except Exception as e:
             self.logger.error(f"执行待处理任务时发生错误: {e}")
-            return executed_count
+            return 0
+    
+    def _ensure_app_context(self) -> AbstractContextManager:
+        """获取执行数据库操作所需的应用上下文
+        
+        Returns:
+            AbstractContextManager: 提供了应用实例时使用它的上下文；已处于应用上下文中时
+            返回空上下文；否则使用备用应用实例（只在首次需要时创建）的上下文
+        """
+        if self._app:
+            return self._app.app_context()
+        if has_app_context():
+            return nullcontext()
+        if self._fallback_app is None:
+            self._fallback_app = create_app()
+        return self._fallback_app.app_context()
     
-    def _execute_pending_tasks_internal(self, executed_count: int, success_count: int, failure_count: int, start_time: datetime) -> int:
+    def _execute_pending_tasks_internal(self) -> int:
         """内部方法：在应用上下文中执行待处理任务
         
-        Args:
-            executed_count: 已执行计数
-            success_count: 成功计数
-            failure_count: 失败计数
-            start_time: 开始时间
-            
         Returns:
             int: 执行的任务数量
         """
-        # 使用Flask的数据库连接
-        from src.app import db
-        
-        # 查询待处理且未完成的任务
-        pending_tasks = db.session.query(Task).filter(
-            Task.visited_num < Task.total_num,
-            Task.total_num > 0
-        ).all()
-        
-        if not pending_tasks:
+        if not self._has_pending_tasks():
             self.logger.info("没有待执行的任务")
             
-            # 检查是否所有任务都已完成，如果是则打印最终统计报告
-            try:
-                from src.app import db
-                all_tasks = db.session.query(Task).filter(Task.total_num > 0).all()
-                completed_tasks = [task for task in all_tasks if task.is_completed]
-                pending_tasks_total = [task for task in all_tasks if task.is_pending]
+            # 没有待执行任务且存在任务时即全部完成，打印最终统计报告
+            total, completed = self._get_completion_counts()
+            if total:
+                # 距离上次打印统计报告不足5分钟时只输出简要信息，避免频繁打印
+                now_mono = time.monotonic()
+                last_report = self._last_completion_report_mono
                 
-                if all_tasks and len(pending_tasks_total) == 0:
-                    # 检查距离上次打印统计报告是否超过5分钟，避免频繁打印
-                    current_time = datetime.now()
-                    should_report = (
-                        self._last_all_completed_report_time is None or
-                        (current_time - self._last_all_completed_report_time).total_seconds() > 300
-                    )
-                    
-                    if should_report:
-                        self.logger.info(f"🎉 所有 {len(all_tasks)} 个任务已完成！")
-                        self.logger.info(f"已完成任务: {len(completed_tasks)} 个")
-                        self.log_statistics_report()
-                        self._last_all_completed_report_time = current_time
-                    else:
-                        self.logger.info(f"所有 {len(all_tasks)} 个任务已完成 (上次报告时间: {self._last_all_completed_report_time.strftime('%H:%M:%S')})")
-                elif all_tasks:
-                    self.logger.info(f"任务状态总览: 总计 {len(all_tasks)} 个任务, "
-                                   f"已完成 {len(completed_tasks)} 个, "
-                                   f"待执行 {len(pending_tasks_total)} 个")
-            except Exception as e:
-                self.logger.error(f"检查任务完成状态时发生错误: {e}")
+                if self._completion_report_due(now_mono):
+                    self.logger.info(f"🎉 所有 {total} 个任务已完成！")
+                    self.logger.info(f"已完成任务: {completed} 个")
+                    self.log_statistics_report()
+                else:
+                    # 仅在输出日志时换算出上次报告的时钟时间
+                    last_report_time = datetime.now() - timedelta(seconds=now_mono - last_report)
+                    self.logger.info(f"所有 {total} 个任务已完成 (上次报告时间: {last_report_time.strftime('%H:%M:%S')})")
             
             return 0
         
-        self.logger.info(f"发现 {len(pending_tasks)} 个待执行任务")
+        # 有待执行任务时，一次聚合查询同时得到待执行任务数量与整体完成情况
+        total, completed, pending_count = self._get_task_totals()
+        if not pending_count:
+            # 两次查询之间任务已被执行完
+            self.logger.info("没有待执行的任务")
+            return 0
+        
+        self.logger.info(f"发现 {pending_count} 个待执行任务 (任务总数 {total}, 已完成 {completed})")
         
-        # 记录任务详情
+        pending_tasks = self._iter_pending_tasks()
+        
+        # 记录任务详情（只显示前10个任务）
+        first_tasks = list(islice(pending_tasks, 10))
         self.logger.info("待执行任务详情:")
-        for i, task in enumerate(pending_tasks[:10], 1):  # 只显示前10个任务
-            self.logger.info(f"  {i}. 任务ID: {task.id}, URL: {task.url}, "
-                           f"进度: {task.visited_num}/{task.total_num}")
-        if len(pending_tasks) > 10:
-            self.logger.info(f"  ... 还有 {len(pending_tasks) - 10} 个任务待执行")
+        for i, task in enumerate(first_tasks, 1):
+            self.logger.info("  %d. 任务ID: %s, URL: %s, 进度: %s/%s",
+                             i, task.id, task.url, task.visited_num, task.total_num)
+        if pending_count > 10:
+            self.logger.info(f"  ... 还有 {pending_count - 10} 个任务待执行")
         
-        # 使用复用的爬虫服务实例，如果没有则创建
-        if self._crawler_service is None:
-            self._crawler_service = CrawlerService()
-            self.logger.info("创建新的爬虫服务实例")
+        crawler_service = self._get_crawler()
         
-        crawler_service = self._crawler_service
+        # 成功任务的访问计数随每个任务提交；失败任务的重试次数在内存中累计，
+        # 每 BATCH_COMMIT_SIZE 个批量写入并提交一次
+        failed_task_ids: list[int] = []
+        executed_count = 0
+        completed_in_batch = 0
         
+        # 只有网络请求在线程池中并发执行；数据库会话绑定在当前应用上下文，
+        # 保存结果与进度更新都在主线程中按完成顺序串行处理
+        all_tasks = chain(first_tasks, pending_tasks)
         try:
-            for task in pending_tasks:
-                try:
-                    # 任务开始执行，无需状态更新
-                    self.logger.debug(f"任务开始执行: {task.id} - {task.url}")
-                    db.session.commit()
-                    
-                    self.logger.info(f"开始执行任务: {task.id} - {task.url}")
+            with ThreadPoolExecutor(max_workers=min(self.CRAWL_MAX_WORKERS, pending_count),
+                                    thread_name_prefix='crawl') as executor:
+                while True:
+                    chunk = list(islice(all_tasks, self.CRAWL_CHUNK_SIZE))
+                    if not chunk:
+                        break
+                    futures = {
+                        self._submit_crawl(executor, crawler_service, task): task
+                        for task in chunk
+                    }
                     
-                    # 执行爬虫任务并保存结果
-                    # 使用Task模型的完整HTTP配置
-                    result = crawler_service.crawl_and_save(
-                        task.url,
-                        method=task.method,
-                        body=task.body,
-                        headers=task.headers,
-                        timeout=task.timeout,
-                        retry_count=task.retry_count
-                    )
-                    
-                    # 更新任务统计信息
-                    if result['status'] == 'success':
-                        task.increment_visited()
-                        success_count += 1
-                        self._statistics.record_success(f"task_{task.id}", task.url)
-                        self.logger.info(f"任务执行成功: {task.id} (进度: {task.visited_num}/{task.total_num})")
+                    for future in as_completed(futures):
+                        task = futures[future]
+                        try:
+                            succeeded, completed = self._run_pending_task(crawler_service, task, future)
+                            executed_count += 1
+                        except Exception as e:
+                            self.logger.error(f"执行任务 {task.id} 时发生错误: {e}")
+                            
+                            # 丢弃失败任务留下的会话状态，累计的重试计数保存在内存中不受影响
+                            db.session.rollback()
+                            succeeded = completed = False
+                            if self._stats_enabled:
+                                self._statistics.record_failure(f"task_{task.id}", task.url, str(e))
                         
-                        # 检查任务是否真正完成
-                        if task.is_completed:
-                            self.logger.info(f"任务 {task.id} 已完成！总进度: {task.visited_num}/{task.total_num}")
-                            self.log_statistics_report()
-                    else:
-                        
-                        task.increment_retry()
-                        failure_count += 1
-                        error_msg = result.get('error', '未知错误')
-                        self._statistics.record_failure(f"task_{task.id}", task.url, error_msg)
-                        self.logger.warning(f"任务执行失败: {task.id}, 原因: {error_msg}")
-                    
-                    db.session.commit()
-                    executed_count += 1
-                    
-                except Exception as e:
-                    self.logger.error(f"执行任务 {task.id} 时发生错误: {e}")
-                    
-                    task.increment_retry()
-                    failure_count += 1
-                    self._statistics.record_failure(f"task_{task.id}", task.url, str(e))
-                    db.session.commit()
-                    continue
+                        if succeeded:
+                            # 统计报告在整批执行结束后统一输出
+                            completed_in_batch += completed
+                        else:
+                            failed_task_ids.append(task.id)
+                            if len(failed_task_ids) >= self.BATCH_COMMIT_SIZE:
+                                self._commit_task_updates(failed_task_ids)
         except Exception as e:
             # 批量任务处理过程中出现异常，不需要关闭爬虫服务
             self.logger.error(f"批量任务执行过程中出现异常: {e}")
+        finally:
+            if failed_task_ids:
+                self._commit_task_updates(failed_task_ids)
+        
+        # 本批有任务完成时输出一次统计报告，与全部完成报告共用频率限制
+        if completed_in_batch and self._completion_report_due(time.monotonic()):
+            self.log_statistics_report()
         
         # 不再在这里关闭爬虫服务，保持实例复用
         
@@ -1273,6 +1787,7 @@ class TaskScheduler:
 
 # 全局调度器实例
 _scheduler_instance: Optional[TaskScheduler] = None
+_scheduler_lock = threading.Lock()
 
 
 def get_scheduler(config: Optional[Dict[str, Any]] = None) -> TaskScheduler:
@@ -1286,10 +1801,15 @@ def get_scheduler(config: Optional[Dict[str, Any]] = None) -> TaskScheduler:
     """
     global _scheduler_instance
     
-    if _scheduler_instance is None:
-        _scheduler_instance = TaskScheduler(config)
+    # 双重检查：已创建时无需加锁，并发首次调用也只会创建一个实例
+    scheduler = _scheduler_instance
+    if scheduler is None:
+        with _scheduler_lock:
+            scheduler = _scheduler_instance
+            if scheduler is None:
+                scheduler = _scheduler_instance = TaskScheduler(config)
     
-    return _scheduler_instance
+    return scheduler
 
 
 def start_scheduler(config: Optional[Dict[str, Any]] = None) -> bool:
@@ -1316,9 +1836,10 @@ def stop_scheduler(wait: bool = True) -> bool:
     """
     global _scheduler_instance
     
-    if _scheduler_instance is None:
+    with _scheduler_lock:
+        scheduler, _scheduler_instance = _scheduler_instance, None
+    
+    if scheduler is None:
         return True
     
-    result = _scheduler_instance.stop(wait)
-    _scheduler_instance = None
-    return result
\ No newline at end of file
+    return scheduler.stop(wait)
\ No newline at end of file
@@ -6,7 +6,9 @@
 """
 
 import logging
-from typing import Dict, Any, Optional, Type
+import threading
+from enum import IntEnum
+from typing import Dict, Any, List, Optional, Type
 from functools import wraps
 
 from .task_service import TaskService
@@ -18,6 +20,8 @@ from .data_service import DataService
 class ServiceException(Exception):
     """服务层基础异常类"""
     
+    __slots__ = ('message', 'service_name', 'error_code')
+    
     def __init__(self, message: str, service_name: str = None, error_code: str = None):
         self.message = message
         self.service_name = service_name
@@ -30,7 +34,11 @@ def service_error_handler(func):
     服务错误处理装饰器
     
     统一处理服务层异常，提供标准化的错误日志记录。
+    服务名称在装饰时从方法的限定名中取得，调用时无需再查找。
     """
+    owner = func.__qualname__.rpartition('.')[0]
+    service_name = owner.rpartition('.')[2] or 'UnknownService'
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
@@ -40,7 +48,6 @@ def service_error_handler(func):
             raise
         except Exception as e:
             # 未预期的异常，包装为服务异常
-            service_name = args[0].__class__.__name__ if args else 'UnknownService'
             error_msg = f"服务执行失败: {str(e)}"
             logging.error(f"[{service_name}] {error_msg}")
             raise ServiceException(error_msg, service_name)
@@ -48,16 +55,28 @@ def service_error_handler(func):
     return wrapper
 
 
+class ServiceKind(IntEnum):
+    """服务类型，取值即服务实例表中的下标"""
+    
+    TASK = 0
+    CRAWLER = 1
+    VALIDATION = 2
+    DATA = 3
+
+
 class ServiceFactory:
     """服务工厂类，提供统一的服务实例创建和管理"""
     
-    _instances: Dict[str, Any] = {}
-    _service_classes = {
-        'task': TaskService,
-        'crawler': CrawlerService,
-        'validation': ValidationService,
-        'data': DataService
+    # 按 ServiceKind 下标排列的服务类与实例，名称只在入口处查一次
+    _ctors = (TaskService, CrawlerService, ValidationService, DataService)
+    _instances: List[Optional[Any]] = [None] * len(ServiceKind)
+    _name_to_kind: Dict[str, ServiceKind] = {
+        'task': ServiceKind.TASK,
+        'crawler': ServiceKind.CRAWLER,
+        'validation': ServiceKind.VALIDATION,
+        'data': ServiceKind.DATA
     }
+    _lock = threading.Lock()
     
     @classmethod
     def get_service(cls, service_name: str, **kwargs) -> Any:
@@ -74,40 +93,57 @@ class ServiceFactory:
         Raises:
             ServiceException: 服务名称无效时抛出
         """
-        if service_name not in cls._service_classes:
+        kind = cls._name_to_kind.get(service_name)
+        if kind is None:
             raise ServiceException(f"无效的服务名称: {service_name}")
         
-        # 使用单例模式，避免重复创建服务实例
-        if service_name not in cls._instances:
-            service_class = cls._service_classes[service_name]
-            cls._instances[service_name] = service_class(**kwargs)
+        return cls._get_instance(kind, kwargs)
+    
+    @classmethod
+    def _get_instance(cls, kind: ServiceKind, kwargs: Dict[str, Any]) -> Any:
+        """
+        按服务类型获取单例实例，仅在首次创建时加锁
         
-        return cls._instances[service_name]
+        Args:
+            kind: 服务类型
+            kwargs: 传递给服务构造函数的参数
+            
+        Returns:
+            服务实例
+        """
+        instance = cls._instances[kind]
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances[kind]
+                if instance is None:
+                    instance = cls._instances[kind] = cls._ctors[kind](**kwargs)
+        return instance
     
     @classmethod
     def create_task_service(cls, **kwargs) -> TaskService:
         """创建任务服务实例"""
-        return cls.get_service('task', **kwargs)
+        return cls._get_instance(ServiceKind.TASK, kwargs)
     
     @classmethod
     def create_crawler_service(cls, **kwargs) -> CrawlerService:
         """创建爬虫服务实例"""
-        return cls.get_service('crawler', **kwargs)
+        return cls._get_instance(ServiceKind.CRAWLER, kwargs)
     
     @classmethod
     def create_validation_service(cls, **kwargs) -> ValidationService:
         """创建验证服务实例"""
-        return cls.get_service('validation', **kwargs)
+        return cls._get_instance(ServiceKind.VALIDATION, kwargs)
     
     @classmethod
     def create_data_service(cls, **kwargs) -> DataService:
         """创建数据服务实例"""
-        return cls.get_service('data', **kwargs)
+        return cls._get_instance(ServiceKind.DATA, kwargs)
     
     @classmethod
     def clear_cache(cls) -> None:
         """清除服务实例缓存"""
-        cls._instances.clear()
+        with cls._lock:
+            cls._instances[:] = [None] * len(ServiceKind)
 
 
 def get_service(service_name: str, **kwargs) -> Any:
@@ -146,6 +182,7 @@ __all__ = [
     
     # 工厂类
     'ServiceFactory',
+    'ServiceKind',
     
     # 便捷函数
     'get_service',
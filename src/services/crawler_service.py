@@ -5,16 +5,24 @@
 为地址爬虫系统提供完整的爬取服务支持。
 """
 
+import asyncio
 import json
 import logging
 import random
+import threading
 import time
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain, zip_longest
+from typing import Dict, Any, AsyncIterator, Iterable, Optional, List, Tuple
+from urllib.parse import urlsplit
 
 from pytz import country_names
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests.exceptions import RequestException, Timeout, ConnectionError
+from sqlalchemy import insert, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.app import db
@@ -22,6 +30,35 @@ from src.config import get_config
 from src.models.address_info import AddressInfo
 from src.utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时使用标准库json解析响应
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp 为可选依赖，未安装时异步爬取只能使用 httpx
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:  # httpx 为可选依赖，未安装时异步爬取只使用aiohttp
+    httpx = None
+
+# orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，两种解析函数的异常处理方式相同
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# 异步请求中需要重试的网络错误，以及其他请求错误
+_ASYNC_NETWORK_ERRORS = (
+    (asyncio.TimeoutError,)
+    + ((aiohttp.ClientConnectionError,) if aiohttp is not None else ())
+    + ((httpx.TransportError,) if httpx is not None else ())
+)
+_ASYNC_REQUEST_ERRORS = (
+    ((aiohttp.ClientError,) if aiohttp is not None else ())
+    + ((httpx.HTTPError,) if httpx is not None else ())
+)
+
 
 class UserAgentPool:
     """
@@ -71,6 +108,110 @@ class UserAgentPool:
         return self.user_agents.copy()
 
 
+def _extract_address_info(response_data: Dict[str, Any], url: str) -> AddressInfo:
+    """
+    从响应JSON中提取地址信息
+    
+    接口只有一种响应结构，按固定键直接读取字段并一次传给构造函数，
+    不再先创建空对象后逐个赋值，每个字段只触发一次属性设置。
+    
+    Args:
+        response_data: 响应JSON
+        url: 原始请求URL
+        
+    Returns:
+        AddressInfo: 地址信息对象，响应中没有地址数据时各字段为空
+    """
+    address_data = response_data.get("address")
+    if not address_data:
+        return AddressInfo()
+    
+    get = address_data.get
+    return AddressInfo(
+        address=get("Address"),
+        telephone=get("Telephone"),
+        city=get("City"),
+        zip_code=get("Zip_Code"),
+        state=get("State"),
+        state_full=get("State_Full"),
+        country=get("Country"),
+        source_url=url
+    )
+
+
+@lru_cache(maxsize=1024)
+def _country_from_body(body: str) -> str:
+    """
+    从请求体的 path 字段解析国家代码
+    
+    同一任务每次执行的请求体都相同，解析结果按请求体缓存，
+    重复执行时不再解析JSON和处理字符串。
+    
+    Args:
+        body: 任务的请求体JSON
+        
+    Returns:
+        str: 国家代码，path 为 "/" 时为 "us"
+    """
+    path = json.loads(body).get("path", "")
+    if path == "/":
+        return 'us'
+    return path.replace("/", "").replace("-address", "")
+
+
+# HTTP错误状态码对应的错误信息，未列出的状态码使用通用描述
+_CLIENT_ERRORS: Dict[int, str] = {
+    400: "请求参数错误",
+    401: "未授权访问",
+    403: "访问被禁止",
+    404: "API接口不存在",
+    429: "请求频率限制"
+}
+_SERVER_ERRORS: Dict[int, str] = {
+    500: "服务器内部错误",
+    502: "网关错误",
+    503: "服务不可用",
+    504: "网关超时"
+}
+
+# 批量保存时写入的地址字段
+_ADDRESS_ROW_FIELDS = ('address', 'telephone', 'city', 'zip_code', 'state',
+                       'state_full', 'country', 'source_url')
+
+
+def _to_row_dict(address_info: AddressInfo) -> Dict[str, Any]:
+    """
+    将地址信息对象转换为批量插入使用的字段字典
+    
+    Args:
+        address_info: 地址信息对象
+        
+    Returns:
+        Dict[str, Any]: 字段名到值的映射
+    """
+    return {field: getattr(address_info, field) for field in _ADDRESS_ROW_FIELDS}
+
+
+class _BufferedResponse:
+    """
+    已读取完毕的异步响应
+    
+    提供 _handle_http_response 与 parse_api_response 所需的 status_code、headers、text 和 json()，
+    使异步请求与同步请求共用同一套响应处理逻辑。
+    """
+    
+    __slots__ = ('status_code', 'headers', 'text')
+    
+    def __init__(self, status_code: int, headers: Any, text: str) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+    
+    def json(self) -> Any:
+        """解析响应JSON"""
+        return _json_loads(self.text)
+
+
 class CrawlerService:
     """
     爬虫服务类
@@ -79,20 +220,138 @@ class CrawlerService:
     支持重试机制、错误处理和不同类型的HTTP状态码处理。
     """
     
+    # 日志记录器在类定义时获取一次，所有实例共用
+    logger = get_logger(__name__)
+    
+    # 连接池大小，需覆盖调度器并发爬取的线程数
+    POOL_CONNECTIONS = 64
+    POOL_MAXSIZE = 64
+    
+    # 需要重试的响应状态码
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    
+    # HTTP方法到 requests.Session 对应方法名的映射，其他方法使用通用的 request
+    _METHOD_TABLE = {'GET': 'get', 'POST': 'post', 'PUT': 'put', 'DELETE': 'delete'}
+    
+    # 条件请求缓存保存的URL数量上限
+    CONDITIONAL_CACHE_SIZE = 1024
+    
+    # 同一主机的请求总耗时与实际跨度之比超过该值时视为串行瀑布
+    WATERFALL_RATIO_THRESHOLD = 0.8
+    
     def __init__(self) -> None:
         """初始化爬虫服务"""
-        self.logger = get_logger(__name__)
         self.config = get_config()
         self.session = requests.Session()
         self.user_agent_pool = UserAgentPool()
         
         # 配置会话
         self.session.timeout = self.config.CRAWLER_TIMEOUT
+        # 网络错误和可重试状态码由 urllib3 重试，总尝试次数为 CRAWLER_RETRY_COUNT，
+        # 并遵循 429/503 响应的 Retry-After；重试耗尽后返回最后一次响应，按状态码处理
+        retry = Retry(
+            total=max(self.config.CRAWLER_RETRY_COUNT - 1, 0),
+            backoff_factor=self.config.CRAWLER_RETRY_DELAY,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # 所有请求共用同一个连接池，并发爬取时复用已建立的 TCP/TLS 连接
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE,
+                              max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'User-Agent': self.user_agent_pool.get_random_user_agent(),
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         })
+        
+        # GET 请求的条件请求缓存：URL -> (ETag, Last-Modified, 响应JSON)，按最近使用顺序淘汰
+        self._conditional_cache: OrderedDict[str, Tuple[Optional[str], Optional[str], Dict[str, Any]]] = OrderedDict()
+        self._conditional_lock = threading.Lock()
+        
+        # 异步客户端（aiohttp.ClientSession 或 httpx.AsyncClient）在首次异步请求时于当前事件循环中创建
+        self._aio_client: Any = None
+        self._aio_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _build_request_headers(self, headers: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        构建单次请求的HTTP请求头
+        
+        复制调用方传入的请求头，并发请求之间不会互相修改。
+        
+        Args:
+            headers: HTTP请求头字典，可选
+            
+        Returns:
+            Dict[str, Any]: 带随机User-Agent和默认头的请求头
+        """
+        request_headers = dict(headers) if headers else {}
+        
+        # 设置随机User-Agent
+        request_headers['User-Agent'] = self.user_agent_pool.get_random_user_agent()
+        
+        # 添加其他默认headers
+        request_headers.setdefault('Accept', 'application/json')
+        request_headers.setdefault('Content-Type', 'application/json')
+        return request_headers
+    
+    def _error_result(self, error_msg: str, url: str) -> Dict[str, Any]:
+        """
+        构建请求失败时的结果
+        
+        Args:
+            error_msg: 错误信息
+            url: 请求的URL
+            
+        Returns:
+            Dict[str, Any]: 失败结果
+        """
+        return {
+            'status': 'error',
+            'error': error_msg,
+            'url': url,
+            'timestamp': time.time_ns()
+        }
+    
+    def _get_conditional_entry(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], Dict[str, Any]]]:
+        """
+        获取URL上次响应的校验器和响应JSON
+        
+        Args:
+            url: 请求的URL
+            
+        Returns:
+            Optional[Tuple[Optional[str], Optional[str], Dict[str, Any]]]: (ETag, Last-Modified, 响应JSON)，没有缓存时返回None
+        """
+        with self._conditional_lock:
+            entry = self._conditional_cache.get(url)
+            if entry is not None:
+                self._conditional_cache.move_to_end(url)
+            return entry
+    
+    def _store_conditional_entry(self, url: str, response: requests.Response,
+                                 response_data: Dict[str, Any]) -> None:
+        """
+        保存响应的校验器和响应JSON，响应不带 ETag 或 Last-Modified 时不保存
+        
+        Args:
+            url: 请求的URL
+            response: HTTP响应对象
+            response_data: 已解析的响应JSON
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        with self._conditional_lock:
+            self._conditional_cache[url] = (etag, last_modified, response_data)
+            self._conditional_cache.move_to_end(url)
+            if len(self._conditional_cache) > self.CONDITIONAL_CACHE_SIZE:
+                self._conditional_cache.popitem(last=False)
     
     def crawl_address(
         self,
@@ -110,114 +369,439 @@ class CrawlerService:
             method: HTTP请求方法，默认为GET
             body: 请求体内容，可选
             headers: HTTP请求头字典，可选
-            **kwargs: 其他请求参数（如timeout, retry_count等）
+            **kwargs: 其他请求参数（如timeout）
             
         Returns:
             Dict[str, Any]: 爬取结果，包含状态和数据
             
         Raises:
             ValueError: 当URL为空或无效时
-            RequestException: 当请求失败时
         """
         target_url = address.strip()
         if not target_url:
             raise ValueError("目标URL不能为空")
         
         # 构建请求参数
+        # 以流式方式请求，响应体在大小上限内才会完整读取
         request_kwargs = {
             'timeout': kwargs.get('timeout', self.config.CRAWLER_TIMEOUT),
+            'headers': self._build_request_headers(headers),
+            'stream': True,
         }
         
-        # 添加自定义headers
-        if headers:
-            request_kwargs['headers'] = headers
+        # 添加body（主要用于POST/PUT请求）
+        method_upper = method.upper()
+        is_get = method_upper == 'GET'
+        if body and not is_get:
+            request_kwargs['data'] = body
+        
+        # GET 请求携带上次响应的校验器，内容未变化时服务端返回不含响应体的304
+        cached = self._get_conditional_entry(target_url) if is_get else None
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                request_kwargs['headers']['If-None-Match'] = etag
+            if last_modified:
+                request_kwargs['headers']['If-Modified-Since'] = last_modified
+
+        self.logger.info("开始爬取URL: %s", target_url)
+        self.logger.info("HTTP方法: %s", method)
+        self.logger.info("使用User-Agent: %s", request_kwargs['headers']['User-Agent'])
+        
+        try:
+            # 重试与退避由会话挂载的 urllib3 Retry 完成
+            # 根据method选择请求方式
+            method_name = self._METHOD_TABLE.get(method_upper)
+            if method_name is not None:
+                response = getattr(self.session, method_name)(target_url, **request_kwargs)
+            else:
+                # 其他方法使用通用request
+                response = self.session.request(method_upper, target_url, **request_kwargs)
+            
+            # 处理HTTP响应
+            self.logger.info("收到HTTP响应，状态码: %s", response.status_code)
+            if isinstance(response, requests.Response):
+                # 成功响应在大小上限内读取响应体，其他状态码不读取；处理前释放连接
+                with response:
+                    if 200 <= response.status_code < 300:
+                        buffered = self._buffer_capped(response)
+                        if buffered is None:
+                            return self._oversized_result(target_url, response.status_code)
+                        response = buffered
+            
+            if cached is not None and response.status_code == 304:
+                # 内容未变化，使用缓存的响应JSON重新生成结果
+                result = self._build_address_result(cached[2], target_url, response.status_code)
+            else:
+                result = self._handle_http_response(response, target_url)
+                if is_get and result['status'] == 'success':
+                    self._store_conditional_entry(target_url, response, result['raw_response'])
+            
+            if result['status'] == 'success':
+                self.logger.info("URL爬取成功: %s", target_url)
+            else:
+                self.logger.warning("URL爬取失败: %s, 原因: %s", target_url, result.get('error'))
+            
+            return result
+            
+        except (Timeout, ConnectionError) as e:
+            error_msg = f"网络错误，重试{self.config.CRAWLER_RETRY_COUNT}次后仍然失败: {str(e)}"
+            self.logger.error(error_msg)
+            return self._error_result(error_msg, target_url)
+            
+        except RequestException as e:
+            error_msg = f"请求异常: {str(e)}"
+            self.logger.error(error_msg)
+            return self._error_result(error_msg, target_url)
+        
+        except Exception as e:
+            error_msg = f"未预期的错误: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            return self._error_result(error_msg, target_url)
+    
+    def _get_async_client(self) -> Any:
+        """
+        获取当前事件循环中复用的异步HTTP客户端
+        
+        启用 CRAWLER_HTTP2 且可以创建 HTTP/2 客户端时使用 httpx，同一主机的并发请求
+        在一条连接上多路复用；否则使用 aiohttp。客户端绑定在创建它的事件循环上，
+        事件循环变化时重新创建。
+        
+        Returns:
+            Any: httpx.AsyncClient 或 aiohttp.ClientSession
+            
+        Raises:
+            RuntimeError: 没有可用的异步HTTP客户端时
+        """
+        loop = asyncio.get_running_loop()
+        client = self._aio_client
+        if client is not None and not self._is_async_client_closed(client):
+            if self._aio_loop is loop:
+                return client
+            self.logger.warning("异步HTTP客户端未在其事件循环中关闭，连接可能泄漏；请在同一事件循环中调用 aclose()")
+        
+        client = self._create_http2_client() if self.config.CRAWLER_HTTP2 else None
+        if client is None:
+            if aiohttp is None:
+                raise RuntimeError("异步爬取需要安装 aiohttp，或启用 CRAWLER_HTTP2 并安装 httpx[http2]")
+            client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=1024, limit_per_host=64, ttl_dns_cache=300)
+            )
+        self._aio_client = client
+        self._aio_loop = loop
+        return client
+    
+    def _create_http2_client(self) -> Optional[Any]:
+        """
+        创建支持 HTTP/2 的 httpx 异步客户端
+        
+        Returns:
+            Optional[Any]: httpx.AsyncClient，缺少 httpx 或 h2 时返回None
+        """
+        if httpx is None:
+            self.logger.warning("未安装httpx，HTTP/2 不可用，改用aiohttp")
+            return None
+        
+        try:
+            return httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=1024, max_keepalive_connections=256),
+                timeout=httpx.Timeout(self.config.CRAWLER_TIMEOUT)
+            )
+        except ImportError:
+            # HTTP/2 支持依赖 h2 包
+            self.logger.warning("未安装h2，HTTP/2 不可用，改用aiohttp")
+            return None
+    
+    @staticmethod
+    def _is_http2_client(client: Any) -> bool:
+        """判断异步客户端是否为 httpx 客户端"""
+        return httpx is not None and isinstance(client, httpx.AsyncClient)
+    
+    @classmethod
+    def _is_async_client_closed(cls, client: Any) -> bool:
+        """判断异步客户端是否已关闭"""
+        return client.is_closed if cls._is_http2_client(client) else client.closed
+    
+    async def _fetch_async(self, method: str, url: str, data: Optional[str],
+                           headers: Dict[str, Any], timeout: float) -> Tuple[int, Optional[_BufferedResponse]]:
+        """
+        发送异步请求并读取响应体
+        
+        Args:
+            method: 大写的HTTP请求方法
+            url: 目标URL
+            data: 请求体内容，可选
+            headers: HTTP请求头字典
+            timeout: 超时时间（秒）
+            
+        Returns:
+            Tuple[int, Optional[_BufferedResponse]]: (HTTP状态码, 已读取的响应)，响应体超过上限时响应为None
+        """
+        client = self._get_async_client()
+        if self._is_http2_client(client):
+            async with client.stream(method, url, content=data, headers=headers, timeout=timeout) as response:
+                status = response.status_code
+                body = await self._read_capped(response, response.aiter_bytes())
+                encoding = response.charset_encoding or 'utf-8'
         else:
-            request_kwargs['headers'] = {}
+            async with client.request(method, url, data=data, headers=headers,
+                                      timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                status = response.status
+                body = await self._read_capped(response, response.content.iter_chunked(65536))
+                encoding = response.get_encoding() if body is not None else 'utf-8'
         
-        # 设置随机User-Agent
-        request_kwargs['headers']['User-Agent'] = self.user_agent_pool.get_random_user_agent()
+        if body is None:
+            return status, None
+        return status, _BufferedResponse(status, response.headers, body.decode(encoding, errors='replace'))
+    
+    async def crawl_address_async(
+        self,
+        address: str,
+        method: str = 'GET',
+        body: Optional[str] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        异步爬取目标URL内容
         
-        # 添加其他默认headers
-        request_kwargs['headers'].setdefault('Accept', 'application/json')
-        request_kwargs['headers'].setdefault('Content-Type', 'application/json')
+        参数与返回值和 crawl_address 一致，等待网络响应时不占用线程，
+        同一个事件循环中可以同时进行大量请求。
         
+        Args:
+            address: 要爬取的目标URL
+            method: HTTP请求方法，默认为GET
+            body: 请求体内容，可选
+            headers: HTTP请求头字典，可选
+            **kwargs: 其他请求参数（如timeout, retry_count等）
+            
+        Returns:
+            Dict[str, Any]: 爬取结果，包含状态和数据
+            
+        Raises:
+            ValueError: 当URL为空或无效时
+        """
+        target_url = address.strip()
+        if not target_url:
+            raise ValueError("目标URL不能为空")
+        
+        request_headers = self._build_request_headers(headers)
+        timeout = kwargs.get('timeout', self.config.CRAWLER_TIMEOUT)
         # 添加body（主要用于POST/PUT请求）
-        if body and method.upper() != 'GET':
-            request_kwargs['data'] = body
-
-        self.logger.info(f"开始爬取URL: {target_url}")
-        self.logger.info(f"HTTP方法: {method}")
-        self.logger.info(f"使用User-Agent: {request_kwargs['headers']['User-Agent']}")
+        method_upper = method.upper()
+        data = body if body and method_upper != 'GET' else None
         
         # 重试机制
         retry_count = kwargs.get('retry_count', self.config.CRAWLER_RETRY_COUNT)
         for attempt in range(retry_count):
+            # 每次重试使用新的User-Agent
+            if attempt > 0:
+                request_headers['User-Agent'] = self.user_agent_pool.get_random_user_agent()
+            
             try:
-                self.logger.debug(f"尝试第 {attempt + 1} 次请求")
-                
-                # 每次重试使用新的User-Agent
-                if attempt > 0:
-                    request_kwargs['headers']['User-Agent'] = self.user_agent_pool.get_random_user_agent()
-                    self.logger.info(f"重试使用新的User-Agent: {request_kwargs['headers']['User-Agent']}")
-                
-                # 根据method选择请求方式
-                if method.upper() == 'GET':
-                    response = self.session.get(target_url, **request_kwargs)
-                elif method.upper() == 'POST':
-                    response = self.session.post(target_url, **request_kwargs)
-                elif method.upper() == 'PUT':
-                    response = self.session.put(target_url, **request_kwargs)
-                elif method.upper() == 'DELETE':
-                    response = self.session.delete(target_url, **request_kwargs)
-                else:
-                    # 其他方法使用通用request
-                    response = self.session.request(method.upper(), target_url, **request_kwargs)
-                
-                # 处理HTTP响应
-                self.logger.info(f"收到HTTP响应，状态码: {response.status_code}")
-                result = self._handle_http_response(response, target_url)
-                
-                if result['status'] == 'success':
-                    self.logger.info(f"URL爬取成功: {target_url}")
-                else:
-                    self.logger.warning(f"URL爬取失败: {target_url}, 原因: {result.get('error')}")
-                
-                return result
-                
-            except (Timeout, ConnectionError) as e:
-                self.logger.warning(f"网络错误 (尝试 {attempt + 1}): {str(e)}")
-                if attempt < self.config.CRAWLER_RETRY_COUNT - 1:
-                    time.sleep(self.config.CRAWLER_RETRY_DELAY)
-                    continue
-                else:
-                    error_msg = f"网络错误，重试{retry_count}次后仍然失败: {str(e)}"
-                    self.logger.error(error_msg)
-                    return {
-                        'status': 'error',
-                        'error': error_msg,
-                        'url': target_url,
-                        'timestamp': datetime.now().isoformat()
-                    }
+                status, buffered = await self._fetch_async(method_upper, target_url, data,
+                                                           request_headers, timeout)
+                if buffered is None:
+                    return self._oversized_result(target_url, status)
                     
-            except RequestException as e:
+            except _ASYNC_NETWORK_ERRORS as e:
+                self.logger.warning("网络错误 (尝试 %d): %s", attempt + 1, e)
+                if attempt < retry_count - 1:
+                    await asyncio.sleep(self.config.CRAWLER_RETRY_DELAY)
+                    continue
+                error_msg = f"网络错误，重试{retry_count}次后仍然失败: {str(e)}"
+                self.logger.error(error_msg)
+                return self._error_result(error_msg, target_url)
+                
+            except _ASYNC_REQUEST_ERRORS as e:
                 error_msg = f"请求异常: {str(e)}"
                 self.logger.error(error_msg)
-                return {
-                    'status': 'error',
-                    'error': error_msg,
-                    'url': target_url,
-                    'timestamp': datetime.now().isoformat()
-                }
+                return self._error_result(error_msg, target_url)
             
-            except Exception as e:
-                error_msg = f"未预期的错误: {str(e)}"
-                self.logger.error(error_msg, exc_info=True)
-                return {
-                    'status': 'error',
-                    'error': error_msg,
-                    'url': target_url,
-                    'timestamp': datetime.now().isoformat()
-                }
+            # 处理HTTP响应
+            result = self._handle_http_response(buffered, target_url)
+            if result['status'] == 'success':
+                self.logger.info("URL爬取成功: %s", target_url)
+            else:
+                self.logger.warning("URL爬取失败: %s, 原因: %s", target_url, result.get('error'))
+            return result
+    
+    def _buffer_capped(self, response: requests.Response) -> Optional[_BufferedResponse]:
+        """
+        分块读取流式同步响应体，超过 CRAWLER_MAX_BODY 时立即停止
+        
+        Args:
+            response: 以 stream=True 发出的请求的响应
+            
+        Returns:
+            Optional[_BufferedResponse]: 已读取的响应，超过大小上限时返回None
+        """
+        max_body = self.config.CRAWLER_MAX_BODY
+        content_length = self._content_length(response)
+        if content_length is not None and content_length > max_body:
+            return None
+        
+        body = bytearray()
+        for chunk in response.iter_content(65536):
+            body += chunk
+            if len(body) > max_body:
+                return None
+        return _BufferedResponse(
+            response.status_code, response.headers,
+            body.decode(response.encoding or 'utf-8', errors='replace')
+        )
+    
+    async def _read_capped(self, response: Any, chunks: AsyncIterator[bytes]) -> Optional[bytes]:
+        """
+        分块读取异步响应体，超过 CRAWLER_MAX_BODY 时立即停止
+        
+        Args:
+            response: 异步HTTP响应，用于读取 Content-Length
+            chunks: 响应体分块迭代器
+            
+        Returns:
+            Optional[bytes]: 响应体，超过大小上限时返回None
+        """
+        max_body = self.config.CRAWLER_MAX_BODY
+        content_length = self._content_length(response)
+        if content_length is not None and content_length > max_body:
+            return None
+        
+        body = bytearray()
+        async for chunk in chunks:
+            body += chunk
+            if len(body) > max_body:
+                return None
+        return bytes(body)
+    
+    async def crawl_many(self, addresses: Iterable[str], save: bool = False, **kwargs) -> List[Dict[str, Any]]:
+        """
+        并发爬取多个URL
+        
+        同时进行的请求数不超过 CRAWLER_MAX_CONCURRENCY，避免触发目标站点的频率限制。
+        
+        Args:
+            addresses: 要爬取的目标URL
+            save: 是否在全部爬取完成后通过 save_address_infos 一次批量保存结果，
+                需要在应用上下文中调用
+            **kwargs: 传给 crawl_address_async 的其他请求参数
+            
+        Returns:
+            List[Dict[str, Any]]: 与 addresses 顺序一致的爬取结果
+            
+        Raises:
+            ValueError: 当存在空URL时
+        """
+        try:
+            return await self._crawl_many(list(addresses), save, **kwargs)
+        finally:
+            # 异步客户端绑定在当前事件循环上，asyncio.run 结束后无法再关闭，在批次结束时关闭
+            await self.aclose()
+    
+    async def _crawl_many(self, addresses: List[str], save: bool, **kwargs) -> List[Dict[str, Any]]:
+        """
+        并发爬取多个URL的实现，参数与返回值见 crawl_many
+        """
+        
+        # 按主机分组后轮流交错提交，按主机排序的输入不会在同一主机上排成串行的请求瀑布
+        groups: Dict[Optional[str], List[int]] = {}
+        for index, address in enumerate(addresses):
+            groups.setdefault(urlsplit(address.strip()).hostname, []).append(index)
+        order = [index for index in chain.from_iterable(zip_longest(*groups.values())) if index is not None]
+        
+        semaphore = asyncio.Semaphore(self.config.CRAWLER_MAX_CONCURRENCY)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(addresses)
+        spans: List[Tuple[float, float]] = [(0.0, 0.0)] * len(addresses)
+        
+        async def bounded_crawl(index: int) -> None:
+            async with semaphore:
+                started = time.monotonic()
+                results[index] = await self.crawl_address_async(addresses[index], **kwargs)
+                spans[index] = (started, time.monotonic())
+        
+        await asyncio.gather(*(bounded_crawl(index) for index in order))
+        self._log_waterfall(groups, spans)
+        
+        if save:
+            self.save_address_infos(results)
+        return results
+    
+    def _log_waterfall(self, groups: Dict[Optional[str], List[int]],
+                       spans: List[Tuple[float, float]]) -> None:
+        """
+        按主机输出请求瀑布评分
+        
+        评分为同一主机各请求耗时之和与首个请求开始到最后一个请求结束的跨度之比，
+        请求完全串行时接近1，并行程度越高越小。
+        
+        Args:
+            groups: 主机到请求下标的映射
+            spans: 每个请求的 (开始时刻, 结束时刻)
+        """
+        for host, indices in groups.items():
+            if len(indices) < 2:
+                continue
+            
+            host_spans = [spans[index] for index in indices]
+            busy = sum(end - start for start, end in host_spans)
+            wall = max(end for _, end in host_spans) - min(start for start, _ in host_spans)
+            if busy <= 0:
+                continue
+            
+            ratio = wall / busy
+            self.logger.debug("主机 %s 请求瀑布评分: %.2f (%d 个请求)", host, ratio, len(indices))
+            if ratio > self.WATERFALL_RATIO_THRESHOLD:
+                self.logger.warning("主机 %s 的 %d 个请求接近串行执行 (评分 %.2f)", host, len(indices), ratio)
+    
+    async def aclose(self) -> None:
+        """关闭异步HTTP客户端，需在创建客户端的事件循环中调用"""
+        client = self._aio_client
+        self._aio_client = None
+        self._aio_loop = None
+        if client is None or self._is_async_client_closed(client):
+            return
+        if self._is_http2_client(client):
+            await client.aclose()
+        else:
+            await client.close()
+    
+    @staticmethod
+    def _content_length(response: Any) -> Optional[int]:
+        """
+        读取响应头中的 Content-Length
+        
+        Args:
+            response: HTTP响应对象
+            
+        Returns:
+            Optional[int]: 响应体字节数，响应头缺失或无效时返回None
+        """
+        try:
+            return int(response.headers.get('Content-Length'))
+        except (TypeError, ValueError):
+            return None
+    
+    def _oversized_result(self, url: str, status_code: int) -> Dict[str, Any]:
+        """
+        构建响应体超过大小上限时的结果
+        
+        Args:
+            url: 请求的URL
+            status_code: HTTP状态码
+            
+        Returns:
+            Dict[str, Any]: 失败结果
+        """
+        error_msg = f"响应体过大 (超过 {self.config.CRAWLER_MAX_BODY} 字节)"
+        self.logger.warning("%s: %s", error_msg, url)
+        return {
+            'status': 'error',
+            'error': error_msg,
+            'url': url,
+            'status_code': status_code,
+            'timestamp': time.time_ns()
+        }
     
     def _handle_http_response(self, response: requests.Response, url: str) -> Dict[str, Any]:
         """
@@ -231,10 +815,11 @@ class CrawlerService:
             Dict[str, Any]: 处理结果
         """
         status_code = response.status_code
-        self.logger.debug(f"HTTP状态码: {status_code}")
+        self.logger.debug("HTTP状态码: %s", status_code)
         
         # 成功响应
         if 200 <= status_code < 300:
+            # 响应体大小上限已在读取时（_buffer_capped / _read_capped）检查
             try:
                 return self.parse_api_response(response, url)
             except Exception as e:
@@ -245,67 +830,31 @@ class CrawlerService:
                     'error': error_msg,
                     'url': url,
                     'status_code': status_code,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': time.time_ns()
                 }
         
         # 客户端错误 (4xx)
-        elif 400 <= status_code < 500:
-            error_messages = {
-                400: "请求参数错误",
-                401: "未授权访问",
-                403: "访问被禁止",
-                404: "API接口不存在",
-                429: "请求频率限制"
-            }
-            
-            error_msg = error_messages.get(
-                status_code, 
-                f"客户端错误 (状态码: {status_code})"
-            )
-            
-            self.logger.warning(f"客户端错误: {error_msg}")
-            return {
-                'status': 'error',
-                'error': error_msg,
-                'url': url,
-                'status_code': status_code,
-                'timestamp': datetime.now().isoformat()
-            }
+        if 400 <= status_code < 500:
+            error_msg = _CLIENT_ERRORS.get(status_code) or f"客户端错误 (状态码: {status_code})"
+            self.logger.warning("客户端错误: %s", error_msg)
         
         # 服务器错误 (5xx)
         elif 500 <= status_code < 600:
-            error_messages = {
-                500: "服务器内部错误",
-                502: "网关错误",
-                503: "服务不可用",
-                504: "网关超时"
-            }
-            
-            error_msg = error_messages.get(
-                status_code,
-                f"服务器错误 (状态码: {status_code})"
-            )
-            
-            self.logger.error(f"服务器错误: {error_msg}")
-            return {
-                'status': 'error',
-                'error': error_msg,
-                'url': url,
-                'status_code': status_code,
-                'timestamp': datetime.now().isoformat()
-            }
+            error_msg = _SERVER_ERRORS.get(status_code) or f"服务器错误 (状态码: {status_code})"
+            self.logger.error("服务器错误: %s", error_msg)
         
         # 其他状态码
         else:
             error_msg = f"未预期的HTTP状态码: {status_code}"
             self.logger.error(error_msg)
-            return {
-                'status': 'error',
-                'error': error_msg,
-                'url': url,
-                'status_code': status_code,
-                'timestamp': datetime.now().isoformat()
-            }
+        
+        return {
+            'status': 'error',
+            'error': error_msg,
+            'url': url,
+            'status_code': status_code,
+            'timestamp': time.time_ns()
+        }
     
     def parse_api_response(self, response: requests.Response, url: str) -> Dict[str, Any]:
         """
@@ -323,38 +872,20 @@ class CrawlerService:
             json.JSONDecodeError: 当JSON解析失败时
         """
         try:
-            # 尝试解析JSON响应
-            response_data = response.json()
-            address_data = response_data.get("address", {});
-            # self.logger.debug(f"API响应数据: {response_data}")
-            
-            # 提取地址信息
-            # address_info = self._extract_address_info(response_data, url)
-            address_info = AddressInfo()
-            if address_data:
-                address_info.address = address_data.get("Address")
-                address_info.telephone = address_data.get("Telephone")
-                address_info.city = address_data.get("City")
-                address_info.zip_code = address_data.get("Zip_Code")
-                address_info.state = address_data.get("State")
-                address_info.state_full = address_data.get("State_Full")
-                address_info.country = address_data.get("Country")
-                address_info.source_url = url
-            return {
-                'status': 'success',
-                'url': url,
-                'data': address_info,
-                'raw_response': response_data,
-                'status_code': response.status_code,
-                'timestamp': datetime.now().isoformat()
-            }
+            # 尝试解析JSON响应；requests 响应直接解析原始字节，跳过编码检测
+            if isinstance(response, requests.Response):
+                response_data = _json_loads(response.content)
+            else:
+                response_data = response.json()
+            self.logger.debug("API响应数据: %s", response_data)
+            return self._build_address_result(response_data, url, response.status_code)
             
         except json.JSONDecodeError as e:
             error_msg = f"JSON解析失败: {str(e)}"
-            self.logger.error(f"{error_msg}, 响应内容: {response.text[:200]}")
             
-            # 尝试获取文本内容
+            # 尝试获取文本内容，只解码一次响应体
             text_content = response.text.strip()
+            self.logger.error("%s, 响应内容: %s", error_msg, text_content[:200])
             if text_content:
                 return {
                     'status': 'warning',
@@ -362,7 +893,7 @@ class CrawlerService:
                     'data': {'raw_text': text_content},
                     'error': error_msg,
                     'status_code': response.status_code,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': time.time_ns()
                 }
             else:
                 raise ValueError("响应内容为空")
@@ -373,6 +904,29 @@ class CrawlerService:
             raise ValueError(error_msg)
     
     
+    def _build_address_result(self, response_data: Dict[str, Any], url: str, status_code: int) -> Dict[str, Any]:
+        """
+        从响应JSON中提取地址信息并生成爬取结果
+        
+        每次调用都创建新的 AddressInfo，缓存的响应JSON可以重复使用。
+        
+        Args:
+            response_data: 响应JSON
+            url: 原始请求URL
+            status_code: HTTP状态码
+            
+        Returns:
+            Dict[str, Any]: 爬取成功的结果
+        """
+        return {
+            'status': 'success',
+            'url': url,
+            'data': _extract_address_info(response_data, url),
+            'raw_response': response_data,
+            'status_code': status_code,
+            'timestamp': time.time_ns()
+        }
+    
     def save_address_info(self, address_data: Dict[str, Any]) -> Optional[AddressInfo]:
         """
         保存地址信息到数据库
@@ -401,14 +955,14 @@ class CrawlerService:
                 ).first()
                 
                 if existing_record:
-                    self.logger.info(f"发现重复地址记录，跳过保存: {data.city} - {data.address}")
+                    self.logger.info("发现重复地址记录，跳过保存: %s - %s", data.city, data.address)
                     return existing_record
             
             # 保存到数据库
             db.session.add(data)
             db.session.commit()
             
-            self.logger.info(f"地址信息已保存: {data.address}")
+            self.logger.info("地址信息已保存: %s", data.address)
             return data
             
         except SQLAlchemyError as e:
@@ -423,6 +977,63 @@ class CrawlerService:
             self.logger.error(error_msg, exc_info=True)
             return None
     
+    def save_address_infos(self, results: Iterable[Dict[str, Any]]) -> int:
+        """
+        批量保存多个爬取结果
+        
+        与 save_address_info 一样按城市和地址组合去重，已存在的组合通过一次查询找出，
+        新记录使用一条批量INSERT写入并只提交一次。
+        
+        Args:
+            results: 爬取结果列表
+            
+        Returns:
+            int: 新保存的记录数，失败时返回0
+        """
+        rows: List[Dict[str, Any]] = []
+        keyed_rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for result in results:
+            data = result.get('data') if result.get('status') == 'success' else None
+            if not isinstance(data, AddressInfo):
+                continue
+            if not data.address:
+                # 地址为必填字段，缺失时跳过，避免整批插入失败
+                self.logger.warning("地址为空，跳过保存: %s", result.get('url'))
+                continue
+            
+            row = _to_row_dict(data)
+            if data.city:
+                keyed_rows.setdefault((data.city, data.address), row)
+            else:
+                rows.append(row)
+        
+        try:
+            if keyed_rows:
+                # 一次查询找出已存在的城市和地址组合
+                existing = db.session.execute(
+                    select(AddressInfo.city, AddressInfo.address).where(
+                        AddressInfo.city.in_({city for city, _ in keyed_rows}),
+                        AddressInfo.address.in_({address for _, address in keyed_rows})
+                    )
+                ).all()
+                for city, address in existing:
+                    keyed_rows.pop((city, address), None)
+                rows.extend(keyed_rows.values())
+            
+            if not rows:
+                return 0
+            
+            db.session.execute(insert(AddressInfo), rows)
+            db.session.commit()
+            
+            self.logger.info(f"批量保存地址信息 {len(rows)} 条")
+            return len(rows)
+            
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            self.logger.error(f"批量保存地址信息失败: {str(e)}")
+            return 0
+    
     def crawl_and_save(
         self,
         address: str,
@@ -446,12 +1057,23 @@ class CrawlerService:
         """
         # 爬取地址
         crawl_result = self.crawl_address(address, method, body, headers, **kwargs)
-        country = json.loads(body).get("path", "")
-        if country == "/":
-            crawl_result['data'].country = 'us'
-        else:
-            country = country.replace("/", "").replace("-address", "");
-            crawl_result['data'].country = country
+        return self.save_crawl_result(crawl_result, body)
+    
+    def save_crawl_result(self, crawl_result: Dict[str, Any], body: Optional[str] = None) -> Dict[str, Any]:
+        """
+        补全国家信息并保存爬取结果
+        
+        只涉及数据库操作，需在应用上下文所在的线程中调用；
+        网络请求部分（crawl_address）可以在其他线程中并发执行。
+        
+        Args:
+            crawl_result: crawl_address 返回的爬取结果
+            body: 请求体内容，用于解析国家信息
+            
+        Returns:
+            Dict[str, Any]: 包含爬取结果和保存状态的字典
+        """
+        crawl_result['data'].country = _country_from_body(body)
         # 如果爬取成功，保存结果
         if crawl_result['status'] == 'success':
             saved_info = self.save_address_info(crawl_result)
@@ -466,6 +1088,17 @@ class CrawlerService:
     
     def close(self) -> None:
         """关闭服务，清理资源"""
+        # 异步客户端只能在其事件循环中关闭，循环仍可用且空闲时在这里关闭
+        client = self._aio_client
+        loop = self._aio_loop
+        if client is not None and not self._is_async_client_closed(client):
+            if loop is not None and not loop.is_closed() and not loop.is_running():
+                loop.run_until_complete(self.aclose())
+            else:
+                self.logger.warning("异步HTTP客户端所在的事件循环已关闭或正在运行，无法关闭客户端；请在该事件循环中调用 aclose()")
+                self._aio_client = None
+                self._aio_loop = None
+        
         if self.session:
             self.session.close()
             self.logger.info("爬虫服务已关闭")
\ No newline at end of file
@@ -210,7 +210,7 @@ class TaskService:
                 task.visited_num = visited_num
             elif increment_visited > 0:
                 old_visited = task.visited_num
-                task.visited_num += increment_visited
+                task.increment_visited(increment_visited)
                 self.logger.debug(f"增加已访问数量: {old_visited} -> {task.visited_num} (+{increment_visited})")
             
             # 更新重试次数
@@ -0,0 +1,85 @@
+"""
+分片计数器模块
+
+该模块提供多线程环境下的计数器实现：每个线程固定写入自己的分片，
+读取时再汇总所有分片，避免多个线程争用同一个计数值。
+"""
+
+import itertools
+import threading
+from typing import List
+
+
+class ShardedCounter:
+    """分片计数器
+    
+    线程首次写入时分配一个分片编号，之后的累加只锁定该分片；
+    value() 汇总所有分片，适合写多读少的统计场景。
+    
+    Attributes:
+        shard_count: 分片数量
+    """
+    
+    def __init__(self, shard_count: int = 16) -> None:
+        """初始化分片计数器
+        
+        Args:
+            shard_count: 分片数量，默认16
+            
+        Raises:
+            ValueError: 当分片数量不是正整数时
+        """
+        if shard_count <= 0:
+            raise ValueError("分片数量必须为正整数")
+        
+        self.shard_count: int = shard_count
+        # 每个分片包装成单元素列表，在分片锁内原地累加
+        self._shards: List[List[int]] = [[0] for _ in range(shard_count)]
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(shard_count)]
+        self._local = threading.local()
+        self._next_index = itertools.count()
+    
+    def _shard_index(self) -> int:
+        """获取当前线程对应的分片编号
+        
+        Returns:
+            int: 分片编号
+        """
+        try:
+            return self._local.index
+        except AttributeError:
+            index = next(self._next_index) % self.shard_count
+            self._local.index = index
+            return index
+    
+    def add(self, amount: int = 1) -> None:
+        """累加计数
+        
+        Args:
+            amount: 增加的数量，默认为1
+        """
+        index = self._shard_index()
+        with self._locks[index]:
+            self._shards[index][0] += amount
+    
+    def value(self) -> int:
+        """获取当前计数
+        
+        Returns:
+            int: 所有分片之和
+        """
+        return sum(shard[0] for shard in self._shards)
+    
+    def reset(self) -> None:
+        """将所有分片清零"""
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard[0] = 0
+    
+    def __int__(self) -> int:
+        """返回当前计数"""
+        return self.value()
+    
+    def __repr__(self) -> str:
+        """返回对象的字符串表示"""
+        return f"<ShardedCounter(value={self.value()}, shards={self.shard_count})>"
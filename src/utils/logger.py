@@ -11,15 +11,21 @@
 创建时间: 2025-09-10
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from src.config import get_logging_config
 
 
+# 已切换为异步输出的记录器名称 -> 对应的后台监听器
+_queue_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+
 def setup_logger(
     name: str,
     level: Optional[str] = None,
@@ -228,4 +234,42 @@ def remove_file_handler(logger_name: str, file_path: str) -> bool:
                 handler.close()
                 return True
     
-    return False
\ No newline at end of file
+    return False
+
+
+def queue_logger(logger: logging.Logger) -> None:
+    """
+    将日志记录器切换为异步输出
+    
+    原有处理器移交给后台 QueueListener 线程，记录器只保留一个 QueueHandler，
+    调用方写日志时只需把记录放入队列；重复调用不会重复切换。
+    
+    Args:
+        logger: 日志记录器
+    """
+    if logger.name in _queue_listeners or not logger.handlers:
+        return
+    
+    handlers = logger.handlers[:]
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    
+    listener.start()
+    _queue_listeners[logger.name] = listener
+
+
+def _stop_queue_listeners() -> None:
+    """停止所有后台日志监听器，写出队列中剩余的记录"""
+    while _queue_listeners:
+        _, listener = _queue_listeners.popitem()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(_stop_queue_listeners)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+ShardedCounter单元测试模块
+
+该模块包含分片计数器的单元测试，用于验证多线程并发累加、读取和清零的正确性。
+"""
+
+import sys
+import os
+import threading
+import unittest
+from typing import List
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.counters import ShardedCounter
+
+
+class TestShardedCounter(unittest.TestCase):
+    """ShardedCounter单元测试类"""
+    
+    THREAD_COUNT = 32
+    ADDS_PER_THREAD = 2000
+    
+    def _run_threads(self, target, count: int = THREAD_COUNT) -> None:
+        """启动多个线程同时执行目标函数并等待全部结束"""
+        barrier = threading.Barrier(count)
+        
+        def worker() -> None:
+            barrier.wait()
+            target()
+        
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    def test_invalid_shard_count(self) -> None:
+        """测试分片数量必须为正整数"""
+        with self.assertRaises(ValueError):
+            ShardedCounter(0)
+        with self.assertRaises(ValueError):
+            ShardedCounter(-1)
+    
+    def test_single_thread_add_value_reset(self) -> None:
+        """测试单线程累加、读取和清零"""
+        counter = ShardedCounter(4)
+        counter.add()
+        counter.add(5)
+        
+        self.assertEqual(counter.value(), 6)
+        self.assertEqual(int(counter), 6)
+        self.assertIn("value=6", repr(counter))
+        
+        counter.reset()
+        self.assertEqual(counter.value(), 0)
+    
+    def test_concurrent_add(self) -> None:
+        """测试线程数多于分片数时并发累加不丢失计数"""
+        counter = ShardedCounter(4)
+        
+        def add_many() -> None:
+            for _ in range(self.ADDS_PER_THREAD):
+                counter.add()
+        
+        self._run_threads(add_many)
+        
+        self.assertEqual(counter.value(), self.THREAD_COUNT * self.ADDS_PER_THREAD)
+    
+    def test_concurrent_value_is_monotonic(self) -> None:
+        """测试并发累加期间读取的计数不会减少"""
+        counter = ShardedCounter(8)
+        observed: List[int] = []
+        done = threading.Event()
+        
+        def read_until_done() -> None:
+            while not done.is_set():
+                observed.append(counter.value())
+        
+        def add_many() -> None:
+            for _ in range(self.ADDS_PER_THREAD):
+                counter.add(2)
+        
+        reader = threading.Thread(target=read_until_done)
+        reader.start()
+        try:
+            self._run_threads(add_many)
+        finally:
+            done.set()
+            reader.join()
+        
+        self.assertEqual(observed, sorted(observed))
+        self.assertEqual(counter.value(), 2 * self.THREAD_COUNT * self.ADDS_PER_THREAD)
+    
+    def test_reset_during_concurrent_add(self) -> None:
+        """测试并发累加期间清零，之后的累加仍被完整统计"""
+        counter = ShardedCounter(4)
+        total = self.THREAD_COUNT * self.ADDS_PER_THREAD
+        
+        def add_and_reset() -> None:
+            for i in range(self.ADDS_PER_THREAD):
+                counter.add()
+                if i == self.ADDS_PER_THREAD // 2:
+                    counter.reset()
+        
+        self._run_threads(add_and_reset)
+        
+        value = counter.value()
+        self.assertGreaterEqual(value, 0)
+        self.assertLessEqual(value, total)
+        
+        # 所有线程结束后清零，再次并发累加的结果与初始状态一致
+        counter.reset()
+        self.assertEqual(counter.value(), 0)
+        
+        def add_many() -> None:
+            for _ in range(self.ADDS_PER_THREAD):
+                counter.add()
+        
+        self._run_threads(add_many)
+        self.assertEqual(counter.value(), total)
+
+
+if __name__ == '__main__':
+    unittest.main()
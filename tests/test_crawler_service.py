@@ -8,10 +8,12 @@ CrawlerService集成测试模块
 
 import sys
 import os
+import io
+import asyncio
 import unittest
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Union
 from unittest.mock import patch, MagicMock, Mock
 
 # 添加项目根目录到Python路径
@@ -25,6 +27,105 @@ from src.services.crawler_service import CrawlerService
 from src.models.address_info import AddressInfo
 
 
+def _address_body(address: str) -> bytes:
+    """构造地址接口的响应体"""
+    return json.dumps({
+        "address": {"Address": address, "City": "New York", "State": "NY"}
+    }).encode()
+
+
+class _TrackingStream(io.BytesIO):
+    """记录已读取字节数的内存流，用作 requests 响应的原始流"""
+    
+    def __init__(self, body: bytes) -> None:
+        super().__init__(body)
+        self.bytes_read = 0
+    
+    def read(self, size: Optional[int] = -1) -> bytes:
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def _streamed_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """构造以 stream=True 返回的 requests 响应，响应体从内存流中读取"""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers or {})
+    response.raw = _TrackingStream(body)
+    response.encoding = 'utf-8'
+    return response
+
+
+class _FakeAiohttpResponse:
+    """模拟 aiohttp 响应，响应体按固定大小分块返回"""
+    
+    def __init__(self, status: int = 200, body: bytes = b"",
+                 headers: Optional[Dict[str, str]] = None, chunk_size: int = 65536) -> None:
+        self.status = status
+        self.headers = headers or {}
+        self.content = self
+        self.chunks_read = 0
+        self._body = body
+        self._chunk_size = chunk_size
+    
+    async def iter_chunked(self, size: int):
+        """按块返回响应体，忽略调用方指定的块大小"""
+        for start in range(0, len(self._body), self._chunk_size):
+            self.chunks_read += 1
+            yield self._body[start:start + self._chunk_size]
+    
+    def get_encoding(self) -> str:
+        return 'utf-8'
+
+
+class _FakeAiohttpSession:
+    """模拟 aiohttp.ClientSession，记录请求顺序和同时进行的请求数"""
+    
+    def __init__(self, respond: Callable[[str, str], Union[_FakeAiohttpResponse, Exception]],
+                 delay: float = 0.0) -> None:
+        self.closed = False
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._respond = respond
+        self._delay = delay
+    
+    def request(self, method: str, url: str, **kwargs) -> "_FakeRequestContext":
+        self.calls.append(url)
+        return _FakeRequestContext(self, self._respond(method, url))
+    
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeRequestContext:
+    """模拟 session.request() 返回的异步上下文管理器"""
+    
+    def __init__(self, session: _FakeAiohttpSession,
+                 outcome: Union[_FakeAiohttpResponse, Exception]) -> None:
+        self._session = session
+        self._outcome = outcome
+    
+    async def __aenter__(self) -> _FakeAiohttpResponse:
+        session = self._session
+        session.in_flight += 1
+        session.max_in_flight = max(session.max_in_flight, session.in_flight)
+        try:
+            await asyncio.sleep(session._delay)
+        except BaseException:
+            session.in_flight -= 1
+            raise
+        if isinstance(self._outcome, Exception):
+            session.in_flight -= 1
+            raise self._outcome
+        return self._outcome
+    
+    async def __aexit__(self, *exc_info) -> bool:
+        self._session.in_flight -= 1
+        return False
+
+
 class TestCrawlerService(unittest.TestCase):
     """CrawlerService集成测试类"""
     
@@ -633,6 +734,492 @@ class TestCrawlerService(unittest.TestCase):
         # 这里我们主要确保方法可以正常调用而不抛出异常
         self.assertTrue(True)  # 如果上面的close()调用成功，测试通过
 
+    
+    @staticmethod
+    def _mock_address_response(status_code: int = 200,
+                               headers: Optional[Dict[str, str]] = None,
+                               address: str = "123 Main St") -> Mock:
+        """构造带响应头的地址接口模拟响应"""
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.headers = headers or {}
+        mock_response.json.return_value = {
+            "address": {
+                "Address": address,
+                "City": "New York",
+                "State": "NY"
+            }
+        }
+        return mock_response
+    
+    @patch('requests.Session.get')
+    def test_conditional_get_sends_validators(self, mock_get: Mock) -> None:
+        """测试再次GET同一URL时携带上次响应的校验器"""
+        test_url = "https://example.com/api/address"
+        mock_get.return_value = self._mock_address_response(headers={
+            'ETag': '"v1"',
+            'Last-Modified': 'Wed, 01 May 2024 00:00:00 GMT'
+        })
+        
+        self.crawler_service.crawl_address(test_url)
+        self.crawler_service.crawl_address(test_url)
+        
+        first_headers = mock_get.call_args_list[0][1]['headers']
+        second_headers = mock_get.call_args_list[1][1]['headers']
+        self.assertNotIn('If-None-Match', first_headers)
+        self.assertNotIn('If-Modified-Since', first_headers)
+        self.assertEqual(second_headers['If-None-Match'], '"v1"')
+        self.assertEqual(second_headers['If-Modified-Since'], 'Wed, 01 May 2024 00:00:00 GMT')
+    
+    @patch('requests.Session.get')
+    def test_conditional_get_not_modified_uses_cached_json(self, mock_get: Mock) -> None:
+        """测试304响应使用缓存的响应JSON重新生成结果"""
+        test_url = "https://example.com/api/address"
+        first_response = self._mock_address_response(headers={'ETag': '"v1"'})
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        not_modified.json.side_effect = ValueError("304响应没有响应体")
+        mock_get.side_effect = [first_response, not_modified]
+        
+        first_result = self.crawler_service.crawl_address(test_url)
+        second_result = self.crawler_service.crawl_address(test_url)
+        
+        self.assertEqual(second_result['status'], 'success')
+        self.assertEqual(second_result['status_code'], 304)
+        self.assertEqual(second_result['raw_response'], first_result['raw_response'])
+        self.assertEqual(second_result['data'].address, "123 Main St")
+        self.assertEqual(second_result['data'].source_url, test_url)
+        # 每次都生成新的地址对象，缓存的结果可以重复保存
+        self.assertIsNot(second_result['data'], first_result['data'])
+        not_modified.json.assert_not_called()
+    
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_conditional_cache_skips_post(self, mock_post: Mock, mock_get: Mock) -> None:
+        """测试POST请求的响应不进入条件请求缓存"""
+        test_url = "https://example.com/api/address"
+        mock_post.return_value = self._mock_address_response(headers={'ETag': '"v1"'})
+        mock_get.return_value = self._mock_address_response()
+        
+        self.crawler_service.crawl_address(test_url, 'POST', '{"path": "/"}')
+        self.crawler_service.crawl_address(test_url, 'POST', '{"path": "/"}')
+        self.crawler_service.crawl_address(test_url)
+        
+        self.assertNotIn('If-None-Match', mock_post.call_args_list[1][1]['headers'])
+        self.assertNotIn('If-None-Match', mock_get.call_args[1]['headers'])
+    
+    @patch('requests.Session.get')
+    def test_conditional_cache_evicts_least_recently_used(self, mock_get: Mock) -> None:
+        """测试条件请求缓存达到上限时淘汰最久未使用的URL"""
+        url_a = "https://example.com/api/a"
+        url_b = "https://example.com/api/b"
+        url_c = "https://example.com/api/c"
+        mock_get.return_value = self._mock_address_response(headers={'ETag': '"v1"'})
+        
+        with patch.object(CrawlerService, 'CONDITIONAL_CACHE_SIZE', 2):
+            self.crawler_service.crawl_address(url_a)
+            self.crawler_service.crawl_address(url_b)
+            # 再次访问 a，使 b 成为最久未使用的URL
+            self.crawler_service.crawl_address(url_a)
+            self.crawler_service.crawl_address(url_c)
+            
+            mock_get.reset_mock()
+            self.crawler_service.crawl_address(url_b)
+            self.crawler_service.crawl_address(url_c)
+        
+        b_headers = mock_get.call_args_list[0][1]['headers']
+        c_headers = mock_get.call_args_list[1][1]['headers']
+        self.assertNotIn('If-None-Match', b_headers)
+        self.assertEqual(c_headers['If-None-Match'], '"v1"')
+
+    
+    def test_save_address_infos_deduplicates_and_commits_once(self) -> None:
+        """测试批量保存按城市和地址去重并只提交一次"""
+        existing = AddressInfo(address="1 Old Rd", city="Boston")
+        db.session.add(existing)
+        db.session.commit()
+        
+        def success(address: Optional[str], city: Optional[str]) -> Dict[str, Any]:
+            return {
+                'status': 'success',
+                'url': 'https://example.com/api/address',
+                'data': AddressInfo(address=address, city=city)
+            }
+        
+        results = [
+            success("1 Old Rd", "Boston"),       # 数据库中已存在
+            success("2 New St", "Boston"),
+            success("2 New St", "Boston"),       # 本批内重复
+            success("1 Old Rd", "Chicago"),      # 地址相同但城市不同
+            success("3 No City Ave", None),      # 没有城市时不参与去重
+            success(None, "Boston"),             # 缺少地址时跳过
+            {'status': 'error', 'url': 'https://example.com/api/address', 'error': '爬取失败'},
+        ]
+        
+        with patch.object(db.session, 'commit', wraps=db.session.commit) as mock_commit:
+            saved_count = self.crawler_service.save_address_infos(results)
+        
+        self.assertEqual(saved_count, 3)
+        mock_commit.assert_called_once()
+        
+        saved = {
+            (info.city, info.address)
+            for info in db.session.query(AddressInfo).all()
+        }
+        self.assertEqual(saved, {
+            ("Boston", "1 Old Rd"),
+            ("Boston", "2 New St"),
+            ("Chicago", "1 Old Rd"),
+            (None, "3 No City Ave"),
+        })
+    
+    def test_save_address_infos_nothing_to_save(self) -> None:
+        """测试批量保存没有新记录时不提交"""
+        results = [
+            {'status': 'error', 'url': 'https://example.com/api/address', 'error': '爬取失败'},
+            {'status': 'success', 'url': 'https://example.com/api/address', 'data': AddressInfo()},
+        ]
+        
+        with patch.object(db.session, 'commit', wraps=db.session.commit) as mock_commit:
+            saved_count = self.crawler_service.save_address_infos(results)
+        
+        self.assertEqual(saved_count, 0)
+        mock_commit.assert_not_called()
+        self.assertEqual(db.session.query(AddressInfo).count(), 0)
+
+    
+    @patch('requests.Session.get')
+    def test_body_cap_declared_content_length(self, mock_get: Mock) -> None:
+        """测试声明的 Content-Length 超过上限时不读取响应体"""
+        response = _streamed_response(_address_body("1 Main St"), {'Content-Length': '1000000'})
+        mock_get.return_value = response
+        
+        with patch.object(self.crawler_service.config, 'CRAWLER_MAX_BODY', 1024):
+            result = self.crawler_service.crawl_address("https://example.com/api/a")
+        
+        self.assertEqual(result['status'], 'error')
+        self.assertIn("响应体过大", result['error'])
+        self.assertEqual(mock_get.call_args[1]['stream'], True)
+        self.assertEqual(response.raw.bytes_read, 0)
+        self.assertTrue(response.raw.closed)
+    
+    @patch('requests.Session.get')
+    def test_body_cap_chunked_body_without_content_length(self, mock_get: Mock) -> None:
+        """测试没有 Content-Length 的响应体超过上限时停止读取"""
+        body = b"x" * (4 * 65536)
+        response = _streamed_response(body)
+        mock_get.return_value = response
+        
+        with patch.object(self.crawler_service.config, 'CRAWLER_MAX_BODY', 16):
+            result = self.crawler_service.crawl_address("https://example.com/api/a")
+        
+        self.assertEqual(result['status'], 'error')
+        self.assertIn("响应体过大", result['error'])
+        # 第一块已超过上限，剩余的响应体没有被读取
+        self.assertLess(response.raw.bytes_read, len(body))
+    
+    @patch('requests.Session.get')
+    def test_body_cap_exactly_at_limit(self, mock_get: Mock) -> None:
+        """测试响应体大小恰好等于上限时正常解析"""
+        body = _address_body("1 Main St")
+        mock_get.side_effect = [
+            _streamed_response(body, {'Content-Length': str(len(body))}),
+            _streamed_response(body),
+        ]
+        
+        with patch.object(self.crawler_service.config, 'CRAWLER_MAX_BODY', len(body)):
+            declared = self.crawler_service.crawl_address("https://example.com/api/a")
+            chunked = self.crawler_service.crawl_address("https://example.com/api/b")
+        
+        for result in (declared, chunked):
+            self.assertEqual(result['status'], 'success')
+            self.assertEqual(result['data'].address, "1 Main St")
+
+
+class TestCrawlerServiceAsync(unittest.TestCase):
+    """CrawlerService异步爬取测试类，使用模拟的 aiohttp 会话"""
+    
+    def setUp(self) -> None:
+        """测试前的准备工作"""
+        self.app = create_app('testing')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        self.crawler_service = CrawlerService()
+        config = self.crawler_service.config
+        for name, value in (('CRAWLER_HTTP2', False), ('CRAWLER_RETRY_DELAY', 0)):
+            patcher = patch.object(config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def tearDown(self) -> None:
+        """测试后的清理工作"""
+        self.crawler_service.close()
+        self.app_context.pop()
+    
+    def _use_session(self, session: _FakeAiohttpSession) -> MagicMock:
+        """让服务创建异步客户端时得到模拟会话"""
+        patcher = patch('src.services.crawler_service.aiohttp')
+        mock_aiohttp = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_aiohttp.ClientSession.return_value = session
+        return mock_aiohttp
+    
+    def test_crawl_address_async_success(self) -> None:
+        """测试异步爬取成功"""
+        session = _FakeAiohttpSession(
+            lambda method, url: _FakeAiohttpResponse(body=_address_body("1 Main St"))
+        )
+        self._use_session(session)
+        
+        async def run() -> Dict[str, Any]:
+            try:
+                return await self.crawler_service.crawl_address_async("https://example.com/api/a")
+            finally:
+                await self.crawler_service.aclose()
+        
+        result = asyncio.run(run())
+        
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['status_code'], 200)
+        self.assertEqual(result['data'].address, "1 Main St")
+        self.assertEqual(session.calls, ["https://example.com/api/a"])
+    
+    def test_crawl_address_async_retry_then_fail(self) -> None:
+        """测试网络错误重试 retry_count 次后返回失败结果"""
+        session = _FakeAiohttpSession(lambda method, url: asyncio.TimeoutError())
+        self._use_session(session)
+        
+        async def run() -> Dict[str, Any]:
+            try:
+                return await self.crawler_service.crawl_address_async(
+                    "https://example.com/api/a", retry_count=3
+                )
+            finally:
+                await self.crawler_service.aclose()
+        
+        result = asyncio.run(run())
+        
+        self.assertEqual(result['status'], 'error')
+        self.assertIn("重试3次后仍然失败", result['error'])
+        self.assertEqual(len(session.calls), 3)
+    
+    def test_crawl_address_async_retry_then_succeed(self) -> None:
+        """测试网络错误后重试成功"""
+        outcomes = [asyncio.TimeoutError(), _FakeAiohttpResponse(body=_address_body("1 Main St"))]
+        session = _FakeAiohttpSession(lambda method, url: outcomes.pop(0))
+        self._use_session(session)
+        
+        async def run() -> Dict[str, Any]:
+            try:
+                return await self.crawler_service.crawl_address_async(
+                    "https://example.com/api/a", retry_count=3
+                )
+            finally:
+                await self.crawler_service.aclose()
+        
+        result = asyncio.run(run())
+        
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(len(session.calls), 2)
+    
+    def test_crawl_many_respects_concurrency_limit(self) -> None:
+        """测试并发爬取时同时进行的请求数不超过 CRAWLER_MAX_CONCURRENCY"""
+        session = _FakeAiohttpSession(
+            lambda method, url: _FakeAiohttpResponse(body=_address_body(url)),
+            delay=0.01
+        )
+        self._use_session(session)
+        addresses = [f"https://host{i % 3}.example.com/api/{i}" for i in range(10)]
+        
+        with patch.object(self.crawler_service.config, 'CRAWLER_MAX_CONCURRENCY', 2):
+            results = asyncio.run(self.crawler_service.crawl_many(addresses))
+        
+        self.assertEqual(session.max_in_flight, 2)
+        self.assertEqual(len(session.calls), len(addresses))
+        self.assertTrue(all(result['status'] == 'success' for result in results))
+    
+    def test_crawl_address_async_oversized_body(self) -> None:
+        """测试异步响应体超过 CRAWLER_MAX_BODY 时返回失败结果"""
+        session = _FakeAiohttpSession(
+            lambda method, url: _FakeAiohttpResponse(body=b"x" * 64, chunk_size=8)
+        )
+        self._use_session(session)
+        
+        async def run() -> Dict[str, Any]:
+            try:
+                return await self.crawler_service.crawl_address_async("https://example.com/api/a")
+            finally:
+                await self.crawler_service.aclose()
+        
+        with patch.object(self.crawler_service.config, 'CRAWLER_MAX_BODY', 16):
+            result = asyncio.run(run())
+        
+        self.assertEqual(result['status'], 'error')
+        self.assertIn("响应体过大", result['error'])
+        self.assertEqual(result['status_code'], 200)
+    
+    def test_crawl_many_closes_client(self) -> None:
+        """测试 crawl_many 结束时关闭异步客户端，请求失败时同样关闭"""
+        session = _FakeAiohttpSession(
+            lambda method, url: _FakeAiohttpResponse(body=_address_body(url))
+        )
+        self._use_session(session)
+        
+        asyncio.run(self.crawler_service.crawl_many(["https://example.com/api/a"]))
+        
+        self.assertTrue(session.closed)
+        self.assertIsNone(self.crawler_service._aio_client)
+        
+        # 存在空URL时抛出异常，客户端仍被关闭
+        failing_session = _FakeAiohttpSession(
+            lambda method, url: _FakeAiohttpResponse(body=_address_body(url))
+        )
+        self._use_session(failing_session)
+        with self.assertRaises(ValueError):
+            asyncio.run(self.crawler_service.crawl_many(["https://example.com/api/a", "  "]))
+        
+        self.assertTrue(failing_session.closed)
+        self.assertIsNone(self.crawler_service._aio_client)
+    
+    def test_crawl_many_interleaves_hosts_and_keeps_input_order(self) -> None:
+        """测试按主机轮流交错发起请求，结果仍按输入顺序返回"""
+        session = _FakeAiohttpSession(
+            lambda method, url: _FakeAiohttpResponse(body=_address_body(url))
+        )
+        self._use_session(session)
+        addresses = [
+            "https://a.example.com/1",
+            "https://a.example.com/2",
+            "https://a.example.com/3",
+            "https://b.example.com/1",
+            "https://c.example.com/1",
+            "https://c.example.com/2",
+        ]
+        
+        # 并发数为1时请求按提交顺序依次发出
+        with patch.object(self.crawler_service.config, 'CRAWLER_MAX_CONCURRENCY', 1):
+            results = asyncio.run(self.crawler_service.crawl_many(addresses))
+        
+        self.assertEqual(session.calls, [
+            "https://a.example.com/1",
+            "https://b.example.com/1",
+            "https://c.example.com/1",
+            "https://a.example.com/2",
+            "https://c.example.com/2",
+            "https://a.example.com/3",
+        ])
+        self.assertEqual([result['data'].address for result in results], addresses)
+    
+    def test_log_waterfall_warns_on_serial_host(self) -> None:
+        """测试同一主机的请求串行执行时输出警告，并行执行或只有一个请求时不警告"""
+        groups = {
+            "serial.example.com": [0, 1, 2],
+            "parallel.example.com": [3, 4, 5],
+            "single.example.com": [6],
+        }
+        spans = [
+            (0.0, 1.0), (1.0, 2.0), (2.0, 3.0),   # 首尾相接，评分为1
+            (0.0, 1.0), (0.0, 1.0), (0.0, 1.0),   # 完全重叠，评分约为0.33
+            (0.0, 5.0),
+        ]
+        
+        with patch.object(self.crawler_service.logger, 'warning') as mock_warning:
+            self.crawler_service._log_waterfall(groups, spans)
+        
+        mock_warning.assert_called_once()
+        self.assertEqual(mock_warning.call_args[0][1], "serial.example.com")
+    
+    def _get_client(self) -> Any:
+        """在新的事件循环中获取异步客户端，获取后立即清除，避免 tearDown 时关闭模拟对象"""
+        async def run() -> Any:
+            return self.crawler_service._get_async_client()
+        
+        try:
+            return asyncio.run(run())
+        finally:
+            self.crawler_service._aio_client = None
+            self.crawler_service._aio_loop = None
+    
+    def test_http2_enabled_uses_httpx(self) -> None:
+        """测试启用 CRAWLER_HTTP2 且安装了 httpx 时创建 HTTP/2 客户端"""
+        mock_aiohttp = self._use_session(_FakeAiohttpSession(lambda method, url: _FakeAiohttpResponse()))
+        
+        with patch('src.services.crawler_service.httpx') as mock_httpx, \
+                patch.object(self.crawler_service.config, 'CRAWLER_HTTP2', True):
+            client = self._get_client()
+        
+        self.assertIs(client, mock_httpx.AsyncClient.return_value)
+        self.assertTrue(mock_httpx.AsyncClient.call_args[1]['http2'])
+        mock_aiohttp.ClientSession.assert_not_called()
+    
+    def test_http2_falls_back_to_aiohttp_without_httpx(self) -> None:
+        """测试启用 CRAWLER_HTTP2 但未安装 httpx 时改用 aiohttp"""
+        session = _FakeAiohttpSession(lambda method, url: _FakeAiohttpResponse())
+        self._use_session(session)
+        
+        with patch('src.services.crawler_service.httpx', None), \
+                patch.object(self.crawler_service.config, 'CRAWLER_HTTP2', True), \
+                patch.object(self.crawler_service.logger, 'warning') as mock_warning:
+            client = self._get_client()
+        
+        self.assertIs(client, session)
+        self.assertIn("未安装httpx", mock_warning.call_args[0][0])
+    
+    def test_http2_falls_back_to_aiohttp_without_h2(self) -> None:
+        """测试启用 CRAWLER_HTTP2 但缺少 h2 包时改用 aiohttp"""
+        session = _FakeAiohttpSession(lambda method, url: _FakeAiohttpResponse())
+        self._use_session(session)
+        
+        with patch('src.services.crawler_service.httpx') as mock_httpx, \
+                patch.object(self.crawler_service.config, 'CRAWLER_HTTP2', True), \
+                patch.object(self.crawler_service.logger, 'warning') as mock_warning:
+            mock_httpx.AsyncClient.side_effect = ImportError("h2 is not installed")
+            client = self._get_client()
+        
+        self.assertIs(client, session)
+        self.assertIn("未安装h2", mock_warning.call_args[0][0])
+    
+    def test_http2_disabled_uses_aiohttp(self) -> None:
+        """测试未启用 CRAWLER_HTTP2 时不创建 httpx 客户端"""
+        session = _FakeAiohttpSession(lambda method, url: _FakeAiohttpResponse())
+        self._use_session(session)
+        
+        with patch('src.services.crawler_service.httpx') as mock_httpx:
+            client = self._get_client()
+        
+        self.assertIs(client, session)
+        mock_httpx.AsyncClient.assert_not_called()
+
+    
+    def test_crawl_address_async_declared_content_length_over_cap(self) -> None:
+        """测试异步响应声明的 Content-Length 超过上限时不读取响应体"""
+        response = _FakeAiohttpResponse(body=_address_body("1 Main St"),
+                                        headers={'Content-Length': '1000000'})
+        session = _FakeAiohttpSession(lambda method, url: response)
+        self._use_session(session)
+        
+        with patch.object(self.crawler_service.config, 'CRAWLER_MAX_BODY', 1024):
+            result = asyncio.run(self.crawler_service.crawl_many(["https://example.com/api/a"]))[0]
+        
+        self.assertEqual(result['status'], 'error')
+        self.assertIn("响应体过大", result['error'])
+        self.assertEqual(response.chunks_read, 0)
+    
+    def test_crawl_address_async_body_exactly_at_cap(self) -> None:
+        """测试异步响应体大小恰好等于上限时正常解析"""
+        body = _address_body("1 Main St")
+        session = _FakeAiohttpSession(
+            lambda method, url: _FakeAiohttpResponse(body=body, chunk_size=7)
+        )
+        self._use_session(session)
+        
+        with patch.object(self.crawler_service.config, 'CRAWLER_MAX_BODY', len(body)):
+            result = asyncio.run(self.crawler_service.crawl_many(["https://example.com/api/a"]))[0]
+        
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['data'].address, "1 Main St")
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -15,6 +15,8 @@ import unittest
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from unittest.mock import patch, MagicMock, Mock
+import threading
+from concurrent.futures import Future
 import time
 
 # 添加项目根目录到Python路径
@@ -22,6 +24,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.app import create_app, db
 from src.scheduler.task_scheduler import TaskScheduler, TaskStatistics, PerformanceMetrics
+from src.models.address_info import AddressInfo
 from src.models.task import Task
 from src.config import get_scheduler_config
 
@@ -118,6 +121,49 @@ class TestTaskStatistics(unittest.TestCase):
         self.assertEqual(stats_dict['success_rate'], 1/3)
 
 
+class TestPerformanceMetrics(unittest.TestCase):
+    """性能指标记录器测试"""
+    
+    def test_concurrent_new_jobs_get_distinct_rows(self) -> None:
+        """测试多个线程同时记录新作业时各自分配到不同的行，各列长度保持一致"""
+        metrics = PerformanceMetrics()
+        thread_count = 32
+        jobs_per_thread = 50
+        barrier = threading.Barrier(thread_count)
+        
+        def record(thread_index: int) -> None:
+            barrier.wait()
+            for i in range(jobs_per_thread):
+                job_id = f"job_{thread_index}_{i}"
+                metrics.record_job_start(job_id)
+                metrics.record_job_end(job_id)
+                # 所有线程都会记录的共享作业
+                metrics.record_job_start("shared_job")
+        
+        original_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=record, args=(n,)) for n in range(thread_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(original_interval)
+        
+        job_count = thread_count * jobs_per_thread + 1
+        self.assertEqual(len(metrics._rows), job_count)
+        self.assertEqual(sorted(metrics._rows.values()), list(range(job_count)))
+        for column in (metrics._start_ns, metrics._count, metrics._total_ns,
+                       metrics._max_ns, metrics._min_ns, metrics._last_ns):
+            self.assertEqual(len(column), job_count)
+        
+        # 每个作业的指标都记录在自己的行上
+        for n in range(thread_count):
+            for i in range(jobs_per_thread):
+                self.assertEqual(metrics.get_job_metrics(f"job_{n}_{i}")['execution_count'], 1)
+
+
 class TestTaskScheduler(unittest.TestCase):
     """任务调度器功能测试"""
     
@@ -368,6 +414,230 @@ class TestTaskScheduler(unittest.TestCase):
         # 这里需要验证日志是否正确记录，可以通过捕获日志输出来验证
         self.assertIsNotNone(job)
 
+    
+    def test_event_drain_counts_on_stop(self) -> None:
+        """测试停止调度器时后台线程处理完缓冲区中的全部事件"""
+        self.scheduler.start()
+        
+        executed = Mock(job_id='job_ok', scheduled_run_time=None)
+        failed = Mock(job_id='job_fail', exception=ValueError("boom"),
+                      traceback="Traceback", scheduled_run_time=None)
+        missed = Mock(job_id='job_missed', scheduled_run_time=datetime.now())
+        
+        # 事件数超过单批处理数量，需要分多批处理
+        success_events = TaskScheduler.EVENT_BATCH_SIZE + 10
+        for _ in range(success_events):
+            self.scheduler._job_executed_listener(executed)
+        for _ in range(3):
+            self.scheduler._job_error_listener(failed)
+        for _ in range(2):
+            self.scheduler._job_missed_listener(missed)
+        
+        self.assertTrue(self.scheduler.stop())
+        
+        statistics = self.scheduler._statistics
+        self.assertEqual(statistics.success_count, success_events)
+        self.assertEqual(statistics.failure_count, 3)
+        self.assertEqual(statistics.skipped_count, 2)
+        self.assertEqual(statistics.total_executions, success_events + 5)
+        self.assertEqual(len(self.scheduler._event_ring), 0)
+        self.assertIsNone(self.scheduler._drain_thread)
+    
+    def test_event_ring_overflow_is_reported(self) -> None:
+        """测试事件缓冲区写满时记录并报告丢弃的事件数"""
+        with patch.object(TaskScheduler, 'EVENT_RING_SIZE', 4):
+            scheduler = TaskScheduler()
+        
+        # 未启动后台线程，事件只在缓冲区中累积
+        executed = Mock(job_id='job_ok', scheduled_run_time=None)
+        for _ in range(10):
+            scheduler._job_executed_listener(executed)
+        
+        self.assertEqual(len(scheduler._event_ring), 4)
+        self.assertEqual(scheduler._dropped_events.value(), 6)
+        
+        with self.assertLogs(scheduler.logger, level='WARNING') as cm:
+            scheduler._process_event_batch()
+        
+        self.assertEqual(scheduler._statistics.success_count, 4)
+        self.assertTrue(any("丢弃了 6 个" in line for line in cm.output))
+        
+        # 已报告的丢弃数不会重复输出
+        scheduler._job_executed_listener(executed)
+        with patch.object(scheduler.logger, 'warning') as mock_warning:
+            scheduler._process_event_batch()
+        mock_warning.assert_not_called()
+
+    
+    def test_cached_statistics_are_copies(self) -> None:
+        """测试缓存期内每次返回独立的统计字典，修改返回值不影响后续调用"""
+        first = self.scheduler.get_statistics()
+        first['success_count'] = 999
+        
+        second = self.scheduler.get_statistics()
+        
+        self.assertIsNot(first, second)
+        self.assertEqual(second['success_count'], 0)
+    
+    def _make_scheduler(self, **overrides: Any) -> TaskScheduler:
+        """基于默认调度器配置创建覆盖了部分配置项的调度器"""
+        config = dict(get_scheduler_config())
+        config.update(overrides)
+        return TaskScheduler(config)
+    
+    def test_history_disabled_keeps_counts_only(self) -> None:
+        """测试关闭执行历史后只维护计数，最近执行记录为空"""
+        scheduler = self._make_scheduler(history_enabled=False)
+        statistics = scheduler._statistics
+        
+        statistics.record_success('job_1', 'test_job')
+        statistics.record_failure('job_2', 'test_job', 'error')
+        statistics.record_skipped('job_3', 'test_job', 'reason')
+        
+        self.assertEqual(statistics.get_recent_executions(5), [])
+        self.assertEqual(statistics.total_executions, 3)
+        self.assertFalse(statistics.get_execution_summary()['history_enabled'])
+    
+    def test_stats_disabled_skips_listener_registration(self) -> None:
+        """测试关闭统计后不注册事件监听器，启动时也不创建事件处理线程"""
+        add_listener = 'src.scheduler.task_scheduler.BackgroundScheduler.add_listener'
+        with patch(add_listener) as mock_add_listener:
+            self._make_scheduler(stats_enabled=True)
+        self.assertEqual(mock_add_listener.call_count, 3)
+        
+        with patch(add_listener) as mock_add_listener:
+            scheduler = self._make_scheduler(stats_enabled=False)
+        mock_add_listener.assert_not_called()
+        
+        scheduler.start()
+        try:
+            self.assertIsNone(scheduler._drain_thread)
+        finally:
+            scheduler.stop()
+
+
+class TestPendingTaskExecution(unittest.TestCase):
+    """待处理任务并发执行测试"""
+    
+    def setUp(self) -> None:
+        """测试前的准备工作"""
+        self.app = create_app('testing')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.scheduler = TaskScheduler()
+    
+    def tearDown(self) -> None:
+        """测试后的清理工作"""
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+    
+    def test_concurrent_execution_commits_progress_and_batches_retries(self) -> None:
+        """测试并发执行时成功任务逐个提交进度，失败任务批量提交重试次数，异常只回滚该任务"""
+        task_count = TaskScheduler.CRAWL_CHUNK_SIZE + 6
+        tasks = [Task(url=f"https://example.com/task/{i}", total_num=1) for i in range(task_count)]
+        db.session.add_all(tasks)
+        db.session.commit()
+        
+        failed_urls = {task.url for i, task in enumerate(tasks) if i % 5 == 0}
+        raising_url = tasks[7].url
+        
+        def crawl_address(url: str, **kwargs) -> Dict[str, Any]:
+            if url in failed_urls:
+                return {'status': 'error', 'error': '爬取失败', 'url': url}
+            return {'status': 'success', 'url': url}
+        
+        def save_crawl_result(result: Dict[str, Any], body: Optional[str] = None) -> Dict[str, Any]:
+            if result['url'] == raising_url:
+                # 保存到一半时出错，未提交的写入应被回滚
+                db.session.add(AddressInfo(address="partial"))
+                db.session.flush()
+                raise RuntimeError("保存失败")
+            return result
+        
+        crawler = Mock()
+        crawler.crawl_address.side_effect = crawl_address
+        crawler.save_crawl_result.side_effect = save_crawl_result
+        
+        with patch.object(self.scheduler, '_get_crawler', return_value=crawler), \
+                patch.object(TaskScheduler, 'BATCH_COMMIT_SIZE', 4), \
+                patch.object(Task, 'bulk_increment_visited',
+                             wraps=Task.bulk_increment_visited) as mock_visited, \
+                patch.object(Task, 'bulk_increment_retry',
+                             wraps=Task.bulk_increment_retry) as mock_retry:
+            executed_count = self.scheduler.execute_pending_tasks()
+        
+        failed_count = len(failed_urls) + 1
+        success_count = task_count - failed_count
+        
+        # 抛出异常的任务不计入已执行数
+        self.assertEqual(executed_count, task_count - 1)
+        self.assertEqual(crawler.crawl_address.call_count, task_count)
+        
+        # 每个成功任务单独提交一次访问计数
+        self.assertEqual(mock_visited.call_count, success_count)
+        for call in mock_visited.call_args_list:
+            self.assertEqual(list(call[0][0].values()), [1])
+        
+        # 失败任务的重试次数按 BATCH_COMMIT_SIZE 分批提交
+        retried_ids = [task_id for call in mock_retry.call_args_list for task_id in call[0][0]]
+        self.assertEqual(len(retried_ids), failed_count)
+        self.assertEqual(mock_retry.call_count, -(-failed_count // 4))
+        
+        db.session.expire_all()
+        for task in tasks:
+            if task.url in failed_urls or task.url == raising_url:
+                self.assertEqual(task.visited_num, 0)
+                self.assertEqual(task.retry_count, 1)
+            else:
+                self.assertEqual(task.visited_num, 1)
+                self.assertEqual(task.retry_count, 0)
+        
+        # 出错任务的未提交写入已回滚
+        self.assertEqual(db.session.query(AddressInfo).count(), 0)
+    
+    def test_completion_report_suppressed_within_interval(self) -> None:
+        """测试距上次报告不足 COMPLETION_REPORT_INTERVAL 秒时不再输出完整统计报告"""
+        interval = TaskScheduler.COMPLETION_REPORT_INTERVAL
+        self.assertTrue(self.scheduler._completion_report_due(1000.0))
+        self.assertFalse(self.scheduler._completion_report_due(1000.0 + 100))
+        self.assertFalse(self.scheduler._completion_report_due(1000.0 + interval))
+        self.assertTrue(self.scheduler._completion_report_due(1000.0 + interval + 1))
+        
+        # 所有任务都已完成时，连续两次扫描只有第一次输出统计报告
+        self.scheduler._last_completion_report_mono = None
+        task = Task(url="https://example.com/done", total_num=1)
+        task.visited_num = 1
+        db.session.add(task)
+        db.session.commit()
+        
+        with patch.object(self.scheduler, 'log_statistics_report') as mock_report:
+            self.assertEqual(self.scheduler.execute_pending_tasks(), 0)
+            self.assertEqual(self.scheduler.execute_pending_tasks(), 0)
+        mock_report.assert_called_once()
+    
+    def test_completion_cache_invalidated_after_visited_commit(self) -> None:
+        """测试提交任务访问计数后完成情况缓存失效，下次统计反映最新进度"""
+        db.session.add(Task(url="https://example.com/pending", total_num=1))
+        db.session.commit()
+        
+        self.assertEqual(self.scheduler._get_completion_counts(), (1, 0))
+        self.assertIsNotNone(self.scheduler._completion_cache)
+        
+        crawler = Mock()
+        crawler.save_crawl_result.return_value = {'status': 'success'}
+        crawl_future: Future = Future()
+        crawl_future.set_result({'status': 'success'})
+        task_row = next(self.scheduler._iter_pending_tasks())
+        
+        success, completed = self.scheduler._run_pending_task(crawler, task_row, crawl_future)
+        
+        self.assertTrue(success)
+        self.assertTrue(completed)
+        self.assertIsNone(self.scheduler._completion_cache)
+        self.assertEqual(self.scheduler._get_completion_counts(), (1, 1))
+
 
 class TestSchedulerIntegration(unittest.TestCase):
     """调度器集成测试"""
@@ -10,6 +10,7 @@ import os
 import unittest
 from datetime import datetime, timedelta
 from typing import Dict, Any
+from sqlalchemy import select, update
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -331,6 +332,72 @@ class TestTaskModel(unittest.TestCase):
         task_none = Task(url="https://example.com/none", body=None)
         self.assertIsNone(task_none.body)
 
+    
+    def test_increment_visited_atomic_update(self) -> None:
+        """测试已持久化任务的访问数量通过原子UPDATE增加"""
+        task = Task(url="https://example.com/atomic")
+        db.session.add(task)
+        db.session.commit()
+        self.assertEqual(task.visited_num, 0)
+        
+        # 模拟其他进程并发修改数据库中的计数，内存中的值不受影响
+        db.session.execute(
+            update(Task).where(Task.id == task.id).values(visited_num=10)
+            .execution_options(synchronize_session=False)
+        )
+        self.assertEqual(task.visited_num, 0)
+        
+        task.increment_visited(2)
+        
+        # 内存中的值同步为本地累加结果，且不会作为脏数据再次写回
+        self.assertEqual(task.visited_num, 2)
+        self.assertNotIn(task, db.session.dirty)
+        
+        db.session.commit()
+        
+        # 数据库中的计数在并发修改的基础上累加，没有被覆盖
+        self.assertEqual(task.visited_num, 12)
+        stored = db.session.execute(
+            select(Task.visited_num).where(Task.id == task.id)
+        ).scalar_one()
+        self.assertEqual(stored, 12)
+    
+    def test_bulk_increment_visited(self) -> None:
+        """测试批量增加访问数量只更新指定的任务"""
+        tasks = [Task(url=f"https://example.com/bulk/{i}") for i in range(3)]
+        db.session.add_all(tasks)
+        db.session.commit()
+        first, second, third = tasks
+        
+        affected = Task.bulk_increment_visited({first.id: 2, second.id: 5})
+        db.session.commit()
+        
+        self.assertEqual(affected, 2)
+        self.assertEqual(first.visited_num, 2)
+        self.assertEqual(second.visited_num, 5)
+        self.assertEqual(third.visited_num, 0)
+        
+        # 空映射不访问数据库
+        self.assertEqual(Task.bulk_increment_visited({}), 0)
+    
+    def test_bulk_increment_retry(self) -> None:
+        """测试批量增加重试次数只更新指定的任务"""
+        tasks = [Task(url=f"https://example.com/retry/{i}") for i in range(3)]
+        db.session.add_all(tasks)
+        db.session.commit()
+        first, second, third = tasks
+        
+        affected = Task.bulk_increment_retry(task_id for task_id in (first.id, third.id))
+        db.session.commit()
+        
+        self.assertEqual(affected, 2)
+        self.assertEqual(first.retry_count, 1)
+        self.assertEqual(second.retry_count, 0)
+        self.assertEqual(third.retry_count, 1)
+        
+        # 空集合不访问数据库
+        self.assertEqual(Task.bulk_increment_retry([]), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file